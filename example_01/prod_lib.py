@@ -13,4 +13,44 @@ def better_name_return(first_name, second_name):
     # Ensure the returned string is at most 15 characters
     if len(formatted) > 15:
         return formatted[:15]
-    return formatted
\ No newline at end of file
+    return formatted
+
+# Truncation policies for names longer than max_length:
+#   "hard"    - plain cut formatted[:max_length] (what better_name_return does)
+#   "trim"    - plain cut, then drop trailing whitespace
+#   "word"    - cut at the last space before the limit, so no word is split
+#   "initial" - shorten the first name to an initial ("Mary-Jane Watson" -> "M. Watson"), then cut
+TRUNCATION_POLICIES = ("hard", "trim", "word", "initial")
+
+
+def truncate_name(formatted, max_length=15, policy="hard"):
+    if len(formatted) <= max_length:
+        return formatted
+    if policy == "hard":
+        return formatted[:max_length]
+    if policy == "trim":
+        return formatted[:max_length].rstrip()
+    if policy == "word":
+        cut = formatted[:max_length]
+        if formatted[max_length].isspace():
+            return cut.rstrip()
+        space = cut.rfind(" ")
+        # a single word longer than the limit can only be cut hard
+        return cut[:space].rstrip() if space > 0 else cut
+    if policy == "initial":
+        first, space, rest = formatted.partition(" ")
+        if space and first:
+            formatted = first[0] + ". " + rest.lstrip()
+        return formatted[:max_length].rstrip()
+    raise ValueError(f"Unknown truncation policy: {policy!r}")
+
+
+# Batch variant of better_name_return with a selectable truncation policy
+def better_names(pairs, max_length=15, policy="hard"):
+    if policy not in TRUNCATION_POLICIES:
+        raise ValueError(f"Unknown truncation policy: {policy!r}")
+    result = []
+    for first_name, second_name in pairs:
+        formatted = (str(first_name).strip() + " " + str(second_name).strip()).strip().title()
+        result.append(truncate_name(formatted, max_length, policy))
+    return result
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from nb_index import load_index
+from nb_loader import load_cells, load_notebook
+from nb_run import NotebookRunner
+
+
+NOTEBOOK_PATH = Path(__file__).with_name("Pokus01.ipynb")
+
+
+@pytest.fixture(scope="session")
+def nb():
+	# Parsed Pokus01.ipynb, loaded once per test session (read-only)
+	return load_notebook(NOTEBOOK_PATH)
+
+
+@pytest.fixture(scope="session")
+def nb_cells():
+	# (cell_type, joined source) per cell of Pokus01.ipynb
+	return load_cells(NOTEBOOK_PATH)
+
+
+@pytest.fixture(scope="session")
+def nb_index():
+	# NotebookIndex of Pokus01.ipynb for one-pass content checks
+	return load_index(NOTEBOOK_PATH)
+
+
+@pytest.fixture(scope="session")
+def nb_outputs():
+	# Results of running the code cells of Pokus01.ipynb once, keyed by cell number
+	return {result["cell"]: result for result in NotebookRunner().run_notebook(NOTEBOOK_PATH)}
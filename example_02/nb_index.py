@@ -0,0 +1,102 @@
+# nb_index.py - precomputed per-cell index and multi-pattern search over a notebook
+
+from collections import deque
+from pathlib import Path
+
+from nb_loader import cache_key, load_cells
+
+
+class PatternMatcher:
+	# Aho-Corasick automaton: finds all of the given patterns in one pass over a text
+
+	def __init__(self, patterns):
+		self.patterns = list(dict.fromkeys(patterns))
+		self._goto = [{}]
+		self._fail = [0]
+		self._out = [[]]
+		for number, pattern in enumerate(self.patterns):
+			if not pattern:
+				raise ValueError("Patterns must not be empty")
+			state = 0
+			for char in pattern:
+				nxt = self._goto[state].get(char)
+				if nxt is None:
+					nxt = len(self._goto)
+					self._goto[state][char] = nxt
+					self._goto.append({})
+					self._fail.append(0)
+					self._out.append([])
+				state = nxt
+			self._out[state].append(number)
+		# Breadth-first pass to set failure links and merge outputs of suffix states
+		queue = deque(self._goto[0].values())
+		while queue:
+			state = queue.popleft()
+			for char, nxt in self._goto[state].items():
+				queue.append(nxt)
+				fail = self._fail[state]
+				while fail and char not in self._goto[fail]:
+					fail = self._fail[fail]
+				self._fail[nxt] = self._goto[fail].get(char, 0)
+				self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+	def find(self, text):
+		# Returns the set of patterns that occur in text
+		goto, fail, out = self._goto, self._fail, self._out
+		found = set()
+		state = 0
+		for char in text:
+			while state and char not in goto[state]:
+				state = fail[state]
+			state = goto[state].get(char, 0)
+			if out[state]:
+				found.update(out[state])
+				if len(found) == len(self.patterns):
+					break
+		return {self.patterns[number] for number in found}
+
+
+class NotebookIndex:
+	# Joined source per cell plus cell indices grouped by cell type
+
+	def __init__(self, cells):
+		self.types = [cell_type for cell_type, _ in cells]
+		self.sources = [source for _, source in cells]
+		self.by_type = {}
+		for number, cell_type in enumerate(self.types):
+			self.by_type.setdefault(cell_type, []).append(number)
+
+	def __len__(self):
+		return len(self.sources)
+
+	def cells_of_type(self, cell_type):
+		return self.by_type.get(cell_type, [])
+
+	def search(self, patterns, cell_type=None):
+		# Maps each pattern to the indices of cells containing it; every cell is scanned once
+		matcher = patterns if isinstance(patterns, PatternMatcher) else PatternMatcher(patterns)
+		hits = {pattern: [] for pattern in matcher.patterns}
+		numbers = range(len(self.sources)) if cell_type is None else self.cells_of_type(cell_type)
+		for number in numbers:
+			for pattern in matcher.find(self.sources[number]):
+				hits[pattern].append(number)
+		return hits
+
+	def contains(self, pattern, cell_type=None):
+		return bool(self.search([pattern], cell_type)[pattern])
+
+
+# resolved path -> (cache key, NotebookIndex); one entry per path, replaced when the file changes
+_indexes = {}
+
+
+def load_index(path):
+	# NotebookIndex for a notebook file, built once per (path, mtime, size)
+	path = Path(path)
+	key = cache_key(path)
+	cached = _indexes.get(key[0])
+	if cached is not None and cached[0] == key:
+		return cached[1]
+	index = NotebookIndex(load_cells(path))
+	_indexes[key[0]] = (key, index)
+	return index
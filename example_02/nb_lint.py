@@ -0,0 +1,173 @@
+#!/usr/bin/python3
+# nb_lint.py - apply the example_02 notebook policy to every notebook under the given paths
+#
+# Usage: python nb_lint.py [paths ...] [--jobs N] [--cache FILE | --no-cache] [--output report.json]
+#
+# Results are cached per file by (mtime, size) and content hash, so a re-run over an
+# unchanged tree only stats the files. Changed files are hashed and validated in a process pool.
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from nb_stream import DEFAULT_FORBIDDEN, NotebookPolicy, validate_file
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE = ".nb_lint_cache.json"
+
+
+def discover(paths):
+	# All .ipynb files under the given files/directories, without Jupyter checkpoint copies
+	found = set()
+	for path in map(Path, paths):
+		if path.is_file():
+			found.add(path)
+		elif path.is_dir():
+			for nb_path in path.rglob("*.ipynb"):
+				# a directory can be named *.ipynb too
+				if ".ipynb_checkpoints" not in nb_path.parts and nb_path.is_file():
+					found.add(nb_path)
+	return sorted(found)
+
+
+def file_hash(path):
+	digest = hashlib.sha256()
+	with open(path, "rb") as stream:
+		for block in iter(lambda: stream.read(1024 * 1024), b""):
+			digest.update(block)
+	return digest.hexdigest()
+
+
+def unreadable(error):
+	# Failed result for a notebook that cannot be read (deleted meanwhile, no permission, ...)
+	return {"cells": 0, "ok": False, "errors": [f"cannot read notebook: {error}"]}
+
+
+def check_notebook(path, known_hash, forbidden):
+	# Runs in a worker: returns (content hash, result), or (hash, None) when the content is unchanged.
+	# An unreadable file gives (None, failed result), so one bad file never aborts the whole run.
+	try:
+		sha = file_hash(path)
+		if sha == known_hash:
+			return sha, None
+		return sha, validate_file(path, NotebookPolicy(forbidden=forbidden))
+	except OSError as error:
+		return None, unreadable(error)
+
+
+def load_cache(path, fingerprint):
+	# A cache of the wrong shape (edited by hand, written by another tool) counts as a miss, as do single bad entries
+	try:
+		cache = json.loads(Path(path).read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		return {}
+	if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION or cache.get("policy") != fingerprint:
+		return {}
+	files = cache.get("files")
+	if not isinstance(files, dict):
+		return {}
+	return {key: entry for key, entry in files.items() if _valid_entry(entry)}
+
+
+def _valid_entry(entry):
+	return (isinstance(entry, dict) and isinstance(entry.get("mtime_ns"), int) and isinstance(entry.get("size"), int)
+			and isinstance(entry.get("sha256"), str) and isinstance(entry.get("result"), dict))
+
+
+def save_cache(path, fingerprint, files):
+	tmp = Path(f"{path}.tmp")
+	tmp.write_text(json.dumps({"version": CACHE_VERSION, "policy": fingerprint, "files": files}), encoding="utf-8")
+	os.replace(tmp, path)
+
+
+def _under(key, roots):
+	# True when the cached file lies in one of the scanned paths
+	path = Path(key)
+	return any(path == root or root in path.parents for root in roots)
+
+
+def lint(paths, forbidden=DEFAULT_FORBIDDEN, jobs=None, cache_path=DEFAULT_CACHE):
+	# Returns the report dict; cache_path=None disables the result cache
+	forbidden = tuple(forbidden)
+	fingerprint = list(forbidden)
+	cached = load_cache(cache_path, fingerprint) if cache_path else {}
+	files = {}
+	results = {}
+	to_check = []
+	for nb_path in discover(paths):
+		key = str(nb_path)
+		try:
+			stat = nb_path.stat()
+		except OSError as error:
+			results[key] = dict(unreadable(error), cached=False)
+			continue
+		entry = cached.get(key)
+		if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+			files[key] = entry
+			results[key] = dict(entry["result"], cached=True)
+		else:
+			to_check.append((key, stat, entry["sha256"] if entry else None))
+
+	def finish(item, sha, result):
+		key, stat, _ = item
+		if result is None:  # content unchanged, only the mtime moved
+			result = cached[key]["result"]
+			results[key] = dict(result, cached=True)
+		else:
+			results[key] = dict(result, cached=False)
+		if sha is not None:  # unreadable files are not cached, so the next run tries them again
+			files[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha, "result": result}
+
+	if jobs == 1 or len(to_check) < 2:
+		for item in to_check:
+			finish(item, *check_notebook(item[0], item[2], forbidden))
+	else:
+		from concurrent.futures import ProcessPoolExecutor  # imported lazily: pulls in multiprocessing
+		workers = jobs or os.cpu_count() or 1
+		chunksize = max(1, len(to_check) // (4 * workers))
+		with ProcessPoolExecutor(max_workers=workers) as pool:
+			outcomes = pool.map(check_notebook, [item[0] for item in to_check], [item[2] for item in to_check],
+								[forbidden] * len(to_check), chunksize=chunksize)
+			for item, (sha, result) in zip(to_check, outcomes):
+				finish(item, sha, result)
+
+	if cache_path:
+		# entries of files outside the scanned paths are kept, so linting another set of paths does not
+		# throw them away; inside the scanned paths only what was found this run (deleted files drop out)
+		roots = [Path(path) for path in paths]
+		kept = {key: entry for key, entry in cached.items() if not _under(key, roots)}
+		save_cache(cache_path, fingerprint, dict(kept, **files))
+	report = [dict(results[key], path=key) for key in sorted(results)]
+	return {
+		"notebooks": len(report),
+		"failed": sum(not result["ok"] for result in report),
+		"cached": sum(result["cached"] for result in report),
+		"results": report,
+	}
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Check notebooks against the example_02 policy")
+	parser.add_argument("paths", nargs="*", default=["."], help="notebooks or directories to scan")
+	parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+	parser.add_argument("--cache", default=DEFAULT_CACHE, help="result cache file")
+	parser.add_argument("--no-cache", action="store_true", help="do not read or write the result cache")
+	parser.add_argument("--forbid", action="append", default=[], help="additional forbidden text (repeatable)")
+	parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+	args = parser.parse_args(argv)
+
+	report = lint(args.paths, DEFAULT_FORBIDDEN + tuple(args.forbid), args.jobs, None if args.no_cache else args.cache)
+	text = json.dumps(report, ensure_ascii=False, indent=2)
+	if args.output:
+		Path(args.output).write_text(text, encoding="utf-8")
+	else:
+		print(text)
+	return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
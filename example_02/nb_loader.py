@@ -0,0 +1,104 @@
+# nb_loader.py - shared, parse-once notebook loading for the notebook tests
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+# Environment variable pointing to a directory for the optional on-disk cache
+CACHE_DIR_ENV = "NB_CACHE_DIR"
+
+# Parsed notebooks and cell indexes: resolved path -> (cache key, value). One entry per path,
+# so a notebook rewritten many times in a long session replaces its stale entry instead of adding one
+_notebooks = {}
+_cells = {}
+
+
+def cache_key(path):
+	path = Path(path)
+	stat = path.stat()
+	return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def load_notebook(path):
+	# Returns the parsed notebook; the same dict is shared by all callers, so treat it as read-only
+	path = Path(path)
+	if not path.exists():
+		raise FileNotFoundError(f"Notebook not found: {path}")
+	key = cache_key(path)
+	cached = _notebooks.get(key[0])
+	if cached is not None and cached[0] == key:
+		return cached[1]
+	nb = json.loads(path.read_text(encoding="utf-8"))
+	_notebooks[key[0]] = (key, nb)
+	return nb
+
+
+def load_cells(path):
+	# Returns a tuple of (cell_type, joined source) per cell.
+	# Looked up in memory first, then in the on-disk cache (if NB_CACHE_DIR is set), then parsed.
+	path = Path(path)
+	if not path.exists():
+		raise FileNotFoundError(f"Notebook not found: {path}")
+	key = cache_key(path)
+	cached = _cells.get(key[0])
+	if cached is not None and cached[0] == key:
+		return cached[1]
+	disk_file = _disk_cache_file(key)
+	cells = None
+	if disk_file is not None and disk_file.exists():
+		cells = _read_disk_cache(disk_file)
+	if cells is None:
+		nb = load_notebook(path)
+		cells = tuple((cell.get("cell_type"), "".join(cell.get("source", []))) for cell in nb.get("cells", []))
+		if disk_file is not None:
+			_write_disk_cache(disk_file, cells)
+	_cells[key[0]] = (key, cells)
+	return cells
+
+
+def clear_cache():
+	_notebooks.clear()
+	_cells.clear()
+
+
+def _disk_cache_file(key):
+	cache_dir = os.environ.get(CACHE_DIR_ENV)
+	if not cache_dir:
+		return None
+	digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+	return Path(cache_dir) / f"{digest}.cells.json"
+
+
+def _write_disk_cache(disk_file, cells):
+	# The cache is optional: a failed write never fails the load. Every writer gets its own temp
+	# file, so processes sharing the directory cannot move each other's file away
+	tmp = None
+	try:
+		disk_file.parent.mkdir(parents=True, exist_ok=True)
+		with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=disk_file.parent,
+				prefix=disk_file.name, suffix=".tmp", delete=False) as stream:
+			tmp = stream.name
+			json.dump(cells, stream)
+		os.replace(tmp, disk_file)
+	except OSError:
+		if tmp is not None:
+			try:
+				os.unlink(tmp)
+			except OSError:
+				pass
+
+
+def _read_disk_cache(disk_file):
+	# The cache directory may be shared, so its files are plain JSON (never unpickled) and
+	# anything unreadable or not shaped like [[cell_type, source], ...] counts as a miss
+	try:
+		data = json.loads(disk_file.read_text(encoding="utf-8"))
+		cells = tuple((cell_type, source) for cell_type, source in data)
+	except (OSError, ValueError, TypeError):
+		return None
+	if not isinstance(data, list) or not all((cell_type is None or isinstance(cell_type, str)) and isinstance(source, str) for cell_type, source in cells):
+		return None
+	return cells
@@ -0,0 +1,78 @@
+# nb_run.py - run notebook code cells in-process and capture their output
+#
+# Cells run with exec() in a namespace that is kept between cells and can be reused between
+# notebooks, so no kernel has to be started. IPython "!command" lines are handed to a shell
+# callable (a local subprocess by default) whose output is printed like in Jupyter.
+
+import io
+import subprocess
+import time
+import traceback
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from nb_loader import load_cells
+
+
+def run_shell(command):
+	# Default stand-in for "!command": run it in a local shell and return its output
+	completed = subprocess.run(command, shell=True, capture_output=True, text=True)
+	return completed.stdout + completed.stderr
+
+
+def translate_shell_lines(source):
+	# Turns "!command" lines into calls of __nb_shell__, keeping their indentation
+	lines = []
+	for line in source.splitlines():
+		stripped = line.lstrip()
+		if stripped.startswith("!"):
+			indent = line[:len(line) - len(stripped)]
+			line = f"{indent}__nb_shell__({stripped[1:]!r})"
+		lines.append(line)
+	return "\n".join(lines)
+
+
+class NotebookRunner:
+	def __init__(self, shell=run_shell):
+		self.shell = shell
+		self.namespace = {}
+		self.reset()
+
+	def reset(self):
+		# Start again with an empty namespace (as after a kernel restart)
+		self.namespace.clear()
+		self.namespace.update({"__name__": "__main__", "__nb_shell__": self._shell_line})
+
+	def _shell_line(self, command):
+		print(self.shell(command), end="")
+
+	def run_cells(self, cells, stop_on_error=True):
+		# Runs the code cells of (cell_type, source) pairs; returns one result dict per code cell
+		results = []
+		for number, (cell_type, source) in enumerate(cells):
+			if cell_type != "code":
+				continue
+			stdout = io.StringIO()
+			error = None
+			start = time.perf_counter()
+			try:
+				code = compile(translate_shell_lines(source), f"<cell {number}>", "exec")
+				with redirect_stdout(stdout):
+					exec(code, self.namespace)
+			except Exception:
+				error = traceback.format_exc()
+			results.append({
+				"cell": number,
+				"stdout": stdout.getvalue(),
+				"seconds": time.perf_counter() - start,
+				"error": error,
+			})
+			if error and stop_on_error:
+				break
+		return results
+
+	def run_notebook(self, path, fresh=True, stop_on_error=True):
+		# Runs all code cells of a notebook file; fresh=False keeps the namespace of earlier runs
+		if fresh:
+			self.reset()
+		return self.run_cells(load_cells(Path(path)), stop_on_error)
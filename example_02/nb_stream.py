@@ -0,0 +1,258 @@
+# nb_stream.py - streaming validation of .ipynb files without loading them whole
+#
+# The notebook is read in chunks by a small pull parser. Only cell types and sources are
+# materialized; outputs, attachments and metadata are skipped character by character,
+# so memory stays bounded by the chunk size and the largest cell source.
+
+import json
+import re
+
+from nb_index import PatternMatcher
+
+
+CHUNK_SIZE = 64 * 1024
+
+# Forbidden tokens from test_no_cells_contain_forbidden_text
+DEFAULT_FORBIDDEN = ("rm -rf", "import os.system", "subprocess.call")
+
+_WHITESPACE = " \t\r\n"
+_SCALAR_END = _WHITESPACE + ",]}"
+_STRING_SPECIAL = re.compile(r'["\\]')
+_CONTAINER_SPECIAL = re.compile(r'[\[\]{}"]')
+
+
+class StreamReader:
+	# Pull parser over a text stream; values are either read or skipped by the caller
+
+	def __init__(self, stream, chunk_size=CHUNK_SIZE):
+		self._stream = stream
+		self._chunk_size = chunk_size
+		self._buf = ""
+		self._pos = 0
+
+	def _fill(self):
+		# Drops the consumed part of the buffer and appends the next chunk; False at end of stream
+		chunk = self._stream.read(self._chunk_size)
+		self._buf = self._buf[self._pos:] + chunk
+		self._pos = 0
+		return bool(chunk)
+
+	def peek(self):
+		# Next non-whitespace character without consuming it ("" at end of stream)
+		while True:
+			buf, pos = self._buf, self._pos
+			while pos < len(buf) and buf[pos] in _WHITESPACE:
+				pos += 1
+			self._pos = pos
+			if pos < len(buf):
+				return buf[pos]
+			if not self._fill():
+				return ""
+
+	def expect(self, char):
+		found = self.peek()
+		if found != char:
+			raise ValueError(f"Expected {char!r}, found {found or 'end of file'!r}")
+		self._pos += 1
+
+	def _string_chunks(self):
+		# Yields raw (still escaped) pieces of a string; the opening quote must already be consumed
+		while True:
+			match = _STRING_SPECIAL.search(self._buf, self._pos)
+			if match is None:
+				piece = self._buf[self._pos:]
+				self._pos = len(self._buf)
+				yield piece
+				if not self._fill():
+					raise ValueError("Unterminated string")
+				continue
+			end = match.start()
+			if self._buf[end] == '"':
+				yield self._buf[self._pos:end]
+				self._pos = end + 1
+				return
+			# backslash escape: keep it in one piece with the escaped character (\uXXXX is 6 chars)
+			yield self._buf[self._pos:end]
+			self._pos = end
+			while len(self._buf) - self._pos < 6 and self._fill():
+				pass
+			length = 6 if self._buf[self._pos + 1:self._pos + 2] == "u" else 2
+			if len(self._buf) - self._pos < length:
+				raise ValueError("Unterminated escape sequence")
+			yield self._buf[self._pos:self._pos + length]
+			self._pos += length
+
+	def read_string(self):
+		self.expect('"')
+		return json.loads('"' + "".join(self._string_chunks()) + '"')
+
+	def skip_string(self):
+		self.expect('"')
+		for _ in self._string_chunks():
+			pass
+
+	def skip_value(self):
+		char = self.peek()
+		if char == '"':
+			self.skip_string()
+		elif char in "[{":
+			self._pos += 1
+			depth = 1
+			while depth:
+				match = _CONTAINER_SPECIAL.search(self._buf, self._pos)
+				if match is None:
+					self._pos = len(self._buf)
+					if not self._fill():
+						raise ValueError("Unterminated container")
+					continue
+				self._pos = match.start()
+				char = self._buf[self._pos]
+				if char == '"':
+					self.skip_string()
+				else:
+					depth += 1 if char in "[{" else -1
+					self._pos += 1
+		elif char:
+			self._read_scalar()
+		else:
+			raise ValueError("Unexpected end of file")
+
+	def _read_scalar(self):
+		# number, true, false or null
+		while True:
+			end = self._pos
+			while end < len(self._buf) and self._buf[end] not in _SCALAR_END:
+				end += 1
+			if end < len(self._buf) or not self._fill():
+				break
+		token = self._buf[self._pos:end]
+		self._pos = end
+		return json.loads(token)
+
+	def iter_array(self):
+		# Yields once per element; the caller must read or skip the element each time
+		self.expect("[")
+		if self.peek() == "]":
+			self._pos += 1
+			return
+		while True:
+			yield
+			char = self.peek()
+			self._pos += 1
+			if char == "]":
+				return
+			if char != ",":
+				raise ValueError(f"Expected ',' or ']', found {char or 'end of file'!r}")
+
+	def iter_object(self):
+		# Yields the keys of an object; the caller must read or skip each value
+		self.expect("{")
+		if self.peek() == "}":
+			self._pos += 1
+			return
+		while True:
+			key = self.read_string()
+			self.expect(":")
+			yield key
+			char = self.peek()
+			self._pos += 1
+			if char == "}":
+				return
+			if char != ",":
+				raise ValueError(f"Expected ',' or '}}', found {char or 'end of file'!r}")
+
+
+class NotebookPolicy:
+	# Checks applied to every notebook, modelled on test_jupyter_Pokus01.py
+
+	def __init__(self, min_cells=0, cell_types=(), required=(), forbidden=DEFAULT_FORBIDDEN):
+		self.min_cells = min_cells
+		self.cell_types = list(cell_types)  # expected types of the leading cells, in order
+		self.required = list(required)  # (cell_type or None, text) that some cell must contain
+		self.forbidden = list(forbidden)  # text no cell may contain
+		texts = [text for _, text in self.required] + self.forbidden
+		self.matcher = PatternMatcher(texts) if texts else None
+
+
+# The expectations test_jupyter_Pokus01.py has for Pokus01.ipynb
+POKUS01_POLICY = NotebookPolicy(
+	min_cells=6,
+	cell_types=["markdown", "code", "markdown", "code"],
+	required=[
+		("markdown", "Jupyter Notebook"),
+		("code", 'msg1 = "Hello, World!"'),
+		("markdown", "Toto je další zpráva"),
+		("code", 'msg2 = "Hello, Earth!"'),
+		("markdown", "**Zobrazení zprávy pomocí Bash příkazu"),
+		("code", 'echo "Message from Bash Shell!"'),
+	],
+)
+
+
+def _read_source(reader):
+	# Cell source is either a list of lines or a single string
+	if reader.peek() == '"':
+		return reader.read_string()
+	parts = []
+	for _ in reader.iter_array():
+		parts.append(reader.read_string())
+	return "".join(parts)
+
+
+def _read_cell(reader):
+	cell_type = None
+	source = ""
+	for key in reader.iter_object():
+		if key == "cell_type":
+			cell_type = reader.read_string()
+		elif key == "source":
+			source = _read_source(reader)
+		else:
+			reader.skip_value()  # outputs, attachments, metadata, ...
+	return cell_type, source
+
+
+def iter_cells(stream, chunk_size=CHUNK_SIZE):
+	# Yields (cell_type, source) for every cell of a notebook read from a text stream
+	reader = StreamReader(stream, chunk_size)
+	for key in reader.iter_object():
+		if key == "cells":
+			for _ in reader.iter_array():
+				yield _read_cell(reader)
+		else:
+			reader.skip_value()
+	if reader.peek():
+		raise ValueError("Trailing data after notebook")
+
+
+def validate_stream(stream, policy=POKUS01_POLICY, chunk_size=CHUNK_SIZE):
+	# Returns {"cells": count, "ok": bool, "errors": [...]} for a notebook read from a text stream
+	errors = []
+	count = 0
+	satisfied = set()
+	try:
+		for number, (cell_type, source) in enumerate(iter_cells(stream, chunk_size)):
+			count += 1
+			if number < len(policy.cell_types) and cell_type != policy.cell_types[number]:
+				errors.append(f"cell {number}: expected {policy.cell_types[number]}, found {cell_type}")
+			found = policy.matcher.find(source) if policy.matcher else ()
+			for token in policy.forbidden:
+				if token in found:
+					errors.append(f"cell {number}: contains forbidden text {token!r}")
+			for required in policy.required:
+				if required[1] in found and required[0] in (None, cell_type):
+					satisfied.add(required)
+	except ValueError as error:
+		errors.append(f"invalid notebook JSON: {error}")
+		return {"cells": count, "ok": False, "errors": errors}
+	if count < policy.min_cells:
+		errors.append(f"expected at least {policy.min_cells} cells, found {count}")
+	for required in policy.required:
+		if required not in satisfied:
+			errors.append(f"no {required[0] or 'cell'} cell contains {required[1]!r}")
+	return {"cells": count, "ok": not errors, "errors": errors}
+
+
+def validate_file(path, policy=POKUS01_POLICY, chunk_size=CHUNK_SIZE):
+	with open(path, encoding="utf-8") as stream:
+		return validate_stream(stream, policy, chunk_size)
@@ -1,34 +1,20 @@
-import json
-from pathlib import Path
+# Notebook fixtures (nb, nb_cells) come from conftest.py and are parsed once per session
 
 
-NOTEBOOK_PATH = Path(__file__).with_name("Pokus01.ipynb")
-
-
-def load_notebook(path: Path):
-	assert path.exists(), f"Notebook not found: {path}"
-	text = path.read_text(encoding="utf-8")
-	# Notebook may be JSON; parse it
-	return json.loads(text)
-
-
-def test_notebook_has_expected_number_of_cells():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_notebook_has_expected_number_of_cells(nb):
 	assert "cells" in nb
 	# Based on the provided notebook, expect at least 6 cells
 	assert len(nb["cells"]) >= 6
 
 
-def test_first_cell_is_markdown_title():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_first_cell_is_markdown_title(nb):
 	first = nb["cells"][0]
 	assert first.get("cell_type") == "markdown"
 	source = "".join(first.get("source", []))
 	assert "Jupyter Notebook" in source
 
 
-def test_second_cell_contains_hello_world_print():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_second_cell_contains_hello_world_print(nb):
 	second = nb["cells"][1]
 	assert second.get("cell_type") == "code"
 	src = "\n".join(second.get("source", []))
@@ -36,16 +22,14 @@ def test_second_cell_contains_hello_world_print():
 	assert "print(msg1)" in src
 
 
-def test_third_cell_markdown_contains_message():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_third_cell_markdown_contains_message(nb):
 	third = nb["cells"][2]
 	assert third.get("cell_type") == "markdown"
 	source = "".join(third.get("source", []))
 	assert "Toto je další zpráva" in source
 
 
-def test_fourth_cell_contains_hello_earth():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_fourth_cell_contains_hello_earth(nb):
 	fourth = nb["cells"][3]
 	assert fourth.get("cell_type") == "code"
 	src = "\n".join(fourth.get("source", []))
@@ -53,36 +37,33 @@ def test_fourth_cell_contains_hello_earth():
 	assert "print(msg2)" in src
 
 
-def test_markdown_before_bash_is_bold():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_markdown_before_bash_is_bold(nb_index):
 	# find a markdown cell that contains the bold label
-	found = False
-	for cell in nb["cells"]:
-		if cell.get("cell_type") == "markdown":
-			text = "".join(cell.get("source", []))
-			if "Zobrazení zprávy pomocí Bash příkazu" in text:
-				found = True
-				assert "**" in text or text.strip().startswith("**")
-	assert found, "Expected markdown label before bash cell not found"
-
-
-def test_bash_cell_uses_echo():
-	nb = load_notebook(NOTEBOOK_PATH)
+	label = "Zobrazení zprávy pomocí Bash příkazu"
+	hits = nb_index.search([label, "**"], cell_type="markdown")
+	assert hits[label], "Expected markdown label before bash cell not found"
+	for number in hits[label]:
+		assert number in hits["**"]
+
+
+def test_bash_cell_uses_echo(nb_index):
 	# find a code cell that contains echo or !echo
-	found = False
-	for cell in nb["cells"]:
-		if cell.get("cell_type") == "code":
-			src = "\n".join(cell.get("source", []))
-			if 'echo "Message from Bash Shell!"' in src or '!echo "Message from Bash Shell!"' in src:
-				found = True
-	assert found, "Bash echo command not found in any code cell"
+	hits = nb_index.search(['echo "Message from Bash Shell!"', '!echo "Message from Bash Shell!"'], cell_type="code")
+	assert any(hits.values()), "Bash echo command not found in any code cell"
 
 
-def test_no_cells_contain_forbidden_text():
-	nb = load_notebook(NOTEBOOK_PATH)
+def test_no_cells_contain_forbidden_text(nb_index):
 	forbidden = ["rm -rf", "import os.system", "subprocess.call"]
-	for cell in nb["cells"]:
-		src = "".join(cell.get("source", []))
-		for token in forbidden:
-			assert token not in src
+	hits = nb_index.search(forbidden)
+	for token in forbidden:
+		assert not hits[token], f"{token!r} found in cells {hits[token]}"
+
+
+def test_code_cells_print_their_messages(nb_outputs):
+	assert nb_outputs[1]["stdout"] == "Hello, World!\n"
+	assert nb_outputs[3]["stdout"] == "Hello, Earth!\n"
+
 
+def test_bash_cell_outputs_message(nb_outputs):
+	assert nb_outputs[5]["stdout"] == "Message from Bash Shell!\n"
+	assert all(result["error"] is None for result in nb_outputs.values())
@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+import nb_index
+from nb_index import NotebookIndex, PatternMatcher, load_index
+
+
+def test_matcher_finds_overlapping_patterns():
+	matcher = PatternMatcher(["he", "she", "his", "hers"])
+	assert matcher.find("ushers") == {"she", "he", "hers"}
+	assert matcher.find("this") == {"his"}
+	assert matcher.find("xyz") == set()
+
+
+def test_matcher_handles_unicode_and_duplicates():
+	matcher = PatternMatcher(["příkaz", "příkaz", "kaz"])
+	assert matcher.patterns == ["příkaz", "kaz"]
+	assert matcher.find("Bash příkazu") == {"příkaz", "kaz"}
+
+
+def test_matcher_rejects_empty_pattern():
+	with pytest.raises(ValueError):
+		PatternMatcher(["ok", ""])
+
+
+def test_index_groups_cells_by_type():
+	index = NotebookIndex([("markdown", "# T"), ("code", "print(1)"), ("code", "!ls")])
+	assert len(index) == 3
+	assert index.cells_of_type("code") == [1, 2]
+	assert index.cells_of_type("raw") == []
+
+
+def test_search_reports_cells_per_pattern():
+	index = NotebookIndex([("markdown", "print here"), ("code", "print(1)"), ("code", "!rm -rf /")])
+	assert index.search(["print", "rm -rf", "missing"]) == {"print": [0, 1], "rm -rf": [2], "missing": []}
+	assert index.search(["print"], cell_type="code") == {"print": [1]}
+	assert index.contains("rm -rf", cell_type="code")
+	assert not index.contains("rm -rf", cell_type="markdown")
+
+
+def test_nb_index_fixture_matches_notebook(nb_index, nb):
+	assert len(nb_index) == len(nb["cells"])
+	assert nb_index.cells_of_type("code") == [1, 3, 5]
+
+
+def test_load_index_keeps_one_entry_per_notebook(tmp_path):
+	path = tmp_path / "nb.ipynb"
+	entries = None
+	for version in range(4):
+		cells = [{"cell_type": "code", "source": [f"print({version})"], "outputs": []}]
+		path.write_text(json.dumps({"cells": cells}), encoding="utf-8")
+		stat = path.stat()
+		os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + version * 1_000_000))
+		index = load_index(path)
+		assert index.sources == [f"print({version})"]
+		assert load_index(path) is index
+		entries = entries or len(nb_index._indexes)
+	assert len(nb_index._indexes) == entries
@@ -0,0 +1,148 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import nb_lint
+
+
+NOTEBOOK_PATH = Path(__file__).with_name("Pokus01.ipynb")
+
+
+def make_tree(root):
+	(root / "a").mkdir()
+	(root / "a" / ".ipynb_checkpoints").mkdir()
+	shutil.copy(NOTEBOOK_PATH, root / "a" / "good.ipynb")
+	shutil.copy(NOTEBOOK_PATH, root / "a" / ".ipynb_checkpoints" / "good-checkpoint.ipynb")
+	bad = {"cells": [{"cell_type": "code", "source": ["import subprocess\n", "subprocess.call(['ls'])"]}]}
+	(root / "bad.ipynb").write_text(json.dumps(bad), encoding="utf-8")
+	(root / "notes.txt").write_text("rm -rf", encoding="utf-8")
+
+
+def test_discover_skips_checkpoints(tmp_path):
+	make_tree(tmp_path)
+	assert nb_lint.discover([tmp_path]) == [tmp_path / "a" / "good.ipynb", tmp_path / "bad.ipynb"]
+
+
+def test_discover_skips_directories_named_like_notebooks(tmp_path):
+	make_tree(tmp_path)
+	(tmp_path / "folder.ipynb").mkdir()
+	assert tmp_path / "folder.ipynb" not in nb_lint.discover([tmp_path])
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=None)["notebooks"] == 2
+
+
+def test_unreadable_notebooks_fail_alone(tmp_path, monkeypatch):
+	make_tree(tmp_path)
+	gone = tmp_path / "gone.ipynb"  # deleted between discovery and checking
+	locked = tmp_path / "locked.ipynb"
+	shutil.copy(NOTEBOOK_PATH, locked)
+	discover = nb_lint.discover
+	monkeypatch.setattr(nb_lint, "discover", lambda paths: discover(paths) + [gone])
+	file_hash = nb_lint.file_hash
+
+	def denied(path):
+		if Path(path) == locked:
+			raise PermissionError(13, "Permission denied", str(path))
+		return file_hash(path)
+
+	monkeypatch.setattr(nb_lint, "file_hash", denied)
+	cache = tmp_path / "cache.json"
+	report = nb_lint.lint([tmp_path], jobs=1, cache_path=cache)
+	assert report["notebooks"] == 4 and report["failed"] == 3
+	results = {Path(r["path"]).name: r for r in report["results"]}
+	assert results["good.ipynb"]["ok"]
+	assert "cannot read notebook" in results["gone.ipynb"]["errors"][0]
+	assert "Permission denied" in results["locked.ipynb"]["errors"][0]
+	assert str(locked) not in json.loads(cache.read_text(encoding="utf-8"))["files"]
+
+
+def test_unreadable_notebook_in_process_pool(tmp_path, monkeypatch):
+	make_tree(tmp_path)
+	discover = nb_lint.discover
+	monkeypatch.setattr(nb_lint, "discover", lambda paths: discover(paths) + [tmp_path / "gone.ipynb"])
+	monkeypatch.setattr(Path, "stat", lambda self, **kwargs: os.stat(NOTEBOOK_PATH if self.name == "gone.ipynb" else self))
+	report = nb_lint.lint([tmp_path], jobs=2, cache_path=None)
+	assert report["notebooks"] == 3 and report["failed"] == 2
+	gone = next(r for r in report["results"] if r["path"].endswith("gone.ipynb"))
+	assert "cannot read notebook" in gone["errors"][0]
+
+
+def test_lint_reports_failures(tmp_path):
+	make_tree(tmp_path)
+	report = nb_lint.lint([tmp_path], jobs=1, cache_path=None)
+	assert report["notebooks"] == 2
+	assert report["failed"] == 1
+	bad = next(r for r in report["results"] if r["path"].endswith("bad.ipynb"))
+	assert "subprocess.call" in bad["errors"][0]
+
+
+def test_warm_run_uses_cache(tmp_path, monkeypatch):
+	make_tree(tmp_path)
+	cache = tmp_path / "cache.json"
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=cache)["cached"] == 0
+
+	monkeypatch.setattr(nb_lint, "validate_file", lambda *a, **k: (_ for _ in ()).throw(AssertionError("revalidated")))
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=cache)["cached"] == 2
+
+	# touching a file changes its mtime but not its content hash
+	good = tmp_path / "a" / "good.ipynb"
+	stat = good.stat()
+	os.utime(good, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=cache)["cached"] == 2
+
+
+def test_changed_policy_invalidates_cache(tmp_path):
+	make_tree(tmp_path)
+	cache = tmp_path / "cache.json"
+	nb_lint.lint([tmp_path], jobs=1, cache_path=cache)
+	report = nb_lint.lint([tmp_path], forbidden=["print("], jobs=1, cache_path=cache)
+	assert report["cached"] == 0
+	assert report["failed"] == 1
+
+
+@pytest.mark.parametrize("content", [
+	[], "x", {"version": nb_lint.CACHE_VERSION, "policy": list(nb_lint.DEFAULT_FORBIDDEN), "files": []},
+])
+def test_cache_of_wrong_shape_is_a_miss(tmp_path, content):
+	make_tree(tmp_path)
+	cache = tmp_path / "cache.json"
+	cache.write_text(json.dumps(content), encoding="utf-8")
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=cache)["cached"] == 0
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=cache)["cached"] == 2
+
+
+def test_bad_cache_entries_are_misses(tmp_path):
+	make_tree(tmp_path)
+	cache = tmp_path / "cache.json"
+	nb_lint.lint([tmp_path], jobs=1, cache_path=cache)
+	data = json.loads(cache.read_text(encoding="utf-8"))
+	good, bad = str(tmp_path / "a" / "good.ipynb"), str(tmp_path / "bad.ipynb")
+	data["files"][good] = ["not", "a", "dict"]
+	del data["files"][bad]["mtime_ns"]
+	cache.write_text(json.dumps(data), encoding="utf-8")
+	report = nb_lint.lint([tmp_path], jobs=1, cache_path=cache)
+	assert report["notebooks"] == 2 and report["cached"] == 0
+
+
+def test_linting_other_paths_keeps_their_cache_entries(tmp_path):
+	make_tree(tmp_path)
+	cache = tmp_path / "cache.json"
+	nb_lint.lint([tmp_path / "a"], jobs=1, cache_path=cache)
+	nb_lint.lint([tmp_path / "bad.ipynb"], jobs=1, cache_path=cache)
+	assert nb_lint.lint([tmp_path], jobs=1, cache_path=cache)["cached"] == 2
+
+	# files deleted from a scanned path drop out of the cache
+	(tmp_path / "bad.ipynb").unlink()
+	nb_lint.lint([tmp_path], jobs=1, cache_path=cache)
+	assert list(json.loads(cache.read_text(encoding="utf-8"))["files"]) == [str(tmp_path / "a" / "good.ipynb")]
+
+
+def test_main_process_pool_and_report_file(tmp_path):
+	make_tree(tmp_path)
+	output = tmp_path / "report.json"
+	code = nb_lint.main([str(tmp_path), "--jobs", "2", "--no-cache", "--output", str(output)])
+	report = json.loads(output.read_text(encoding="utf-8"))
+	assert code == 1
+	assert [r["ok"] for r in report["results"]] == [True, False]
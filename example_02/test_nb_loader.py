@@ -0,0 +1,117 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import nb_loader
+
+
+NOTEBOOK_PATH = Path(__file__).with_name("Pokus01.ipynb")
+
+
+def write_notebook(path, sources):
+	cells = [{"cell_type": "code", "source": src, "outputs": []} for src in sources]
+	path.write_text(json.dumps({"cells": cells}), encoding="utf-8")
+
+
+def test_load_notebook_is_parsed_once():
+	assert nb_loader.load_notebook(NOTEBOOK_PATH) is nb_loader.load_notebook(NOTEBOOK_PATH)
+
+
+def test_missing_notebook_raises(tmp_path):
+	with pytest.raises(FileNotFoundError):
+		nb_loader.load_notebook(tmp_path / "missing.ipynb")
+
+
+def test_changed_file_is_reparsed(tmp_path):
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["print(1)"]])
+	first = nb_loader.load_notebook(path)
+	write_notebook(path, [["print(1)"], ["print(2)"]])
+	stat = path.stat()
+	os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+	second = nb_loader.load_notebook(path)
+	assert len(first["cells"]) == 1
+	assert len(second["cells"]) == 2
+
+
+def test_load_cells_joins_sources(nb_cells):
+	assert nb_cells[1] == ("code", 'msg1 = "Hello, World!"\nprint(msg1)')
+	assert [cell_type for cell_type, _ in nb_cells].count("markdown") == 3
+
+
+def test_load_cells_uses_disk_cache(tmp_path, monkeypatch):
+	monkeypatch.setenv(nb_loader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["x = 1\n", "y = 2"]])
+	cells = nb_loader.load_cells(path)
+	assert cells == (("code", "x = 1\ny = 2"),)
+	assert len(list((tmp_path / "cache").iterdir())) == 1
+
+	# a new run starts with empty memory caches and must not need to parse the JSON again
+	nb_loader.clear_cache()
+	monkeypatch.setattr(nb_loader, "load_notebook", lambda p: pytest.fail("notebook was reparsed"))
+	assert nb_loader.load_cells(path) == cells
+
+
+def test_changed_file_replaces_its_memory_entries(tmp_path):
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["print(0)"]])
+	nb_loader.load_cells(path)
+	entries = len(nb_loader._notebooks), len(nb_loader._cells)
+	for version in range(1, 5):
+		write_notebook(path, [[f"print({version})"]])
+		stat = path.stat()
+		os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + version * 1_000_000))
+		assert nb_loader.load_cells(path) == (("code", f"print({version})"),)
+	assert (len(nb_loader._notebooks), len(nb_loader._cells)) == entries
+
+
+def test_disk_cache_is_json(tmp_path, monkeypatch):
+	monkeypatch.setenv(nb_loader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["x = 1"]])
+	nb_loader.load_cells(path)
+	(cache_file,) = (tmp_path / "cache").iterdir()
+	assert json.loads(cache_file.read_text(encoding="utf-8")) == [["code", "x = 1"]]
+
+
+@pytest.mark.parametrize("content", [b"\x80\x04garbage", b"not json", b"[1, 2]", b'[["code"]]', b'[["code", 1]]', b"{}"])
+def test_corrupt_disk_cache_is_a_miss(tmp_path, monkeypatch, content):
+	monkeypatch.setenv(nb_loader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["x = 1"]])
+	nb_loader.load_cells(path)
+	(cache_file,) = (tmp_path / "cache").iterdir()
+	cache_file.write_bytes(content)
+	nb_loader.clear_cache()
+	assert nb_loader.load_cells(path) == (("code", "x = 1"),)
+	assert json.loads(cache_file.read_text(encoding="utf-8")) == [["code", "x = 1"]]
+
+
+def test_failed_disk_cache_write_does_not_fail_the_load(tmp_path, monkeypatch):
+	monkeypatch.setenv(nb_loader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["x = 1"]])
+
+	def replace(src, dst):
+		raise PermissionError("read-only cache")
+
+	monkeypatch.setattr(nb_loader.os, "replace", replace)
+	assert nb_loader.load_cells(path) == (("code", "x = 1"),)
+	assert list((tmp_path / "cache").iterdir()) == []  # the temp file is cleaned up
+
+
+def test_disk_cache_writers_use_their_own_temp_files(tmp_path, monkeypatch):
+	monkeypatch.setenv(nb_loader.CACHE_DIR_ENV, str(tmp_path / "cache"))
+	path = tmp_path / "nb.ipynb"
+	write_notebook(path, [["x = 1"]])
+	temp_files = []
+	replace = os.replace
+	monkeypatch.setattr(nb_loader.os, "replace", lambda src, dst: temp_files.append(src) or replace(src, dst))
+	nb_loader.load_cells(path)
+	nb_loader.clear_cache()
+	(tmp_path / "cache" / os.listdir(tmp_path / "cache")[0]).unlink()
+	nb_loader.load_cells(path)
+	assert len(set(temp_files)) == 2
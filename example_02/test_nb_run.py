@@ -0,0 +1,41 @@
+from nb_run import NotebookRunner, translate_shell_lines
+
+
+def test_translate_shell_lines_keeps_indentation():
+	source = "for i in range(2):\n    !echo hi\nx = 1"
+	assert translate_shell_lines(source) == "for i in range(2):\n    __nb_shell__('echo hi')\nx = 1"
+
+
+def test_namespace_is_shared_between_cells_and_skips_markdown():
+	runner = NotebookRunner()
+	results = runner.run_cells([("code", "x = 2"), ("markdown", "print(x)"), ("code", "print(x * 3)")])
+	assert [r["cell"] for r in results] == [0, 2]
+	assert results[1]["stdout"] == "6\n"
+	assert all(r["seconds"] >= 0 for r in results)
+
+
+def test_shell_stand_in_is_used():
+	calls = []
+	runner = NotebookRunner(shell=lambda command: calls.append(command) or f"ran {command}\n")
+	results = runner.run_cells([("code", "!ls -l")])
+	assert calls == ["ls -l"]
+	assert results[0]["stdout"] == "ran ls -l\n"
+
+
+def test_error_stops_execution_by_default():
+	runner = NotebookRunner()
+	results = runner.run_cells([("code", "print('a')\n1 / 0"), ("code", "print('b')")])
+	assert len(results) == 1
+	assert results[0]["stdout"] == "a\n"
+	assert "ZeroDivisionError" in results[0]["error"]
+
+	results = runner.run_cells([("code", "1 / 0"), ("code", "print('b')")], stop_on_error=False)
+	assert [r["stdout"] for r in results] == ["", "b\n"]
+
+
+def test_reset_and_reused_namespace():
+	runner = NotebookRunner()
+	runner.run_cells([("code", "y = 5")])
+	assert runner.run_cells([("code", "print(y)")])[0]["stdout"] == "5\n"
+	runner.reset()
+	assert "NameError" in runner.run_cells([("code", "print(y)")])[0]["error"]
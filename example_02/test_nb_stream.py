@@ -0,0 +1,66 @@
+import io
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from nb_stream import NotebookPolicy, POKUS01_POLICY, iter_cells, validate_file, validate_stream
+
+
+NOTEBOOK_PATH = Path(__file__).with_name("Pokus01.ipynb")
+
+
+def notebook_text(cells, **extra):
+	return json.dumps({"cells": cells, "metadata": {"kernelspec": {"name": "python3"}}, "nbformat": 4, **extra})
+
+
+def test_pokus01_passes_policy():
+	result = validate_file(NOTEBOOK_PATH)
+	assert result == {"cells": 6, "ok": True, "errors": []}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 7, 64 * 1024])
+def test_iter_cells_matches_json_module(chunk_size):
+	cells = [
+		{"cell_type": "markdown", "source": ["Tab\there \"quoted\" \\ back\n", "žluťoučký 😀 \u0001"], "metadata": {}},
+		{"cell_type": "code", "source": "x = [1, 2.5e3, -3]", "execution_count": None, "outputs": [
+			{"output_type": "stream", "text": ["}{][\"\\"], "data": {"n": [1, True, False, None]}},
+		]},
+		{"cell_type": "raw", "source": []},
+	]
+	text = notebook_text(cells)
+	expected = [(c["cell_type"], c["source"] if isinstance(c["source"], str) else "".join(c["source"])) for c in cells]
+	assert list(iter_cells(io.StringIO(text), chunk_size)) == expected
+
+
+def test_large_outputs_are_skipped_with_bounded_memory():
+	blob = "A" * 5_000_000
+	text = notebook_text([{"cell_type": "code", "source": ["print(1)"], "outputs": [{"data": {"image/png": blob}}]}])
+	del blob
+	stream = io.StringIO(text)
+	tracemalloc.start()
+	cells = list(iter_cells(stream, chunk_size=4096))
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	assert cells == [("code", "print(1)")]
+	assert peak < 1_000_000
+
+
+def test_forbidden_and_missing_content_are_reported():
+	policy = NotebookPolicy(min_cells=3, cell_types=["markdown"], required=[("code", "print(")])
+	text = notebook_text([{"cell_type": "code", "source": ["!rm -rf /tmp/x"]}])
+	result = validate_stream(io.StringIO(text), policy)
+	assert result["ok"] is False
+	assert result["cells"] == 1
+	assert any("expected markdown" in e for e in result["errors"])
+	assert any("'rm -rf'" in e for e in result["errors"])
+	assert any("at least 3 cells" in e for e in result["errors"])
+	assert any("'print('" in e for e in result["errors"])
+
+
+@pytest.mark.parametrize("text", ['{"cells": [', '{"cells": [{"source": "abc}]}', '{"cells": []} x', ''])
+def test_invalid_json_is_reported(text):
+	result = validate_stream(io.StringIO(text), POKUS01_POLICY)
+	assert result["ok"] is False
+	assert result["errors"][-1].startswith("invalid notebook JSON")
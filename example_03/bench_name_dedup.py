@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+# bench_name_dedup.py - find_duplicates on realistic names: a few common first names and surnames,
+# 10% of the records with one typo
+
+import random
+import time
+
+import name_dedup as nd
+
+
+FIRST_NAMES = ["Jan", "Petr", "Jiří", "Josef", "Pavel", "Martin", "Tomáš", "Jaroslav", "Miroslav", "Zdeněk",
+               "Jana", "Marie", "Eva", "Hana", "Anna", "Lenka", "Kateřina", "Lucie", "Věra", "Alena"]
+SURNAMES = ["Novák", "Svoboda", "Novotný", "Dvořák", "Černý", "Procházka", "Kučera", "Veselý", "Horák", "Němec",
+            "Marek", "Pospíšil", "Pokorný", "Hájek", "Král", "Jelínek", "Růžička", "Beneš", "Fiala", "Sedláček",
+            "Doležal", "Zeman", "Kolář", "Navrátil", "Čermák", "Vaněk", "Urban", "Blažek", "Kříž", "Kovář"]
+
+
+def typo(word, rng):
+    position = rng.randrange(len(word))
+    kind = rng.randrange(4)
+    letter = rng.choice("abcdeghijklmnoprstuvyz")
+    if kind == 0:
+        return word[:position] + letter + word[position + 1:]
+    if kind == 1:
+        return word[:position] + letter + word[position:]
+    if kind == 2 and len(word) > 2:
+        return word[:position] + word[position + 1:]
+    position = min(position, len(word) - 2)
+    return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+
+
+def make_people(count, typo_rate=0.1, seed=0):
+    rng = random.Random(seed)
+    people = []
+    for _ in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(SURNAMES)
+        if rng.random() < typo_rate:
+            if rng.random() < 0.5:
+                first = typo(first, rng)
+            else:
+                last = typo(last, rng)
+        people.append((first, last))
+    return people
+
+
+def main(counts=(20_000, 100_000, 1_000_000)):
+    for count in counts:
+        people = make_people(count)
+        start = time.perf_counter()
+        groups = nd.find_duplicates(people)
+        print(f"{count:,} names: {time.perf_counter() - start:.2f} s, {len(groups)} groups")
+
+
+if __name__ == "__main__":   # spuštění hlavní funkce
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+# bench_name_index.py - build time and prefix lookup latency of NameIndex
+
+import time
+
+import name_index as ni
+
+
+def main(count=200_000, lookups=1000):
+    start = time.perf_counter()
+    index = ni.NameIndex((f"Name{i:06d}", i) for i in range(count))
+    print(f"build {count:,} names: {time.perf_counter() - start:.3f} s")
+    start = time.perf_counter()
+    for i in range(lookups):
+        index.lookup(f"name{i:04d}")
+    print(f"lookup: {(time.perf_counter() - start) / lookups * 1e6:,.1f} us/lookup")
+
+
+if __name__ == "__main__":   # spuštění hlavní funkce
+    main()
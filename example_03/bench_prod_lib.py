@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+# bench_prod_lib.py - throughput of the better_names truncation policies
+
+import random
+import string
+import time
+
+import prod_lib as pl
+
+
+def make_names(count, seed=0):
+    rng = random.Random(seed)
+
+    def word():
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 12)))
+
+    return [(word(), word()) for _ in range(count)]
+
+
+def main(count=200_000):
+    names = make_names(count)
+    start = time.perf_counter()
+    [pl.better_name_return(first, second) for first, second in names]
+    print(f"better_name_return: {count / (time.perf_counter() - start):,.0f} names/s")
+    for policy in pl.TRUNCATION_POLICIES:
+        start = time.perf_counter()
+        pl.better_names(names, policy=policy)
+        print(f"better_names policy={policy}: {count / (time.perf_counter() - start):,.0f} names/s")
+
+
+if __name__ == "__main__":   # spuštění hlavní funkce
+    main()
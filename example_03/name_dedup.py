@@ -0,0 +1,91 @@
+# name_dedup.py - find near-duplicate people after normalizing their names with prod_lib
+#
+# Names are normalized like prod_lib.better_name_return, but without the 15-character cut, so
+# two people who only share a long prefix stay apart. Identical names are grouped first in one
+# hash pass. Instead of comparing every pair of the remaining distinct names (O(n^2)), every
+# name is indexed under its deletion neighbourhood - the name itself and every string left after
+# deleting up to max_edits letters - and only names sharing such a key are candidates. One
+# substitution, insertion, deletion or swap of neighbouring letters always leaves a shared key,
+# so candidate sets stay tiny even for very common names. Candidates pass a length pre-filter
+# before the difflib score, and matching pairs are merged into groups with union-find.
+
+import re
+import sys
+from difflib import SequenceMatcher
+from itertools import combinations
+
+import prod_lib as pl
+
+
+# A key shared by more names than this would bring back O(n^2): instead of all pairs, its names
+# are sorted and each is scored only against the next WINDOW names (sorted neighbourhood)
+MAX_BLOCK = 1000
+WINDOW = 20
+
+_SEPARATORS = re.compile(r"[\s\-'.,]+")
+
+
+def comparison_key(formatted):
+    # "Mary-Jane Watson" -> "mary jane watson"
+    return _SEPARATORS.sub(" ", formatted.casefold()).strip()
+
+
+def deletion_keys(key, max_edits=1):
+    # The name without separators, and every string left after deleting up to max_edits letters
+    keys = {key.replace(" ", "")}
+    for _ in range(max_edits):
+        keys |= {variant[:position] + variant[position + 1:] for variant in keys for position in range(len(variant))}
+    return keys
+
+
+def similarity(a, b):
+    # Ratio of matching characters, ignoring separators (1.0 = identical)
+    return SequenceMatcher(None, a.replace(" ", ""), b.replace(" ", ""), autojunk=False).ratio()
+
+
+def _candidate_pairs(members, keys, max_block, window):
+    if len(members) <= max_block:
+        return combinations(members, 2)
+    members = sorted(members, key=keys.__getitem__)
+    return ((a, b) for position, a in enumerate(members) for b in members[position + 1:position + 1 + window])
+
+
+def find_duplicates(names, threshold=0.9, max_edits=1, max_block=MAX_BLOCK, window=WINDOW):
+    # names: iterable of (first_name, second_name)
+    # Returns groups of indices (sorted, smallest first) of names that look like the same person
+    keys = [comparison_key(formatted) for formatted in pl.better_names(names, max_length=sys.maxsize)]
+    parent = list(range(len(keys)))
+
+    # exact duplicates: one hash pass, and only the first index of each key is indexed and scored
+    first_index = {}
+    for index, key in enumerate(keys):
+        parent[index] = first_index.setdefault(key, index)
+    blocks = {}
+    for key, index in first_index.items():
+        for block_key in deletion_keys(key, max_edits):
+            blocks.setdefault(block_key, []).append(index)
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    lengths = [len(key) - key.count(" ") for key in keys]
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        for a, b in _candidate_pairs(members, keys, max_block, window):
+            root_a, root_b = find(a), find(b)
+            if root_a == root_b:
+                continue
+            # ratio = 2 * matches / total length, and there are at most min(length) matches
+            if 2 * min(lengths[a], lengths[b]) < threshold * (lengths[a] + lengths[b]):
+                continue
+            if similarity(keys[a], keys[b]) >= threshold:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups = {}
+    for index in range(len(keys)):
+        groups.setdefault(find(index), []).append(index)
+    return sorted(group for group in groups.values() if len(group) > 1)
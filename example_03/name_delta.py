@@ -0,0 +1,86 @@
+# name_delta.py - incremental re-normalization of name tables with better_name_return
+#
+# For every row the previous input hash and output are kept, so only new or changed rows are
+# normalized again, and the result is a delta (inserted, changed, deleted) for downstream systems.
+# Row ids are stored as strings (the state is saved as JSON).
+
+import hashlib
+import json
+import os
+
+import prod_lib as pl
+
+
+STATE_VERSION = 1
+
+
+def row_hash(first_name, second_name):
+    # Hash of the inputs as better_name_return sees them (after str())
+    data = f"{first_name}\x1f{second_name}".encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=12).hexdigest()
+
+
+def empty_delta():
+    return {"inserted": {}, "changed": {}, "deleted": []}
+
+
+class IncrementalNormalizer:
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else {}  # row id -> [input hash, output]
+
+    def _upsert(self, row_id, first_name, second_name, delta):
+        row_id = str(row_id)
+        digest = row_hash(first_name, second_name)
+        previous = self.rows.get(row_id)
+        if previous is not None and previous[0] == digest:
+            return
+        output = pl.better_name_return(first_name, second_name)
+        self.rows[row_id] = [digest, output]
+        if previous is None:
+            delta["inserted"][row_id] = output
+        elif previous[1] != output:
+            delta["changed"][row_id] = output
+
+    def update(self, rows):
+        # rows: the full current table as (row_id, first_name, second_name)
+        # Rows missing from it are reported as deleted
+        delta = empty_delta()
+        seen = set()
+        for row_id, first_name, second_name in rows:
+            seen.add(str(row_id))
+            self._upsert(row_id, first_name, second_name, delta)
+        for row_id in [row_id for row_id in self.rows if row_id not in seen]:
+            del self.rows[row_id]
+            delta["deleted"].append(row_id)
+        return delta
+
+    def apply_changes(self, upserts=(), deleted=()):
+        # Change-feed mode: only the changed rows are given, so the cost follows the change volume
+        delta = empty_delta()
+        for row_id, first_name, second_name in upserts:
+            self._upsert(row_id, first_name, second_name, delta)
+        for row_id in map(str, deleted):
+            if self.rows.pop(row_id, None) is not None:
+                delta["deleted"].append(row_id)
+        return delta
+
+    def outputs(self):
+        return {row_id: output for row_id, (_, output) in self.rows.items()}
+
+    def save(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as output:
+            json.dump({"version": STATE_VERSION, "rows": self.rows}, output, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        # Missing state file means a first run: every row will be reported as inserted
+        try:
+            with open(path, encoding="utf-8") as source:
+                state = json.load(source)
+        except FileNotFoundError:
+            return cls()
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported state version: {state.get('version')}")
+        return cls(state["rows"])
@@ -0,0 +1,71 @@
+# name_index.py - type-ahead search over formatted names
+#
+# Names are stored as folded keys (case- and accent-insensitive) in a sorted list, so a prefix
+# lookup is two binary searches plus reading the matches. New names go into a small sorted side
+# list first and are merged into the main list in bulk, so inserts stay cheap at millions of entries.
+
+import bisect
+import heapq
+import itertools
+import unicodedata
+
+import prod_lib as pl
+
+
+# Side-list size at which it is merged into the main list
+MERGE_AT = 4096
+
+
+def fold(text):
+    # "Čapek" -> "capek": strip accents and case for matching
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+class NameIndex:
+    def __init__(self, entries=()):
+        # entries: iterable of (display name, value)
+        # Stored as (folded, name, sequence, value); the unique sequence number keeps values out of comparisons
+        self._sequence = itertools.count()
+        self._main = sorted((fold(name), name, next(self._sequence), value) for name, value in entries)
+        self._pending = []
+
+    @classmethod
+    def from_names(cls, pairs):
+        # (first_name, second_name) pairs, indexed as formatted by better_name_return
+        return cls((pl.better_name_return(first, second), (first, second)) for first, second in pairs)
+
+    @classmethod
+    def from_customers(cls, customers):
+        # Objects with a "jmeno" attribute, e.g. Kavarna.zakaznici
+        return cls((customer.jmeno, customer) for customer in customers)
+
+    def __len__(self):
+        return len(self._main) + len(self._pending)
+
+    def add(self, name, value=None):
+        bisect.insort(self._pending, (fold(name), name, next(self._sequence), value))
+        if len(self._pending) >= MERGE_AT:
+            self._merge()
+
+    def _merge(self):
+        self._main = list(heapq.merge(self._main, self._pending))
+        self._pending = []
+
+    def lookup(self, prefix, limit=10):
+        # Up to limit (display name, value) pairs whose folded name starts with the folded prefix
+        key = fold(prefix)
+        matches = heapq.merge(self._range(self._main, key), self._range(self._pending, key))
+        result = []
+        for entry in matches:
+            if len(result) >= limit:
+                break
+            result.append((entry[1], entry[3]))
+        return result
+
+    @staticmethod
+    def _range(entries, key):
+        index = bisect.bisect_left(entries, (key,))
+        while index < len(entries) and entries[index][0].startswith(key):
+            yield entries[index]
+            index += 1
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+# name_shm.py - better_name_return over a process pool with shared-memory batches
+#
+#   with SharedMemoryNormalizer(processes=4) as normalizer:
+#       names = normalizer.normalize(pairs)
+#
+# Pool.map pickles every input pair to the workers and every result back. Here the batch is
+# written once into a shared-memory block (int64 code-point offsets followed by the UTF-8
+# bytes of all first and last names) and the workers write into a second block with a fixed-width slot
+# per row: 15 code points of UTF-32 plus a length byte. Only (block names, row range) tuples
+# cross the process boundary.
+
+import os
+import time
+from array import array
+from itertools import accumulate, chain
+from multiprocessing import Pool, resource_tracker, shared_memory
+
+import prod_lib as pl
+
+
+WIDTH = 15  # better_name_return never returns more than 15 code points
+SLOT_BYTES = 4 * WIDTH  # one UTF-32 slot per row
+ENCODING_ERRORS = "surrogatepass"  # str() of anything round-trips, even lone surrogates
+
+
+def _attach(name):
+    # Python < 3.13 registers a block it merely attaches to with the resource tracker, which then
+    # tries to unlink it a second time at exit; the parent owns the blocks, so skip that
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            return shared_memory.SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+def _normalize_rows(task):
+    # Worker: formats rows [start, stop) of the input block into their slots of the output block
+    input_name, output_name, count, start, stop, byte_start, byte_stop = task
+    source = _attach(input_name)
+    target = _attach(output_name)
+    header = 8 * (2 * count + 1)
+    offsets = source.buf[:header].cast("q")
+    try:
+        # one decode for the whole range, then the names are cut out by code-point offsets
+        text = bytes(source.buf[header + byte_start:header + byte_stop]).decode("utf-8", ENCODING_ERRORS)
+        bounds = offsets[2 * start:2 * stop + 1].tolist()
+        base = bounds[0]
+        names = [pl.better_name_return(text[bounds[i] - base:bounds[i + 1] - base],
+                                       text[bounds[i + 1] - base:bounds[i + 2] - base])
+                 for i in range(0, 2 * (stop - start), 2)]
+        target.buf[start * SLOT_BYTES:stop * SLOT_BYTES] = \
+            "".join(name.ljust(WIDTH, "\0") for name in names).encode("utf-32-le", ENCODING_ERRORS)
+        target.buf[count * SLOT_BYTES + start:count * SLOT_BYTES + stop] = bytes(map(len, names))
+    finally:
+        offsets.release()  # views must be released before the blocks can be closed
+        source.close()
+        target.close()
+    return stop - start
+
+
+def _normalize_pair(pair):
+    return pl.better_name_return(*pair)
+
+
+class SharedMemoryNormalizer:
+    def __init__(self, processes=None, tasks_per_process=4):
+        self.processes = processes or os.cpu_count() or 1
+        self.pool = Pool(self.processes)
+        self.tasks_per_process = tasks_per_process
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def normalize(self, pairs):
+        values = list(map(str, chain.from_iterable(pairs)))
+        count = len(values) // 2
+        if not count:
+            return []
+        # offsets count code points; every task range is encoded to UTF-8 on its own, so a
+        # worker only needs the byte bounds of its range, which travel in the task tuple
+        offsets = array("q", accumulate(map(len, values), initial=0))
+        step = -(-count // (self.processes * self.tasks_per_process))
+        ranges = [(start, min(start + step, count)) for start in range(0, count, step)]
+        blobs = ["".join(values[2 * start:2 * stop]).encode("utf-8", ENCODING_ERRORS) for start, stop in ranges]
+        header = 8 * len(offsets)
+        size = sum(map(len, blobs))
+        source = shared_memory.SharedMemory(create=True, size=header + max(1, size))
+        target = shared_memory.SharedMemory(create=True, size=count * (SLOT_BYTES + 1))
+        try:
+            source.buf[:header] = offsets.tobytes()
+            tasks = []
+            position = 0
+            for (start, stop), blob in zip(ranges, blobs):
+                source.buf[header + position:header + position + len(blob)] = blob
+                tasks.append((source.name, target.name, count, start, stop, position, position + len(blob)))
+                position += len(blob)
+            self.pool.map(_normalize_rows, tasks, chunksize=1)
+            # zero padding decodes to NULs; the length bytes say where each name ends
+            text = bytes(target.buf[:count * SLOT_BYTES]).decode("utf-32-le", ENCODING_ERRORS)
+            lengths = bytes(target.buf[count * SLOT_BYTES:count * (SLOT_BYTES + 1)])
+            return [text[row * WIDTH:row * WIDTH + lengths[row]] for row in range(count)]
+        finally:
+            for block in (source, target):
+                block.close()
+                block.unlink()
+
+    def normalize_pickled(self, pairs, chunksize=None):
+        # Baseline: plain Pool.map, pickling every pair and every result
+        pairs = list(pairs)
+        if chunksize is None:
+            chunksize = max(1, -(-len(pairs) // (self.processes * self.tasks_per_process)))
+        return self.pool.map(_normalize_pair, pairs, chunksize=chunksize)
+
+
+def benchmark(rows=1_000_000, processes=None, seed=0):
+    # Seconds per batch for Pool.map and for the shared-memory exchange over the same pool
+    from bench_prod_lib import make_names
+
+    names = make_names(rows, seed)
+    with SharedMemoryNormalizer(processes) as normalizer:
+        start = time.perf_counter()
+        pickled = normalizer.normalize_pickled(names)
+        pool_map_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        shared = normalizer.normalize(names)
+        shared_seconds = time.perf_counter() - start
+        assert pickled == shared
+        return {"rows": rows, "processes": normalizer.processes,
+                "pool_map_s": pool_map_seconds, "shared_memory_s": shared_seconds}
+
+
+if __name__ == "__main__":   # spuštění hlavní funkce
+    print(benchmark())
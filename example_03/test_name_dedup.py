@@ -0,0 +1,81 @@
+"""Tests for name_dedup.py - near-duplicate detection over prod_lib-normalized names."""
+
+import random
+import string
+
+import name_dedup as nd
+
+
+def test_comparison_key_normalizes_separators_and_case():
+    """Hyphens, apostrophes and case do not matter for comparison."""
+    assert nd.comparison_key("Mary-Jane Watson") == "mary jane watson"
+    assert nd.comparison_key("Anna O'Brien") == "anna o brien"
+
+
+def test_deletion_keys():
+    """A name is indexed without separators and with every single letter deleted."""
+    assert nd.deletion_keys("jo ann") == {"joann", "oann", "jann", "jonn", "joan"}
+    assert nd.deletion_keys("ab", max_edits=2) == {"ab", "a", "b", ""}
+    assert nd.deletion_keys("") == {""}
+
+
+def test_spec_example_is_detected():
+    """"Mary-Jane Watso" and "Mary Jane Watson" are the same person."""
+    names = [("mary-jane", "watson"), ("Mary Jane", "Watson"), ("john", "doe")]
+    assert nd.find_duplicates(names) == [[0, 1]]
+
+
+def test_typos_and_case_are_grouped():
+    """Small typos, extra whitespace and casing are grouped together."""
+    names = [("jana", "svobodova"), ("JANA", "svobodová"), ("  jana ", "svobodva"), ("petr", "novak")]
+    assert nd.find_duplicates(names) == [[0, 1, 2]]
+
+
+def test_typo_at_start_is_caught():
+    """A typo in the first letter still leaves a shared deletion key."""
+    names = [("karel", "capek"), ("xarel", "capek")]
+    assert nd.find_duplicates(names, threshold=0.85) == [[0, 1]]
+
+
+def test_long_names_sharing_a_prefix_are_not_grouped():
+    """Names are compared in full, not cut to the 15 characters of better_name_return."""
+    names = [("Alexandra", "Novakova"), ("Alexandra", "Novakovicova"),
+             ("Maximilian", "Schwarzenberg"), ("Maximilian", "Schwarzkopf")]
+    assert nd.find_duplicates(names) == []
+    assert nd.find_duplicates(names + [("maximilian", "schwarzenberk")]) == [[2, 4]]
+
+
+def test_different_people_are_not_grouped():
+    """Similar prefixes alone do not make a duplicate."""
+    names = [("mary", "smith"), ("maryann", "jones"), ("marek", "novy")]
+    assert nd.find_duplicates(names) == []
+
+
+def test_exact_duplicates_are_grouped_whatever_the_block_size():
+    """Identical names are grouped by the hash pass, even when their block is oversized."""
+    names = [("john", "doe")] * 5
+    assert nd.find_duplicates(names, max_block=3) == [[0, 1, 2, 3, 4]]
+    assert nd.find_duplicates(names) == [[0, 1, 2, 3, 4]]
+
+
+def test_candidates_are_limited_to_shared_deletion_keys(monkeypatch):
+    """Only names one edit apart are scored, however many names share a first name or prefix."""
+    rng = random.Random(0)
+    names = [("maria", "dvor" + "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 9))))
+             for _ in range(300)]
+    names += [("maria", "dvorakova"), ("maria", "dvorakovx"), ("xaria", "dvorakova")]  # typo at the end / start
+    calls = []
+    original = nd.similarity
+    monkeypatch.setattr(nd, "similarity", lambda a, b: calls.append(1) or original(a, b))
+    assert nd.find_duplicates(names) == [[300, 301, 302]]
+    assert len(calls) < 10
+
+
+def test_oversized_blocks_use_sorted_neighbourhood(monkeypatch):
+    """A deletion key shared by too many names is scored within a window instead of all pairs."""
+    names = [("ab", letter) for letter in string.ascii_lowercase]  # all share the key "ab"
+    calls = []
+    original = nd.similarity
+    monkeypatch.setattr(nd, "similarity", lambda a, b: calls.append(1) or original(a, b))
+    assert nd.find_duplicates(names, threshold=0.5, max_block=10, window=2) == [list(range(26))]
+    assert len(calls) <= 2 * len(names)  # all pairs would be 325
@@ -0,0 +1,61 @@
+"""Tests for name_delta.py - incremental normalization with change tracking."""
+
+import pytest
+
+import name_delta as nd
+
+
+def test_first_run_inserts_everything():
+    """All rows are new on the first run."""
+    normalizer = nd.IncrementalNormalizer()
+    delta = normalizer.update([(1, "john", "doe"), (2, "jana", "svobodova")])
+    assert delta == {"inserted": {"1": "John Doe", "2": "Jana Svobodova"}, "changed": {}, "deleted": []}
+
+
+def test_second_run_reports_only_changes(monkeypatch):
+    """Unchanged rows are not normalized again; changes and deletions are reported."""
+    normalizer = nd.IncrementalNormalizer()
+    normalizer.update([(1, "john", "doe"), (2, "jana", "svobodova"), (3, "petr", "novak")])
+
+    calls = []
+    original = nd.pl.better_name_return
+    monkeypatch.setattr(nd.pl, "better_name_return", lambda a, b: calls.append((a, b)) or original(a, b))
+    delta = normalizer.update([(1, "john", "doe"), (2, "jana", "novakova"), (4, "eva", "mala")])
+    assert calls == [("jana", "novakova"), ("eva", "mala")]
+    assert delta == {"inserted": {"4": "Eva Mala"}, "changed": {"2": "Jana Novakova"}, "deleted": ["3"]}
+    assert normalizer.outputs() == {"1": "John Doe", "2": "Jana Novakova", "4": "Eva Mala"}
+
+
+def test_input_change_with_same_output_is_not_a_change():
+    """Different input giving the same formatted name produces no delta entry."""
+    normalizer = nd.IncrementalNormalizer()
+    normalizer.update([(1, "john", "doe")])
+    assert normalizer.update([(1, "JOHN", "doe")]) == nd.empty_delta()
+
+
+def test_apply_changes_change_feed():
+    """Change-feed mode touches only the given rows."""
+    normalizer = nd.IncrementalNormalizer()
+    normalizer.update([(1, "john", "doe"), (2, "jana", "svobodova")])
+    delta = normalizer.apply_changes(upserts=[(3, "petr", "novak")], deleted=[1, 99])
+    assert delta == {"inserted": {"3": "Petr Novak"}, "changed": {}, "deleted": ["1"]}
+    assert sorted(normalizer.outputs()) == ["2", "3"]
+
+
+def test_state_round_trip(tmp_path):
+    """Saved state is loaded back, so the next run only sees real changes."""
+    path = tmp_path / "state.json"
+    assert nd.IncrementalNormalizer.load(path).rows == {}
+    normalizer = nd.IncrementalNormalizer()
+    normalizer.update([(1, "čapek", "karel")])
+    normalizer.save(path)
+    loaded = nd.IncrementalNormalizer.load(path)
+    assert loaded.update([(1, "čapek", "karel")]) == nd.empty_delta()
+
+
+def test_unknown_state_version_raises(tmp_path):
+    """A state file from another version is rejected."""
+    path = tmp_path / "state.json"
+    path.write_text('{"version": 99, "rows": {}}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        nd.IncrementalNormalizer.load(path)
@@ -0,0 +1,38 @@
+"""Tests for name_frame.py - DataFrame integration of better_name_return."""
+
+import pytest
+
+import name_frame as nf
+import prod_lib as pl
+
+
+PAIRS = [("john", "doe"), ("mary-jane", "watson"), ("  alice", "smith  "), (123, 456), ("", ""), (True, None)]
+
+
+def test_better_name_values_matches_better_name_return():
+    """The list helper is exactly better_name_return per row."""
+    first, last = zip(*PAIRS)
+    assert nf.better_name_values(first, last) == [pl.better_name_return(a, b) for a, b in PAIRS]
+
+
+def test_better_name_values_with_policy():
+    """Truncation policies are passed through."""
+    assert nf.better_name_values(["mary-jane"], ["watson"], policy="word") == ["Mary-Jane"]
+
+
+def test_pandas_accessor():
+    """df.names.better(...) equals a row-wise apply, keeping the index."""
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame(PAIRS, columns=["first", "last"], index=[10, 11, 12, 13, 14, 15])
+    result = frame.names.better("first", "last")
+    expected = frame.apply(lambda row: pl.better_name_return(row["first"], row["last"]), axis=1)
+    assert result.tolist() == expected.tolist()
+    assert list(result.index) == [10, 11, 12, 13, 14, 15]
+
+
+def test_polars_expression():
+    """pl.col(first).names.better(pl.col(last)) equals better_name_return per row."""
+    polars = pytest.importorskip("polars")
+    frame = polars.DataFrame({"first": ["john", "mary-jane", " o'neil "], "last": ["doe", "watson", "anne"]})
+    result = frame.select(polars.col("first").names.better(polars.col("last")).alias("name"))
+    assert result["name"].to_list() == [pl.better_name_return(a, b) for a, b in zip(frame["first"], frame["last"])]
@@ -0,0 +1,60 @@
+"""Tests for name_index.py - prefix search over formatted names."""
+
+import name_index as ni
+
+
+class Customer:
+    def __init__(self, jmeno):
+        self.jmeno = jmeno
+
+
+def test_fold_removes_case_and_accents():
+    """Folding makes matching case- and accent-insensitive."""
+    assert ni.fold("Čapek Karel") == "capek karel"
+    assert ni.fold("ÅSTRÖM") == "astrom"
+
+
+def test_lookup_from_formatted_names():
+    """Names are indexed as formatted by better_name_return."""
+    index = ni.NameIndex.from_names([("jana", "svobodova"), ("jan", "novak"), ("petr", "cerny")])
+    assert [name for name, _ in index.lookup("ja")] == ["Jan Novak", "Jana Svobodova"]
+    assert index.lookup("jana s") == [("Jana Svobodova", ("jana", "svobodova"))]
+    assert index.lookup("x") == []
+
+
+def test_accent_insensitive_lookup():
+    """A prefix without accents finds accented names and vice versa."""
+    index = ni.NameIndex([("Čapek Karel", 1), ("Cech Petr", 2), ("Šimon", 3)])
+    assert [value for _, value in index.lookup("c")] == [1, 2]
+    assert index.lookup("SIM") == [("Šimon", 3)]
+    assert index.lookup("čá") == [("Čapek Karel", 1)]
+
+
+def test_incremental_insert_and_merge(monkeypatch):
+    """Inserted names are found before and after being merged into the main list."""
+    monkeypatch.setattr(ni, "MERGE_AT", 3)
+    index = ni.NameIndex([("Bob", None)])
+    index.add("Anna", 1)
+    index.add("Adam", 2)
+    assert [name for name, _ in index.lookup("a")] == ["Adam", "Anna"]
+    index.add("Alena", 3)  # triggers the merge
+    assert index._pending == []
+    assert [name for name, _ in index.lookup("a")] == ["Adam", "Alena", "Anna"]
+    assert len(index) == 4
+
+
+def test_from_customers_and_limit():
+    """Customers are indexed by their jmeno; limit caps the result."""
+    customers = [Customer(f"Jan{i}") for i in range(20)]
+    index = ni.NameIndex.from_customers(customers)
+    result = index.lookup("jan", limit=5)
+    assert len(result) == 5
+    assert all(isinstance(value, Customer) for _, value in result)
+
+
+def test_lookup_on_many_names_returns_the_prefix_range():
+    """A prefix matching a block of many names returns the first ones in order."""
+    index = ni.NameIndex((f"Name{i:04d}", i) for i in range(2000))
+    assert [value for _, value in index.lookup("name01")] == list(range(100, 110))
+    assert [value for _, value in index.lookup("name1999")] == [1999]
+    assert index.lookup("name2") == []
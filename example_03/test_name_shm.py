@@ -0,0 +1,41 @@
+"""Tests for name_shm.py - shared-memory batches for multi-process normalization."""
+
+import os
+
+import pytest
+
+import name_shm as ns
+import prod_lib as pl
+
+
+PAIRS = [("john", "doe"), ("mary-jane", "watson-parker"), ("  alice", "smith  "), (123, None),
+         ("", ""), ("žofie", "dvořáková-nováková"), ("\U0001f600x", "y")]
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    with ns.SharedMemoryNormalizer(processes=2) as shared:
+        yield shared
+
+
+def test_matches_better_name_return(normalizer):
+    """Results equal better_name_return, including non-ASCII and astral characters."""
+    assert normalizer.normalize(PAIRS * 50) == [pl.better_name_return(a, b) for a, b in PAIRS * 50]
+
+
+def test_matches_pool_map_baseline(normalizer):
+    """The shared-memory path and the Pool.map baseline agree."""
+    assert normalizer.normalize(PAIRS) == normalizer.normalize_pickled(PAIRS)
+
+
+def test_empty_batch(normalizer):
+    """An empty batch needs no shared memory."""
+    assert normalizer.normalize([]) == []
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory in /dev/shm")
+def test_blocks_are_unlinked(normalizer):
+    """No shared-memory block is left behind after a batch."""
+    before = set(os.listdir("/dev/shm"))
+    normalizer.normalize(PAIRS)
+    assert set(os.listdir("/dev/shm")) <= before
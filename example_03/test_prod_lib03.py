@@ -507,3 +507,59 @@ def test_better_name_max_length_exhaustive_check():
     for first, last in test_names:
         result = pl.better_name_return(first, last)
         assert len(result) <= 15, f"Function violated 15-char limit: {result}"
+
+
+# ============================================================================
+# Truncation policies (truncate_name, better_names)
+# ============================================================================
+
+@pytest.mark.parametrize("policy, expected", [
+    ("hard", "Mary-Jane Watso"),
+    ("trim", "Mary-Jane Watso"),
+    ("word", "Mary-Jane"),
+    ("initial", "M. Watson"),
+])
+def test_truncate_name_policies_spec_example(policy, expected):
+    """Each policy on the spec example "Mary-Jane Watson"."""
+    assert pl.truncate_name("Mary-Jane Watson", 15, policy) == expected
+
+
+def test_truncate_name_trim_drops_trailing_space():
+    """Hard cut can end in a space; trim and word remove it."""
+    formatted = "Alexandrinas Jo Long"  # character 15 is a space
+    assert pl.truncate_name(formatted, 16, "hard") == "Alexandrinas Jo "
+    assert pl.truncate_name(formatted, 16, "trim") == "Alexandrinas Jo"
+    assert pl.truncate_name(formatted, 16, "word") == "Alexandrinas Jo"
+
+
+def test_truncate_name_word_single_long_word_is_cut_hard():
+    """Without a space before the limit the word policy falls back to a hard cut."""
+    assert pl.truncate_name("Abcdefghijklmnopqrstuvwxyz", 15, "word") == "Abcdefghijklmno"
+
+
+def test_truncate_name_short_names_untouched():
+    """Names within the limit are returned as they are for every policy."""
+    for policy in pl.TRUNCATION_POLICIES:
+        assert pl.truncate_name("John Doe", 15, policy) == "John Doe"
+
+
+def test_truncate_name_custom_max_length():
+    """max_length is configurable."""
+    assert pl.truncate_name("Christopher Schwarzenegger", 20, "word") == "Christopher"
+    assert pl.truncate_name("Christopher Schwarzenegger", 5, "initial") == "C. Sc"
+
+
+def test_truncate_name_unknown_policy():
+    """Unknown policies raise ValueError."""
+    with pytest.raises(ValueError):
+        pl.truncate_name("Christopher Schwarzenegger", 15, "smart")
+    with pytest.raises(ValueError):
+        pl.better_names([("a", "b")], policy="smart")
+
+
+def test_better_names_default_identical_to_better_name_return():
+    """The default batch policy gives exactly better_name_return's output."""
+    pairs = [("john", "doe"), ("mary-jane", "watson"), ("  alice", "smith  "), (123, 456),
+             ("", ""), ("   ", "smith"), ("christopher", "schwarzenegger"), ("kája", "čapek"),
+             ("j.r.", "tolkien"), ("a" * 100, "b" * 100), (True, None)]
+    assert pl.better_names(pairs) == [pl.better_name_return(first, last) for first, last in pairs]
@@ -1,13 +1,45 @@
 #Hazeni minci
 import random
-side_coin=(random.randint(0,1))
-if side_coin==0:
-    print("hlava")
-else:
-    print("orel")
-
-try:
-    number = int(input("Zadej zkoumane cislo\n"))
-    print(f"Zadane cislo je {number}")
-except ValueError:
-    print("Chybne zadany vstup")
\ No newline at end of file
+
+
+def hod_minci():
+    return random.randint(0, 1)
+
+
+def strana_mince(side_coin):
+    if side_coin == 0:
+        return "hlava"
+    else:
+        return "orel"
+
+
+def preved_cislo(vstup):
+    # vrati vstup prevedeny na int, nebo None kdyz prevest nejde
+    # prevadi se jen str a int - float, bool a jine typy by int() tise orizl nebo vyhodil jinou vyjimku
+    if isinstance(vstup, bool) or not isinstance(vstup, (str, int)):
+        return None
+    try:
+        return int(vstup)
+    except ValueError:
+        return None
+
+
+def zprava_pro_vstup(vstup):
+    number = preved_cislo(vstup)
+    if number is None:
+        return "Chybne zadany vstup"
+    return f"Zadane cislo je {number}"
+
+
+def over_vstupy(vstupy):
+    # tabulkove overeni - pro kazdy vstup int nebo None, bez vypisu (stejne pravidla jako preved_cislo)
+    return [preved_cislo(vstup) for vstup in vstupy]
+
+
+def main():
+    print(strana_mince(hod_minci()))
+    print(zprava_pro_vstup(input("Zadej zkoumane cislo\n")))
+
+
+if __name__ == "__main__":
+    main()
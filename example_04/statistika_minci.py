@@ -0,0 +1,165 @@
+#Statistika hodu minci - kontrola generatoru nahodnych cisel po blocich
+#
+# Hody se zpracovavaji po blocich (bytes s hodnotami 0 = hlava, 1 = orel) a drzi se jen
+# konstantni stav: pocty, pocet behu, delky behu na zacatku a na konci a nejdelsi behy.
+# Proto jde overit i miliardy hodu bez jejich ukladani a vysledky z vice procesu
+# se daji spojit (StatistikaHodu.spoj) - poradi casti musi odpovidat poradi hodu.
+import math
+import random
+import sys
+
+from prod04 import strana_mince
+
+
+_NA_HODY = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def hody(pocet, rng=random):
+    # blok nahodnych hodu jako bytes 0/1 (stejne rozdeleni jako prod04.hod_minci)
+    if pocet <= 0:
+        return b""
+    return format(rng.getrandbits(pocet), f"0{pocet}b").encode("ascii").translate(_NA_HODY)
+
+
+def p_hodnota_z(z):
+    # oboustranna p-hodnota normalniho rozdeleni
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def nejdelsi_beh(blok, hodnota):
+    # delka nejdelsiho behu hodnoty v bloku - puleni intervalu nad hledanim podretezce,
+    # takze jen O(log delky) pruchodu blokem v C a zadne mezivysledky
+    znak = bytes([hodnota])
+    if znak not in blok:
+        return 0
+    dolni, horni = 1, 2
+    while znak * horni in blok:
+        dolni, horni = horni, horni * 2
+    while horni - dolni > 1:
+        stred = (dolni + horni) // 2
+        if znak * stred in blok:
+            dolni = stred
+        else:
+            horni = stred
+    return dolni
+
+
+class StatistikaHodu:
+    def __init__(self):
+        self.pocet = 0
+        self.hlavy = 0
+        self.behy = 0
+        self.prvni = None
+        self.posledni = None
+        self.uvodni_beh = 0  # delka behu, kterym posloupnost zacina
+        self.koncovy_beh = 0  # delka behu, kterym posloupnost konci
+        self.nejdelsi = [0, 0]  # nejdelsi beh hlav a orlu
+
+    @property
+    def orly(self):
+        return self.pocet - self.hlavy
+
+    @classmethod
+    def z_bloku(cls, blok):
+        stat = cls()
+        stat.pridej(blok)
+        return stat
+
+    def pridej(self, blok):
+        # zapocita dalsi blok hodu (bytes/bytearray 0/1 nebo iterovatelne hodnoty 0/1)
+        blok = bytes(blok)
+        if not blok:
+            return self
+        if blok.translate(None, b"\x00\x01"):
+            raise ValueError("Hody musi mit hodnoty 0 nebo 1")
+        cast = StatistikaHodu()
+        cast.pocet = len(blok)
+        cast.hlavy = blok.count(0)
+        # vzory 01 a 10 se samy se sebou neprekryvaji, takze count() najde kazdou zmenu strany
+        cast.behy = blok.count(b"\x00\x01") + blok.count(b"\x01\x00") + 1
+        cast.prvni, cast.posledni = blok[0], blok[-1]
+        konec = blok.find(1 - blok[0])
+        cast.uvodni_beh = len(blok) if konec < 0 else konec
+        cast.koncovy_beh = len(blok) - 1 - blok.rfind(1 - blok[-1])
+        cast.nejdelsi = [nejdelsi_beh(blok, 0), nejdelsi_beh(blok, 1)]
+        return self.spoj(cast)
+
+    def spoj(self, dalsi):
+        # pripoji statistiku hodu, ktere nasleduji po hodech teto statistiky
+        if not dalsi.pocet:
+            return self
+        if not self.pocet:
+            self.__dict__.update(dalsi.__dict__, nejdelsi=list(dalsi.nejdelsi))
+            return self
+        navazuje = self.posledni == dalsi.prvni
+        self.nejdelsi = [max(a, b) for a, b in zip(self.nejdelsi, dalsi.nejdelsi)]
+        if navazuje:
+            spojeny = self.koncovy_beh + dalsi.uvodni_beh
+            self.nejdelsi[dalsi.prvni] = max(self.nejdelsi[dalsi.prvni], spojeny)
+            if self.uvodni_beh == self.pocet:
+                self.uvodni_beh = spojeny
+            self.koncovy_beh = spojeny if dalsi.koncovy_beh == dalsi.pocet else dalsi.koncovy_beh
+        else:
+            self.koncovy_beh = dalsi.koncovy_beh
+        self.behy += dalsi.behy - navazuje
+        self.pocet += dalsi.pocet
+        self.hlavy += dalsi.hlavy
+        self.posledni = dalsi.posledni
+        return self
+
+    @classmethod
+    def spoj_casti(cls, casti):
+        # spoji vysledky paralelnich pracovniku v poradi jejich casti
+        celkem = cls()
+        for cast in casti:
+            celkem.spoj(cast)
+        return celkem
+
+    def chi_kvadrat(self):
+        # (statistika, p-hodnota) testu shody s rovnomernym rozdelenim, 1 stupen volnosti
+        if not self.pocet:
+            return None, None
+        chi2 = (self.hlavy - self.orly) ** 2 / self.pocet
+        return chi2, math.erfc(math.sqrt(chi2 / 2))
+
+    def test_behu(self):
+        # (z, p-hodnota) Waldova-Wolfowitzova testu behu; None, kdyz chybi hlavy nebo orly
+        n1, n2, n = self.hlavy, self.orly, self.pocet
+        if not n1 or not n2:
+            return None, None
+        stredni = 2 * n1 * n2 / n + 1
+        rozptyl = (stredni - 1) * (stredni - 2) / (n - 1)
+        if rozptyl <= 0:
+            return None, None
+        z = (self.behy - stredni) / math.sqrt(rozptyl)
+        return z, p_hodnota_z(z)
+
+    def souhrn(self):
+        chi2, p_chi2 = self.chi_kvadrat()
+        z, p_behy = self.test_behu()
+        return {
+            "hodu": self.pocet,
+            strana_mince(0): self.hlavy,
+            strana_mince(1): self.orly,
+            "behu": self.behy,
+            "nejdelsi_" + strana_mince(0): self.nejdelsi[0],
+            "nejdelsi_" + strana_mince(1): self.nejdelsi[1],
+            "chi2": chi2,
+            "p_chi2": p_chi2,
+            "z_behu": z,
+            "p_behu": p_behy,
+        }
+
+
+def main(pocet=1_000_000, velikost_bloku=1 << 16):
+    stat = StatistikaHodu()
+    zbyva = pocet
+    while zbyva > 0:
+        stat.pridej(hody(min(velikost_bloku, zbyva)))
+        zbyva -= velikost_bloku
+    for klic, hodnota in stat.souhrn().items():
+        print(f"{klic}: {hodnota}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
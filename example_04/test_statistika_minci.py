@@ -0,0 +1,102 @@
+"""
+Pytest suite for statistika_minci.py - streaming statistics of coin flips.
+
+Tests cover:
+- counts, runs and longest runs against a direct computation on the whole sequence
+- the same results for any split into blocks and for merged partial results
+- chi-square and runs-test p-values on biased, alternating and random sequences
+"""
+
+import itertools
+import random
+
+import pytest
+
+import statistika_minci as sm
+
+
+def naive(flips):
+    groups = [(value, len(list(run))) for value, run in itertools.groupby(flips)]
+    longest = [max((length for value, length in groups if value == side), default=0) for side in (0, 1)]
+    return {"pocet": len(flips), "hlavy": flips.count(0), "behy": len(groups), "nejdelsi": longest}
+
+
+def summary(stat):
+    return {"pocet": stat.pocet, "hlavy": stat.hlavy, "behy": stat.behy, "nejdelsi": stat.nejdelsi}
+
+
+def random_split(flips, rng):
+    cuts = sorted(rng.sample(range(1, len(flips)), rng.randint(0, min(8, len(flips) - 1))))
+    return [flips[a:b] for a, b in zip([0] + cuts, cuts + [len(flips)])]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_blocks_match_whole_sequence(seed):
+    rng = random.Random(seed)
+    flips = [rng.randint(0, 1) if rng.random() < 0.7 else 1 for _ in range(rng.randint(1, 200))]
+    stat = sm.StatistikaHodu()
+    for block in random_split(flips, rng):
+        stat.pridej(block)
+    assert summary(stat) == naive(flips)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_merged_parts_match_whole_sequence(seed):
+    rng = random.Random(seed)
+    flips = [rng.choice((0, 0, 1)) for _ in range(rng.randint(2, 200))]
+    parts = [sm.StatistikaHodu.z_bloku(part) for part in random_split(flips, rng)]
+    assert summary(sm.StatistikaHodu.spoj_casti(parts)) == naive(flips)
+
+
+def test_runs_spanning_all_blocks():
+    stat = sm.StatistikaHodu()
+    for block in ([1, 1], [1], [1, 1, 1], [0], [0, 0]):
+        stat.pridej(block)
+    assert summary(stat) == naive([1, 1, 1, 1, 1, 1, 0, 0, 0])
+    assert stat.uvodni_beh == 6 and stat.koncovy_beh == 3
+
+
+def test_invalid_values_and_empty_blocks():
+    stat = sm.StatistikaHodu().pridej(b"")
+    assert stat.pocet == 0 and stat.chi_kvadrat() == (None, None) and stat.test_behu() == (None, None)
+    with pytest.raises(ValueError):
+        stat.pridej([0, 2])
+
+
+def test_hody_are_zeros_and_ones():
+    flips = sm.hody(1000, random.Random(1))
+    assert len(flips) == 1000 and set(flips) == {0, 1}
+    assert sm.hody(0) == b""
+
+
+def test_fair_random_stream_passes():
+    stat = sm.StatistikaHodu()
+    rng = random.Random(7)
+    for _ in range(10):
+        stat.pridej(sm.hody(10_000, rng))
+    assert stat.chi_kvadrat()[1] > 0.001
+    assert stat.test_behu()[1] > 0.001
+
+
+def test_biased_and_alternating_streams_fail():
+    biased = sm.StatistikaHodu.z_bloku([0] * 600 + [1] * 400)
+    assert biased.chi_kvadrat()[1] < 1e-9
+    alternating = sm.StatistikaHodu.z_bloku([0, 1] * 500)
+    assert alternating.chi_kvadrat() == (0.0, 1.0)
+    z, p = alternating.test_behu()
+    assert z > 0 and p < 1e-9
+
+
+def test_runs_test_value():
+    # n1 = n2 = 5, R = 4: mean 6, variance 20/9
+    z, p = sm.StatistikaHodu.z_bloku([0, 0, 1, 1, 1, 0, 0, 0, 1, 1]).test_behu()
+    assert z == pytest.approx(-2 / (20 / 9) ** 0.5)
+    assert p == pytest.approx(0.1797, abs=1e-3)
+
+
+def test_souhrn_uses_coin_side_names(capsys):
+    stat = sm.StatistikaHodu.z_bloku([0, 1, 1])
+    result = stat.souhrn()
+    assert result["hlava"] == 1 and result["orel"] == 2 and result["nejdelsi_orel"] == 2
+    sm.main(1000, 128)
+    assert "hodu: 1000" in capsys.readouterr().out
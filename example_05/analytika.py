@@ -0,0 +1,47 @@
+import heapq
+from collections import Counter
+
+
+class Analytika:  # třída pro průběžné souhrny objednávek v kavárně
+    def __init__(self):  # konstruktor třídy Analytika
+        self.pocty = Counter()  # počet prodaných kusů podle nápoje
+        self.trzby = Counter()  # tržba v Kč podle nápoje
+        self.utraty = Counter()  # celková útrata v Kč podle jména zákazníka
+        self.podle_nalady = Counter()  # počty objednávek podle (nálada před objednávkou, nápoj)
+        self.prechody_nalady = Counter()  # počty přechodů nálady (před, po)
+        self.odmitnuto = Counter()  # počet objednávek nápojů, které nejsou v nabídce
+        self.celkem_objednavek = 0  # počet úspěšných objednávek
+        self.celkova_trzba = 0  # celková tržba v Kč
+
+    def zaznamenej(self, jmeno: str, napoj: str, cena: int, nalada_pred: bool, nalada_po: bool):  # metoda pro započtení jedné úspěšné objednávky - O(1)
+        self.pocty[napoj] += 1
+        self.trzby[napoj] += cena
+        self.utraty[jmeno] += cena
+        self.podle_nalady[(nalada_pred, napoj)] += 1
+        self.prechody_nalady[(nalada_pred, nalada_po)] += 1
+        self.celkem_objednavek += 1
+        self.celkova_trzba += cena
+
+    def zaznamenej_odmitnuti(self, napoj: str):  # metoda pro započtení objednávky nápoje mimo nabídku - O(1)
+        self.odmitnuto[napoj] += 1
+
+    def nejprodavanejsi(self, k: int = 3):  # k nápojů s nejvíce prodanými kusy - haldou, bez řazení celé historie
+        return heapq.nlargest(k, self.pocty.items(), key=lambda polozka: polozka[1])
+
+    def nejvyssi_trzby(self, k: int = 3):  # k nápojů s nejvyšší tržbou
+        return heapq.nlargest(k, self.trzby.items(), key=lambda polozka: polozka[1])
+
+    def nejlepsi_zakaznici(self, k: int = 3):  # k zákazníků s nejvyšší útratou
+        return heapq.nlargest(k, self.utraty.items(), key=lambda polozka: polozka[1])
+
+    def napoje_podle_nalady(self, nalada: bool):  # kolik kusů kterého nápoje objednali zákazníci v dané náladě
+        return {napoj: pocet for (pred, napoj), pocet in self.podle_nalady.items() if pred is nalada}
+
+    def souhrn(self):  # metoda pro výpis souhrnu jako dictionary - např. pro dashboard
+        return {
+            "objednavek": self.celkem_objednavek,
+            "trzba": self.celkova_trzba,
+            "pocty": dict(self.pocty),
+            "trzby": dict(self.trzby),
+            "odmitnuto": dict(self.odmitnuto),
+        }
@@ -0,0 +1,113 @@
+import bisect
+import random
+import time
+from array import array
+
+
+HALERU_V_KC = 100  # ceny se počítají v celých haléřích - žádný float ani Decimal
+CELA_SLEVA_BP = 10_000  # 100 % v bazických bodech
+
+
+class CenovyEngine:  # třída pro hromadný výpočet cen řádků účtenky se slevami
+    def __init__(self, nabidka: dict, mnozstevni_slevy: dict = None, happy_hour: tuple = None,
+                 vernostni_sleva_bp: int = 0):  # konstruktor - pravidla se hned "zkompilují" do tabulek
+        self.napoje = list(nabidka)  # pořadí nápojů = jejich index v dávce
+        self.index_napoje = {napoj: i for i, napoj in enumerate(self.napoje)}
+        self.ceny = array("q", (nabidka[napoj] * HALERU_V_KC for napoj in self.napoje))  # ceny za kus v haléřích
+        mnozstevni_slevy = mnozstevni_slevy or {}  # {od kolika kusů: sleva v bp}
+        self.prahy = sorted(mnozstevni_slevy)
+        self.slevy_prahu = [0] + [mnozstevni_slevy[prah] for prah in self.prahy]  # index = počet překročených prahů
+        od, do, sleva_bp = happy_hour or (0, 0, 0)  # (od hodiny, do hodiny, sleva v bp); od > do = přes půlnoc
+        if not (0 <= od <= 23 and 0 <= do <= 24):
+            raise ValueError(f"Happy hour musí být v hodinách 0-24, ne {od}-{do}")
+        self.slevy_hodin = [sleva_bp if (od <= hodina < do if od <= do else hodina >= od or hodina < do) else 0
+                            for hodina in range(24)]
+        self.vernostni_sleva_bp = vernostni_sleva_bp
+
+    def indexy(self, napoje):  # převod názvů nápojů na indexy pro dávku
+        try:
+            return array("q", (self.index_napoje[napoj] for napoj in napoje))
+        except KeyError as chyba:
+            raise ValueError(f"Nápoj {chyba.args[0]} není v nabídce") from None
+
+    def cena(self, napoj: str, kusu: int = 1, hodina: int = 12, verny: bool = False):  # cena jednoho řádku v haléřích
+        return self.spocitej(self.indexy([napoj]), [kusu], [hodina], [verny], pouzit_numpy=False)[0]
+
+    def spocitej(self, napoje, kusy, hodiny, verni, pouzit_numpy: bool = None):  # ceny řádků v haléřích pro celou dávku
+        if pouzit_numpy is None or pouzit_numpy:
+            try:
+                import numpy  # volitelná závislost - načte se až při první dávce
+            except ImportError:
+                if pouzit_numpy:
+                    raise
+            else:
+                return self._spocitej_numpy(numpy, napoje, kusy, hodiny, verni)
+        _over_delky(napoje, kusy, hodiny, verni)  # zip by skončil u nejkratšího sloupce a zbytek by tiše stál 0
+        vysledek = array("q", bytes(8 * len(napoje)))
+        ceny, prahy, slevy_prahu, slevy_hodin = self.ceny, self.prahy, self.slevy_prahu, self.slevy_hodin
+        vernostni = self.vernostni_sleva_bp
+        for i, (napoj, kusu, hodina, verny) in enumerate(zip(napoje, kusy, hodiny, verni)):
+            if not 0 <= napoj < len(ceny) or kusu < 0 or not 0 <= hodina < 24:  # záporný index by tiše vzal jinou položku
+                _over_radek(napoj, kusu, hodina, len(ceny))
+            radek = ceny[napoj] * kusu
+            sleva = slevy_prahu[bisect.bisect_right(prahy, kusu)] + slevy_hodin[hodina] + (vernostni if verny else 0)
+            if sleva > CELA_SLEVA_BP:
+                sleva = CELA_SLEVA_BP
+            vysledek[i] = radek - (radek * sleva + CELA_SLEVA_BP // 2) // CELA_SLEVA_BP  # zaokrouhlení slevy na celý haléř
+        return vysledek
+
+    def _spocitej_numpy(self, np, napoje, kusy, hodiny, verni):  # stejný výpočet jako spocitej(), ale po sloupcích v int64
+        napoje = np.asarray(napoje, dtype=np.int64)
+        kusy = np.asarray(kusy, dtype=np.int64)
+        hodiny = np.asarray(hodiny, dtype=np.int64)
+        verni = np.asarray(verni, dtype=bool)
+        _over_delky(napoje, kusy, hodiny, verni)
+        if len(napoje) and (napoje.min() < 0 or napoje.max() >= len(self.ceny) or kusy.min() < 0
+                            or hodiny.min() < 0 or hodiny.max() > 23):
+            spatny = np.flatnonzero((napoje < 0) | (napoje >= len(self.ceny)) | (kusy < 0) | (hodiny < 0) | (hodiny > 23))[0]
+            _over_radek(int(napoje[spatny]), int(kusy[spatny]), int(hodiny[spatny]), len(self.ceny))
+        radky = np.asarray(self.ceny, dtype=np.int64)[napoje] * kusy
+        sleva = (np.asarray(self.slevy_prahu, dtype=np.int64)[np.searchsorted(np.asarray(self.prahy, dtype=np.int64), kusy, side="right")]
+                 + np.asarray(self.slevy_hodin, dtype=np.int64)[hodiny]
+                 + np.where(verni, self.vernostni_sleva_bp, 0))
+        np.minimum(sleva, CELA_SLEVA_BP, out=sleva)
+        return radky - (radky * sleva + CELA_SLEVA_BP // 2) // CELA_SLEVA_BP
+
+
+def _over_delky(napoje, kusy, hodiny, verni):  # vyhodí ValueError, pokud sloupce dávky nejsou stejně dlouhé
+    delky = (len(napoje), len(kusy), len(hodiny), len(verni))
+    if len(set(delky)) > 1:
+        raise ValueError(f"Sloupce dávky musí být stejně dlouhé (nápoje, kusy, hodiny, věrní): {delky}")
+
+
+def _over_radek(napoj: int, kusu: int, hodina: int, pocet_napoju: int):  # vyhodí ValueError s popisem chybného řádku
+    if not 0 <= napoj < pocet_napoju:
+        raise ValueError(f"Neplatný index nápoje: {napoj}")
+    if kusu < 0:
+        raise ValueError(f"Počet kusů nesmí být záporný: {kusu}")
+    if not 0 <= hodina < 24:
+        raise ValueError(f"Hodina musí být 0-23, ne {hodina}")
+
+
+def benchmark(pocet: int = 1_000_000, seed: int = 0):  # propustnost obou cest v řádcích za sekundu
+    nabidka = {"káva": 30, "čaj": 25, "espresso": 35}
+    engine = CenovyEngine(nabidka, {3: 500, 10: 1_000}, (14, 16, 2_000), 300)
+    rng = random.Random(seed)
+    napoje = array("q", (rng.randrange(len(nabidka)) for _ in range(pocet)))
+    kusy = array("q", (rng.randint(1, 12) for _ in range(pocet)))
+    hodiny = array("q", (rng.randrange(24) for _ in range(pocet)))
+    verni = [rng.random() < 0.3 for _ in range(pocet)]
+    vysledky = {}
+    for nazev, pouzit_numpy in (("python", False), ("numpy", True)):
+        try:
+            zacatek = time.perf_counter()
+            engine.spocitej(napoje, kusy, hodiny, verni, pouzit_numpy=pouzit_numpy)
+            vysledky[nazev] = pocet / (time.perf_counter() - zacatek)
+        except ImportError:
+            vysledky[nazev] = None
+    return vysledky
+
+
+if __name__ == "__main__":   # spuštění benchmarku
+    for nazev, za_sekundu in benchmark().items():
+        print(f"{nazev}: " + ("není k dispozici" if za_sekundu is None else f"{za_sekundu:,.0f} řádků/s"))
@@ -0,0 +1,195 @@
+import os
+import time
+import zlib
+from collections import Counter
+from contextlib import redirect_stdout
+
+from kavarna import Kavarna, Osoba
+
+
+def cislo_oddilu(kavarna_id, pocet_oddilu: int):  # stabilní přiřazení kavárny do oddílu - stejné ve všech procesech
+    return zlib.crc32(str(kavarna_id).encode("utf-8")) % pocet_oddilu
+
+
+class _Oddil:  # stav jednoho procesu (oddílu), který drží své kavárny
+    def __init__(self):
+        self.kavarny = {}  # kavárny tohoto oddílu podle id - dictionary !!!
+        self.zakaznici = {}  # zákazníci podle (id kavárny, jméno) - aby objednávka nemusela procházet seznam
+        self.objednavek = 0  # počet zpracovaných objednávek
+        self.cas_objednavek = 0.0  # čas strávený zpracováním objednávek v sekundách
+
+    def kavarna(self, kavarna_id):
+        if kavarna_id not in self.kavarny:
+            raise KeyError(f"Neznámá kavárna: {kavarna_id!r}")
+        return self.kavarny[kavarna_id]
+
+    def proved(self, prikaz: str, argumenty):  # provede jeden příkaz a vrátí odpověď
+        if prikaz == "pridat_kavarnu":
+            kavarna_id, nazev, adresa = argumenty
+            self.kavarny[kavarna_id] = Kavarna(nazev, adresa)
+        elif prikaz == "pridat_zakaznika":
+            kavarna_id, osoba = argumenty
+            self.kavarna(kavarna_id).pridat_zakaznika(osoba)
+            self.zakaznici[(kavarna_id, osoba.jmeno)] = osoba
+        elif prikaz == "objednej":  # dávka objednávek (kavarna_id, jmeno, napoj)
+            zacatek = time.perf_counter()
+            try:
+                for kavarna_id, jmeno, napoj in argumenty:
+                    kavarna = self.kavarna(kavarna_id)
+                    osoba = self.zakaznici.get((kavarna_id, jmeno))
+                    if osoba is None:  # neznámý zákazník se přidá s výchozími údaji
+                        osoba = Osoba(jmeno, napoj, False)
+                        kavarna.pridat_zakaznika(osoba)
+                        self.zakaznici[(kavarna_id, jmeno)] = osoba
+                    kavarna.objednej_napoj(osoba, napoj)
+                    self.objednavek += 1
+            finally:
+                self.cas_objednavek += time.perf_counter() - zacatek
+        elif prikaz == "najdi":
+            return [kavarna_id for kavarna_id in self.kavarny if (kavarna_id, argumenty) in self.zakaznici]
+        elif prikaz == "prodeje":
+            celkem = Counter()
+            for kavarna in self.kavarny.values():
+                celkem.update(kavarna.analytika.pocty)
+            return celkem
+        elif prikaz == "statistiky":
+            return len(self.kavarny), self.objednavek, self.cas_objednavek
+        else:
+            raise ValueError(f"Neznámý příkaz: {prikaz!r}")
+        return None
+
+
+def _beh_oddilu(spojeni):  # smyčka jednoho procesu (oddílu) - chyba příkazu se vrátí rodiči, proces běží dál
+    oddil = _Oddil()
+    with open(os.devnull, "w") as nikam, redirect_stdout(nikam):  # výpisy kavárny se v oddílu zahazují
+        while True:
+            try:
+                prikaz, argumenty = spojeni.recv()
+            except EOFError:  # rodič skončil
+                break
+            if prikaz == "konec":
+                break
+            try:
+                odpoved = ("ok", oddil.proved(prikaz, argumenty))
+            except Exception as chyba:
+                odpoved = ("chyba", chyba)
+            try:
+                spojeni.send(odpoved)
+            except Exception as chyba:  # výjimka nebo výsledek nejde přenést (pickle)
+                spojeni.send(("chyba", RuntimeError(f"{type(chyba).__name__}: {chyba}")))
+
+
+class Federace:  # třída pro síť kaváren rozdělenou do oddílů v samostatných procesech
+    def __init__(self, pocet_oddilu: int = 4):  # konstruktor třídy Federace
+        self.pocet_oddilu = pocet_oddilu
+        self.spojeni = []  # roury k jednotlivým oddílům - list !!!
+        self.procesy = []
+        self.kavarny = set()  # id založených kaváren - objednávka do neznámé se odmítne hned tady
+        import multiprocessing  # načte se až při založení federace - import kavárny zůstane rychlý
+        for _ in range(pocet_oddilu):
+            nase, jejich = multiprocessing.Pipe()
+            proces = multiprocessing.Process(target=_beh_oddilu, args=(jejich,), daemon=True)
+            proces.start()
+            self.spojeni.append(nase)
+            self.procesy.append(proces)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.ukoncit()
+
+    def _posli(self, zpravy):  # zprávy {číslo oddílu: zpráva}; vrací oddíly, kterým zprávu nešlo poslat
+        neodeslano = set()
+        for cislo, zprava in zpravy.items():
+            try:
+                self.spojeni[cislo].send(zprava)
+            except OSError:  # roura je přerušená (BrokenPipeError) - oddíl skončil
+                neodeslano.add(cislo)
+        return neodeslano
+
+    def _odpovedi(self, cisla, neodeslano=()):  # přečte odpovědi oddílů; chybu vyhodí až po přečtení všech, aby roury zůstaly v synchronu
+        vysledky = []
+        chyba = None
+        for cislo in cisla:
+            try:
+                if cislo in neodeslano:
+                    raise EOFError
+                stav, hodnota = self.spojeni[cislo].recv()
+            except EOFError:
+                stav, hodnota = "chyba", RuntimeError(f"Oddíl {cislo} neodpovídá (proces skončil)")
+            if stav == "chyba":
+                chyba = chyba or hodnota
+            vysledky.append(hodnota)
+        if chyba is not None:
+            raise chyba
+        return vysledky
+
+    def _dotaz(self, cislo: int, prikaz: str, argumenty=None):  # dotaz na jeden oddíl
+        return self._odpovedi([cislo], self._posli({cislo: (prikaz, argumenty)}))[0]
+
+    def _rozeslat(self, prikaz: str, argumenty=None):  # scatter-gather - nejdřív rozeslat všem, pak sbírat odpovědi
+        cisla = range(len(self.spojeni))
+        return self._odpovedi(cisla, self._posli({cislo: (prikaz, argumenty) for cislo in cisla}))
+
+    def _over_kavarnu(self, kavarna_id):
+        if kavarna_id not in self.kavarny:
+            raise KeyError(f"Neznámá kavárna: {kavarna_id!r}")
+
+    def pridat_kavarnu(self, kavarna_id, nazev: str, adresa: str):  # metoda pro založení pobočky v jejím oddílu
+        self._dotaz(cislo_oddilu(kavarna_id, self.pocet_oddilu), "pridat_kavarnu", (kavarna_id, nazev, adresa))
+        self.kavarny.add(kavarna_id)
+
+    def pridat_zakaznika(self, kavarna_id, osoba: Osoba):  # metoda pro přidání zákazníka do pobočky
+        self._over_kavarnu(kavarna_id)
+        self._dotaz(cislo_oddilu(kavarna_id, self.pocet_oddilu), "pridat_zakaznika", (kavarna_id, osoba))
+
+    def objednej(self, kavarna_id, jmeno: str, napoj: str):  # metoda pro jednu objednávku - směrováno podle id kavárny
+        self.objednej_davku([(kavarna_id, jmeno, napoj)])
+
+    def objednej_davku(self, objednavky):  # metoda pro dávku objednávek (kavarna_id, jmeno, napoj) - jedna zpráva na oddíl
+        objednavky = list(objednavky)
+        for objednavka in objednavky:  # celá dávka se ověří dřív, než se cokoli odešle
+            self._over_kavarnu(objednavka[0])
+        davky = [[] for _ in range(self.pocet_oddilu)]
+        for objednavka in objednavky:
+            davky[cislo_oddilu(objednavka[0], self.pocet_oddilu)].append(objednavka)
+        pouzite = [cislo for cislo, davka in enumerate(davky) if davka]
+        self._odpovedi(pouzite, self._posli({cislo: ("objednej", davky[cislo]) for cislo in pouzite}))
+
+    def najdi_zakaznika(self, jmeno: str):  # id všech poboček, kde je zákazník daného jména
+        nalezeno = []
+        for vysledek in self._rozeslat("najdi", jmeno):
+            nalezeno.extend(vysledek)
+        return nalezeno
+
+    def prodeje_celkem(self):  # prodané kusy podle nápoje za všechny pobočky
+        celkem = Counter()
+        for vysledek in self._rozeslat("prodeje"):
+            celkem.update(vysledek)
+        return celkem
+
+    def propustnost(self):  # statistiky oddílů: počet kaváren, objednávek a objednávek za sekundu
+        statistiky = []
+        for kavaren, objednavek, cas in self._rozeslat("statistiky"):
+            statistiky.append({
+                "kavaren": kavaren,
+                "objednavek": objednavek,
+                "objednavek_za_s": objednavek / cas if cas else 0.0,
+            })
+        return statistiky
+
+    def ukoncit(self):  # metoda pro ukončení všech procesů - snese i oddíl, který už skončil
+        for spojeni, proces in zip(self.spojeni, self.procesy):
+            if proces.is_alive():
+                try:
+                    spojeni.send(("konec", None))
+                except OSError:  # roura je přerušená (BrokenPipeError) - proces končí sám
+                    pass
+            proces.join(5)
+            if proces.is_alive():
+                proces.terminate()
+                proces.join()
+            spojeni.close()
+        self.spojeni = []
+        self.procesy = []
@@ -0,0 +1,126 @@
+import argparse
+import csv
+import json
+import time
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+
+from kavarna import Kavarna, Osoba
+
+
+VELIKOST_DAVKY = 10_000  # kolik řádků souboru se zpracuje najednou
+SLOUPCE_VYSLEDKU = ["radek", "jmeno", "napoj", "stav", "cena", "duvod"]
+
+
+def _radky_csv(soubor):  # (číslo řádku, jméno, nápoj) nebo (číslo řádku, None, důvod chyby) z CSV s hlavičkou jmeno,napoj
+    ctenar = csv.DictReader(soubor)
+    if not {"jmeno", "napoj"} <= set(ctenar.fieldnames or ()):
+        raise ValueError("CSV soubor musí mít sloupce jmeno a napoj")
+    for zaznam in ctenar:
+        jmeno, napoj = (zaznam["jmeno"] or "").strip(), zaznam["napoj"]  # "Eva " je stejný zákazník jako "Eva"
+        if not jmeno or napoj is None:
+            yield ctenar.line_num, None, "chybny_radek"
+        else:
+            yield ctenar.line_num, jmeno, napoj
+
+
+def _radky_jsonl(soubor):  # totéž z JSON Lines - jeden objekt {"jmeno": ..., "napoj": ...} na řádek
+    for cislo, radek in enumerate(soubor, 1):
+        if not radek.strip():
+            continue
+        try:
+            zaznam = json.loads(radek)
+            jmeno, napoj = zaznam["jmeno"], zaznam["napoj"]
+        except (ValueError, TypeError, KeyError):
+            yield cislo, None, "chybny_radek"
+            continue
+        if not isinstance(jmeno, str) or not jmeno.strip() or not isinstance(napoj, str):
+            yield cislo, None, "chybny_radek"
+        else:
+            yield cislo, jmeno.strip(), napoj
+
+
+def cti_davky(soubor, format: str, velikost_davky: int = VELIKOST_DAVKY):  # proud objednávek po dávkách - soubor se nikdy nenačte celý
+    radky = _radky_csv(soubor) if format == "csv" else _radky_jsonl(soubor)
+    while True:
+        davka = list(islice(radky, velikost_davky))
+        if not davka:
+            return
+        yield davka
+
+
+def format_souboru(cesta):  # formát podle přípony: .csv, jinak JSON Lines
+    return "csv" if Path(cesta).suffix.lower() == ".csv" else "jsonl"
+
+
+def importuj(kavarna: Kavarna, vstup, vystup, format: str = None,
+             velikost_davky: int = VELIKOST_DAVKY, relace=None):  # hromadný import objednávek ze souboru - vrací report jako dictionary
+    # relace: volitelný SpravceRelaci - zákazníci se pak hledají přes něj a odložení se načtou z disku
+    format = format or format_souboru(vstup)
+    if relace is None:
+        zakaznici = {osoba.jmeno: osoba for osoba in kavarna.zakaznici}  # zákazníci podle jména - dictionary !!!
+
+        def pridej(osoba):
+            kavarna.pridat_zakaznika(osoba)
+            zakaznici[osoba.jmeno] = osoba
+
+        najdi = zakaznici.get
+    else:
+        najdi, pridej = relace.zakaznik, relace.pridat_zakaznika
+    duvody = Counter()  # důvody odmítnutí
+    radku = prijato = novych = 0
+    zacatek = time.perf_counter()
+    # utf-8-sig: soubory exportované z Excelu a pokladen často začínají BOM, který by rozbil hlavičku CSV
+    with open(vstup, encoding="utf-8-sig", newline="") as soubor, open(vystup, "w", encoding="utf-8", newline="") as vysledky:
+        zapis = csv.writer(vysledky)
+        zapis.writerow(SLOUPCE_VYSLEDKU)
+        for davka in cti_davky(soubor, format, velikost_davky):
+            radky_vysledku = []
+            for cislo, jmeno, napoj in davka:
+                if jmeno is None:  # řádek nejde přečíst - u napoj je důvod
+                    duvody[napoj] += 1
+                    radky_vysledku.append((cislo, "", "", "odmitnuto", "", napoj))
+                    continue
+                vyber = napoj.lower().strip()  # stejná normalizace jako u interaktivní objednávky
+                osoba = najdi(jmeno)
+                if osoba is None:  # neznámý zákazník se přidá s výchozími údaji - oblíbený nápoj jen z nabídky
+                    osoba = Osoba(jmeno, vyber if vyber in kavarna.nabidka else None, False)
+                    pridej(osoba)
+                    novych += 1
+                if kavarna.zpracuj_vyber(osoba, vyber):
+                    prijato += 1
+                    radky_vysledku.append((cislo, jmeno, vyber, "prijato", kavarna.nabidka[vyber], ""))
+                else:
+                    duvody["nedostupny_napoj"] += 1
+                    radky_vysledku.append((cislo, jmeno, vyber, "odmitnuto", "", "nedostupny_napoj"))
+            radku += len(davka)
+            zapis.writerows(radky_vysledku)
+    sekund = time.perf_counter() - zacatek
+    return {
+        "radku": radku,
+        "prijato": prijato,
+        "odmitnuto": radku - prijato,
+        "duvody_odmitnuti": dict(duvody),
+        "novych_zakazniku": novych,
+        "sekund": sekund,
+        "objednavek_za_s": radku / sekund if sekund else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hromadný import objednávek z pokladen (CSV nebo JSON Lines)")
+    parser.add_argument("vstup", help="soubor s objednávkami (.csv se sloupci jmeno,napoj, jinak JSON Lines)")
+    parser.add_argument("vystup", help="CSV soubor s výsledkem každé objednávky")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="formát vstupu (výchozí podle přípony)")
+    parser.add_argument("--davka", type=int, default=VELIKOST_DAVKY, help="počet řádků zpracovaných najednou")
+    args = parser.parse_args()
+
+    kavarna = Kavarna("Cafe Praha", "Náměstí 1, Praha")
+    report = importuj(kavarna, args.vstup, args.vystup, args.format, args.davka)
+    for klic, hodnota in report.items():
+        print(f"{klic}: {hodnota}")
+
+
+if __name__ == "__main__":   # spuštění hlavní funkce
+    main()
@@ -1,3 +1,7 @@
+from analytika import Analytika
+from nalada import HistorieNalady
+
+
 class Osoba:  # třída pro osobu
     def __init__(self, jmeno:str, oblibeny_napoj:str, nalada:bool):  # konstruktor třídy Osoba
         self.jmeno = jmeno  # jméno osoby
@@ -12,6 +16,8 @@ class Kavarna:  # třída pro kavárnu
         self.adresa = adresa  # adresa kavárny
         self.zakaznici = []  # seznam zákazníků v kavárně - list !!!
         self.nabidka = {"káva": 30, "čaj": 25, "espresso": 35}  # nabídka nápojů s cenami - dictionary !!!
+        self.analytika = Analytika()  # průběžné souhrny prodejů
+        self.historie_nalad = {}  # historie nálady podle jména zákazníka - dictionary !!! (jména zákazníků musí být jedinečná)
 
     def pridat_zakaznika(self, osoba: Osoba):  # metoda pro přidání zákazníka do kavárny
         self.zakaznici.append(osoba)  # přidání osoby do seznamu zákazníků - na konec listu
@@ -20,13 +26,22 @@ class Kavarna:  # třída pro kavárnu
         for osoba in self.zakaznici:
             osoba.print_info()
     
+    def historie_nalady(self, osoba: Osoba):  # metoda pro získání (případně založení) historie nálady zákazníka
+        # Historie je podle jména - dvě osoby se stejným jménem by sdílely jednu historii, proto musí být
+        # jména jedinečná (stejně jako u SpravceRelaci). Historie drží jen posledních HistorieNalady.max_udalosti událostí.
+        if osoba.jmeno not in self.historie_nalad:
+            self.historie_nalad[osoba.jmeno] = HistorieNalady(osoba.nalada)
+        return self.historie_nalad[osoba.jmeno]
+
     def objednej_napoj(self, osoba: Osoba, napoj: str):  # metoda pro objednání nápoje
         if napoj in self.nabidka:  # kontrola, zda je nápoj v nabídce - v dictionary
             cena = self.nabidka[napoj]
             print(f"{osoba.jmeno} si objednal(a) {napoj} za {cena} Kč.")
+            self.analytika.zaznamenej(osoba.jmeno, napoj, cena, osoba.nalada, osoba.nalada)  # nálada se zde nemění
             nalada_text = "šťastná" 
             print(f"Nálada zákazníka {osoba.jmeno} je nyní {nalada_text}.")
         else:
+            self.analytika.zaznamenej_odmitnuti(napoj)
             print(f"Promiňte, {napoj} není v nabídce.")
 
     def objednej_napoj_od_uzivatele(self, osoba: Osoba):  # metoda pro interaktivní objednání nápoje od uživatele
@@ -37,16 +52,24 @@ class Kavarna:  # třída pro kavárnu
         
         vyber = input("Zadejte název nápoje: ").lower().strip()
         
-        if vyber in self.nabidka:  # kontrola, zda je nápoj v nabídce - v dictionary
+        if self.zpracuj_vyber(osoba, vyber):  # kontrola nabídky, analytika a nálada - bez výpisů
             cena = self.nabidka[vyber]   # získání ceny z dictionary
             print(f"\n{osoba.jmeno} si objednal(a) {vyber} za {cena} Kč.")
-            osoba.nalada = True  # nálada se zlepší po objednání
             print(f"Nálada zákazníka {osoba.jmeno} je nyní šťastná ✓")
             return True
         else:
             print(f"\nPromiňte, '{vyber}' není v nabídce. Zkuste znovu.")
             return False
 
+    def zpracuj_vyber(self, osoba: Osoba, vyber: str):  # metoda pro zpracování už normalizovaného výběru - bez výpisů (i pro hromadný import)
+        if vyber in self.nabidka:  # kontrola, zda je nápoj v nabídce - v dictionary
+            self.analytika.zaznamenej(osoba.jmeno, vyber, self.nabidka[vyber], osoba.nalada, True)
+            osoba.nalada = self.historie_nalady(osoba).pridej("objednavka")  # nálada se zlepší po objednání
+            return True
+        self.analytika.zaznamenej_odmitnuti(vyber)
+        self.historie_nalady(osoba).pridej("nedostupny_napoj")
+        return False
+
 def main():
     kavarna = Kavarna("Cafe Praha", "Náměstí 1, Praha")  # vytvoření instance kavárny
 
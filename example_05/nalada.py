@@ -0,0 +1,101 @@
+import bisect
+import heapq
+import time
+
+
+PRECHODY = {  # přechody nálady podle události - None znamená, že se nálada nemění
+    "objednavka": True,  # úspěšná objednávka -> šťastná
+    "nedostupny_napoj": None,  # nápoj není v nabídce -> beze změny
+}
+
+
+class HistorieNalady:  # třída pro historii nálady jednoho zákazníka složenou z událostí
+    # Drží se nejvýše max_udalosti posledních událostí - při překročení se starší polovina zahodí
+    # a nálada po ní se uloží jako počáteční snímek. Dotaz na čas před nejstarší zachovanou
+    # událostí proto vrací náladu v okamžiku zkrácení, ne skutečnou tehdejší.
+    def __init__(self, pocatecni_nalada: bool, interval_snimku: int = 100,
+                 max_udalosti: int = 1_000):  # konstruktor třídy HistorieNalady
+        self.interval_snimku = interval_snimku  # po kolika událostech se uloží snímek (None = nikdy)
+        self.max_udalosti = max_udalosti  # nejvýše tolik událostí se drží v paměti (None = bez omezení)
+        self.zahozeno = 0  # kolik nejstarších událostí už bylo zahozeno
+        self.casy = []  # časy událostí - neklesající, kvůli bisect
+        self.udalosti = []  # názvy událostí ve stejném pořadí
+        self.snimky_pozice = [0]  # počet událostí, po kterých byl snímek pořízen
+        self.snimky_nalada = [pocatecni_nalada]  # nálada v okamžiku snímku
+        self.nalada = pocatecni_nalada  # aktuální nálada
+
+    def pridej(self, udalost: str, cas: float = None):  # metoda pro přidání události a změnu nálady
+        if udalost not in PRECHODY:
+            raise ValueError(f"Neznámá událost: {udalost}")
+        if cas is None:
+            cas = time.time()
+            if self.casy and cas < self.casy[-1]:  # systémové hodiny se posunuly zpět (NTP) - platná objednávka nesmí selhat
+                cas = self.casy[-1]
+        elif self.casy and cas < self.casy[-1]:
+            raise ValueError("Události musí přicházet v časovém pořadí")
+        self.casy.append(cas)
+        self.udalosti.append(udalost)
+        self.nalada = _prechod(self.nalada, udalost)
+        if self.interval_snimku and len(self.udalosti) % self.interval_snimku == 0:
+            self.snimky_pozice.append(len(self.udalosti))
+            self.snimky_nalada.append(self.nalada)
+        if self.max_udalosti and len(self.udalosti) > self.max_udalosti:
+            self.zkrat(max(1, self.max_udalosti // 2))  # po polovinách - zkracování je tak amortizovaně O(1)
+        return self.nalada
+
+    def zkrat(self, ponechat: int):  # metoda pro zahození nejstarších událostí - ponechá posledních `ponechat`
+        odebrat = len(self.udalosti) - ponechat
+        if odebrat <= 0:
+            return
+        nalada = self._nalada_po(odebrat)
+        del self.casy[:odebrat]
+        del self.udalosti[:odebrat]
+        prvni = bisect.bisect_right(self.snimky_pozice, odebrat)  # snímky po zahozených událostech zůstávají
+        self.snimky_pozice = [0] + [pozice - odebrat for pozice in self.snimky_pozice[prvni:]]
+        self.snimky_nalada = [nalada] + self.snimky_nalada[prvni:]
+        self.zahozeno += odebrat
+
+    def nalada_v(self, cas: float):  # nálada v daném čase - přehrání od nejbližšího předchozího snímku
+        return self._nalada_po(bisect.bisect_right(self.casy, cas))  # počet událostí do času včetně
+
+    def _nalada_po(self, konec: int):  # nálada po prvních `konec` zachovaných událostech
+        snimek = bisect.bisect_right(self.snimky_pozice, konec) - 1
+        nalada = self.snimky_nalada[snimek]
+        for udalost in self.udalosti[self.snimky_pozice[snimek]:konec]:
+            nalada = _prechod(nalada, udalost)
+        return nalada
+
+    def sloucena(self, dalsi: "HistorieNalady"):  # nová historie s událostmi obou historií v časovém pořadí - počáteční nálada z této
+        sloucena = HistorieNalady(self.snimky_nalada[0], self.interval_snimku, self.max_udalosti)
+        for cas, udalost in heapq.merge(zip(self.casy, self.udalosti), zip(dalsi.casy, dalsi.udalosti),
+                                        key=lambda polozka: polozka[0]):
+            sloucena.pridej(udalost, cas)
+        sloucena.zahozeno += self.zahozeno + dalsi.zahozeno
+        return sloucena
+
+
+def _prechod(nalada: bool, udalost: str):  # nová nálada po události
+    nova = PRECHODY[udalost]
+    return nalada if nova is None else nova
+
+
+def benchmark_prehravani(delky=(1_000, 10_000, 100_000), interval_snimku: int = 100, dotazu: int = 200):  # průměrný čas dotazu nalada_v podle délky historie
+    vysledky = []
+    for delka in delky:
+        radek = {"delka": delka}
+        for nazev, interval in (("se_snimky", interval_snimku), ("bez_snimku", None)):
+            historie = HistorieNalady(False, interval, max_udalosti=None)
+            for i in range(delka):
+                historie.pridej("objednavka" if i % 3 == 0 else "nedostupny_napoj", float(i))
+            zacatek = time.perf_counter()
+            for i in range(dotazu):
+                historie.nalada_v(float(delka - 1 - i % delka))  # dotazy na konec historie - nejhorší případ bez snímků
+            radek[nazev] = (time.perf_counter() - zacatek) / dotazu
+        vysledky.append(radek)
+    return vysledky
+
+
+if __name__ == "__main__":   # spuštění benchmarku
+    for radek in benchmark_prehravani():
+        print(f"{radek['delka']:>8} událostí: se snímky {radek['se_snimky'] * 1e6:8.1f} µs, "
+              f"bez snímků {radek['bez_snimku'] * 1e6:10.1f} µs")
@@ -0,0 +1,131 @@
+import pickle
+import sqlite3
+import time
+import weakref
+from collections import OrderedDict
+
+from kavarna import Kavarna, Osoba
+
+
+class SpravceRelaci:  # třída pro omezení paměti dlouho běžící kavárny - neaktivní zákazníci se odkládají na disk
+    # Pořadí LRU a TTL obnovují jen zakaznik() a objednej() tohoto správce. Objednávka přímo přes
+    # Kavarna na objektu Osoba, který si volající drží, zákazníka neobnoví - ten pak může být mezitím
+    # odložen. Taková objednávka se neztratí: při načtení se historie nálady sloučí a vrátí se
+    # stejný objekt Osoba, pokud ještě existuje. Jména zákazníků musí být jedinečná.
+    def __init__(self, kavarna: Kavarna, uloziste: str, ttl: float = 1800.0, max_aktivnich: int = 10_000,
+                 hodiny=time.monotonic, udalosti_na_disku: int = 100):  # konstruktor - uloziste je cesta k souboru SQLite
+        self.kavarna = kavarna
+        self.udalosti_na_disku = udalosti_na_disku  # kolik posledních událostí nálady se odkládá - načtení nezávisí na stáří zákazníka
+        self.ttl = ttl  # po kolika sekundách bez objednávky je zákazník neaktivní
+        self.max_aktivnich = max_aktivnich  # nejvýše tolik zákazníků zůstává v paměti
+        self.dolni_hranice = max(1, max_aktivnich * 9 // 10)  # při překročení se uvolní až sem - vyhazuje se po dávkách
+        self.hodiny = hodiny
+        self.aktivni = OrderedDict()  # jméno -> (osoba, čas poslední aktivity), od nejdéle nepoužitého (LRU) - OrderedDict !!!
+        # odložení zákazníci jméno -> pickle (osoba, historie nálady); SQLite drží i index na disku,
+        # takže paměť neroste s počtem odložených (dbm.dumb by index držel celý v paměti)
+        self.odlozeni = sqlite3.connect(str(uloziste))
+        self.odlozeni.execute("CREATE TABLE IF NOT EXISTS relace (jmeno TEXT PRIMARY KEY, data BLOB NOT NULL)")
+        self.odlozeni.execute("PRAGMA synchronous = OFF")  # odkládací úložiště, ne archiv - bez fsync po každé transakci
+        self.dalsi_kontrola = hodiny() + ttl / 4  # kdy se příště hledají zákazníci s prošlým TTL
+        self.odlozeno = 0  # kolikrát byl zákazník odložen na disk
+        self.nacteno = 0  # kolikrát byl zákazník načten zpět
+        self.odlozene_osoby = weakref.WeakValueDictionary()  # odložení zákazníci, jejichž objekt ještě někdo drží
+        for osoba in kavarna.zakaznici:  # zákazníci přidaní dřív, než se správa relací zapnula
+            self._pouzit(osoba)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
+
+    def zavri(self):  # metoda pro uzavření úložiště na disku
+        self.odlozeni.close()
+
+    def pridat_zakaznika(self, osoba: Osoba):  # metoda pro přidání zákazníka - jako Kavarna.pridat_zakaznika, ale jméno musí být nové
+        if osoba.jmeno in self.aktivni or self._nacti_z_disku(osoba.jmeno) is not None:
+            raise ValueError(f"Zákazník {osoba.jmeno} už existuje - použijte zakaznik()")
+        self.kavarna.pridat_zakaznika(osoba)
+        self._pouzit(osoba)
+        self.uklid()
+
+    def zakaznik(self, jmeno: str):  # metoda pro nalezení zákazníka - odloženého načte zpět z disku, neznámý je None
+        if jmeno in self.aktivni:
+            osoba = self.aktivni[jmeno][0]
+            self._pouzit(osoba)
+            self.uklid()
+            return osoba
+        data = self._nacti_z_disku(jmeno)
+        if data is None:
+            return None
+        with self.odlozeni:
+            self.odlozeni.execute("DELETE FROM relace WHERE jmeno = ?", (jmeno,))
+        osoba, historie = pickle.loads(data)
+        osoba = self.odlozene_osoby.pop(jmeno, osoba)  # objekt, který volající ještě drží, má přednost před kopií
+        mezitim = self.kavarna.historie_nalad.get(jmeno)  # objednávky přímo přes Kavarna během odložení
+        if historie is not None and mezitim is not None:
+            historie = historie.sloucena(mezitim)
+            osoba.nalada = historie.nalada
+        elif historie is None:
+            historie = mezitim
+        if historie is not None:
+            self.kavarna.historie_nalad[jmeno] = historie
+        self.kavarna.zakaznici.append(osoba)
+        self.nacteno += 1
+        self._pouzit(osoba)
+        self.uklid()
+        return osoba
+
+    def objednej(self, jmeno: str, napoj: str):  # metoda pro tichou objednávku podle jména - normalizace jako u interaktivní cesty
+        osoba = self.zakaznik(jmeno)
+        if osoba is None:
+            raise KeyError(f"Neznámý zákazník: {jmeno}")
+        return self.kavarna.zpracuj_vyber(osoba, napoj.lower().strip())
+
+    def uklid(self):  # metoda pro odložení zákazníků s prošlým TTL nebo nad limitem - seznam zákazníků se přestaví jen jednou
+        ted = self.hodiny()
+        nad_limitem = len(self.aktivni) > self.max_aktivnich
+        if not nad_limitem and ted < self.dalsi_kontrola:
+            return 0
+        odlozit = []
+        for jmeno, (_, naposledy) in self.aktivni.items():  # od nejdéle nepoužitého
+            if ted - naposledy >= self.ttl or (nad_limitem and len(self.aktivni) - len(odlozit) > self.dolni_hranice):
+                odlozit.append(jmeno)
+            else:
+                break
+        self.dalsi_kontrola = ted + self.ttl / 4
+        if odlozit:
+            self._odloz(odlozit)
+        return len(odlozit)
+
+    def _nacti_z_disku(self, jmeno: str):  # pickle odloženého zákazníka, nebo None
+        radek = self.odlozeni.execute("SELECT data FROM relace WHERE jmeno = ?", (jmeno,)).fetchone()
+        return None if radek is None else radek[0]
+
+    def _pouzit(self, osoba: Osoba):  # zákazník se přesune na konec LRU pořadí
+        self.aktivni[osoba.jmeno] = (osoba, self.hodiny())
+        self.aktivni.move_to_end(osoba.jmeno)
+
+    def _odloz(self, jmena):  # odložení na disk spolu s historií nálady - jedna transakce na dávku
+        zaznamy = []
+        odlozene = set()  # id() odložených objektů - zákazníci přidaní přímo do Kavarna se stejným jménem zůstávají
+        for jmeno in jmena:
+            osoba, _ = self.aktivni.pop(jmeno)
+            self.odlozene_osoby[jmeno] = osoba
+            odlozene.add(id(osoba))
+            historie = self.kavarna.historie_nalad.pop(jmeno, None)
+            if historie is not None:
+                historie.zkrat(self.udalosti_na_disku)
+            zaznamy.append((jmeno, pickle.dumps((osoba, historie), pickle.HIGHEST_PROTOCOL)))
+        with self.odlozeni:
+            self.odlozeni.executemany("INSERT OR REPLACE INTO relace VALUES (?, ?)", zaznamy)
+        self.kavarna.zakaznici[:] = [osoba for osoba in self.kavarna.zakaznici if id(osoba) not in odlozene]
+        self.odlozeno += len(jmena)
+
+    def statistiky(self):  # metoda pro přehled - kolik zákazníků je v paměti a kolik na disku
+        return {
+            "aktivnich": len(self.aktivni),
+            "odlozenych": self.odlozeni.execute("SELECT COUNT(*) FROM relace").fetchone()[0],
+            "odlozeno": self.odlozeno,
+            "nacteno": self.nacteno,
+        }
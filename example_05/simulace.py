@@ -0,0 +1,123 @@
+import argparse
+import builtins
+import math
+import os
+import random
+import time
+import tracemalloc
+from collections import deque
+from contextlib import redirect_stdout
+
+from kavarna import Osoba, Kavarna
+
+
+class NahradniVstup:  # třída, která po dobu bloku with nahradí input() odpověďmi z fronty
+    def __init__(self):  # konstruktor třídy NahradniVstup
+        self.odpovedi = deque()  # připravené odpovědi - fronta
+        self._puvodni = None
+
+    def pridej(self, odpoved: str):  # metoda pro zařazení další odpovědi
+        self.odpovedi.append(odpoved)
+
+    def _input(self, prompt=''):  # náhrada za input() - vrací odpovědi v pořadí zařazení
+        return self.odpovedi.popleft()
+
+    def __enter__(self):
+        self._puvodni = builtins.input
+        builtins.input = self._input
+        return self
+
+    def __exit__(self, *exc):
+        builtins.input = self._puvodni
+
+
+def vytvor_zakazniky(pocet: int, nabidka: dict, rng: random.Random, podil_stastnych: float = 0.5):  # syntetičtí zákazníci s náhodným oblíbeným nápojem
+    napoje = list(nabidka)
+    return [Osoba(f"Zakaznik{i}", rng.choice(napoje), rng.random() < podil_stastnych) for i in range(pocet)]
+
+
+def generuj_objednavky(zakaznici, pocet: int, vahy: dict, rng: random.Random,
+                       podil_neplatnych: float = 0.05, podil_interaktivnich: float = 0.2):  # proud objednávek (osoba, nápoj, interaktivně)
+    napoje = list(vahy)
+    hodnoty = list(vahy.values())
+    for _ in range(pocet):
+        osoba = rng.choice(zakaznici)
+        napoj = "pivo" if rng.random() < podil_neplatnych else rng.choices(napoje, hodnoty)[0]
+        yield osoba, napoj, rng.random() < podil_interaktivnich
+
+
+def percentil(serazene, p: float):  # percentil metodou nejbližšího pořadí ze seřazeného listu
+    if not serazene:
+        return 0
+    index = max(0, math.ceil(p / 100 * len(serazene)) - 1)
+    return serazene[index]
+
+
+def simuluj(pocet_zakazniku: int = 100, pocet_objednavek: int = 10_000, vahy: dict = None,
+            podil_neplatnych: float = 0.05, podil_interaktivnich: float = 0.2,
+            seed: int = 0, merit_pamet: bool = True):  # spustí simulaci a vrátí report jako dictionary
+    rng = random.Random(seed)
+    kavarna = Kavarna("Simulace", "Testovací 1")
+    if vahy is None:
+        vahy = {napoj: 1 for napoj in kavarna.nabidka}  # výchozí rovnoměrné rozdělení přes nabídku
+    zakaznici = vytvor_zakazniky(pocet_zakazniku, kavarna.nabidka, rng)
+    for osoba in zakaznici:
+        kavarna.pridat_zakaznika(osoba)
+    objednavky = list(generuj_objednavky(zakaznici, pocet_objednavek, vahy, rng,
+                                         podil_neplatnych, podil_interaktivnich))
+
+    latence = []  # doba jednotlivých objednávek v ns
+    if merit_pamet:
+        uz_merila = tracemalloc.is_tracing()  # měření volajícího se nevypíná
+        tracemalloc.start()
+        pamet_na_zacatku = tracemalloc.get_traced_memory()[0]
+    try:  # tracemalloc se zastaví i při výjimce - jinak by zpomaloval vše, co běží potom
+        with open(os.devnull, "w") as nikam, redirect_stdout(nikam), NahradniVstup() as vstup:
+            zacatek = time.perf_counter()
+            for osoba, napoj, interaktivne in objednavky:
+                t = time.perf_counter_ns()
+                if interaktivne:
+                    vstup.pridej(f"  {napoj.upper()} ")  # uživatel píše s mezerami a velkými písmeny
+                    kavarna.objednej_napoj_od_uzivatele(osoba)
+                else:
+                    kavarna.objednej_napoj(osoba, napoj)
+                latence.append(time.perf_counter_ns() - t)
+            celkovy_cas = time.perf_counter() - zacatek
+        report = {
+            "objednavek": len(objednavky),
+            "sekund": celkovy_cas,
+            "objednavek_za_s": len(objednavky) / celkovy_cas if celkovy_cas else 0.0,
+        }
+        latence.sort()
+        report["latence_us"] = {f"p{p}": percentil(latence, p) / 1000 for p in (50, 90, 99)}
+        report["latence_us"]["max"] = latence[-1] / 1000 if latence else 0.0
+        if merit_pamet:
+            pamet_na_konci, spicka = tracemalloc.get_traced_memory()
+            report["narust_pameti_B"] = pamet_na_konci - pamet_na_zacatku
+            report["spicka_pameti_B"] = spicka
+    finally:
+        if merit_pamet and not uz_merila:
+            tracemalloc.stop()
+    report["prodano"] = kavarna.analytika.celkem_objednavek
+    report["odmitnuto"] = sum(kavarna.analytika.odmitnuto.values())
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zátěžová simulace kavárny")
+    parser.add_argument("--zakazniku", type=int, default=100)
+    parser.add_argument("--objednavek", type=int, default=10_000)
+    parser.add_argument("--neplatnych", type=float, default=0.05, help="podíl objednávek mimo nabídku")
+    parser.add_argument("--interaktivnich", type=float, default=0.2, help="podíl objednávek přes input()")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bez-pameti", action="store_true", help="neměřit paměť (tracemalloc zpomaluje)")
+    args = parser.parse_args()
+
+    report = simuluj(args.zakazniku, args.objednavek, None, args.neplatnych, args.interaktivnich,
+                     args.seed, not args.bez_pameti)
+    for klic, hodnota in report.items():
+        print(f"{klic}: {hodnota}")
+
+
+if __name__ == "__main__":   # spuštění hlavní funkce
+    main()
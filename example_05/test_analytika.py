@@ -0,0 +1,53 @@
+import builtins
+
+from analytika import Analytika
+from kavarna import Osoba, Kavarna
+
+
+def test_zaznamenej_updates_counts_and_revenue():
+    a = Analytika()
+    a.zaznamenej("Jan", "káva", 30, True, True)
+    a.zaznamenej("Eva", "káva", 30, False, True)
+    a.zaznamenej("Eva", "čaj", 25, True, True)
+    assert a.pocty["káva"] == 2
+    assert a.trzby["káva"] == 60
+    assert a.utraty["Eva"] == 55
+    assert a.celkem_objednavek == 3
+    assert a.celkova_trzba == 85
+    assert a.prechody_nalady[(False, True)] == 1
+
+
+def test_top_k_queries():
+    a = Analytika()
+    for napoj, cena, kusu in [("káva", 30, 5), ("čaj", 25, 2), ("espresso", 35, 4)]:
+        for _ in range(kusu):
+            a.zaznamenej("Jan", napoj, cena, True, True)
+    assert a.nejprodavanejsi(2) == [("káva", 5), ("espresso", 4)]
+    assert a.nejvyssi_trzby(1) == [("káva", 150)]
+    assert a.nejlepsi_zakaznici(1) == [("Jan", 340)]
+
+
+def test_napoje_podle_nalady():
+    a = Analytika()
+    a.zaznamenej("Jan", "káva", 30, True, True)
+    a.zaznamenej("Eva", "čaj", 25, False, True)
+    a.zaznamenej("Petr", "čaj", 25, False, False)
+    assert a.napoje_podle_nalady(False) == {"čaj": 2}
+    assert a.napoje_podle_nalady(True) == {"káva": 1}
+
+
+def test_kavarna_orders_feed_analytika(monkeypatch, capsys):
+    k = Kavarna("C", "A")
+    o = Osoba("Marta", "čaj", False)
+    k.objednej_napoj(o, "čaj")
+    k.objednej_napoj(o, "pivo")
+    monkeypatch.setattr(builtins, 'input', lambda prompt='': 'espresso')
+    k.objednej_napoj_od_uzivatele(o)
+    capsys.readouterr()
+
+    souhrn = k.analytika.souhrn()
+    assert souhrn["objednavek"] == 2
+    assert souhrn["trzba"] == 25 + 35
+    assert souhrn["odmitnuto"] == {"pivo": 1}
+    assert k.analytika.prechody_nalady[(False, False)] == 1
+    assert k.analytika.prechody_nalady[(False, True)] == 1
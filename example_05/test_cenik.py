@@ -0,0 +1,95 @@
+import pytest
+
+from cenik import CenovyEngine
+from kavarna import Kavarna
+
+
+def make_engine():
+    return CenovyEngine(Kavarna("C", "A").nabidka, mnozstevni_slevy={3: 500, 10: 1_000},
+                        happy_hour=(14, 16, 2_000), vernostni_sleva_bp=300)
+
+
+def test_cena_without_discounts_in_halere():
+    engine = CenovyEngine({"káva": 30})
+    assert engine.cena("káva") == 3_000
+    assert engine.cena("káva", kusu=4) == 12_000
+
+
+def test_discounts_are_added_and_rounded_half_up():
+    engine = make_engine()
+    assert engine.cena("čaj", kusu=3) == 7_125  # 7500 - 5 %
+    assert engine.cena("čaj", kusu=10, hodina=15, verny=True) == 16_750  # 25000 - 33 %
+    assert engine.cena("čaj", kusu=1, verny=True, hodina=9) == 2_425  # 2500 - 3 %
+    assert CenovyEngine({"x": 1}, vernostni_sleva_bp=50).cena("x", verny=True) == 99  # 0,5 haléře -> 1
+
+
+def test_discount_is_capped_at_100_percent():
+    engine = CenovyEngine({"káva": 30}, {1: 6_000}, (0, 24, 6_000))
+    assert engine.cena("káva") == 0
+
+
+def test_batch_matches_single_line_prices():
+    engine = make_engine()
+    napoje = ["káva", "čaj", "espresso", "káva"]
+    kusy = [1, 3, 12, 5]
+    hodiny = [8, 14, 15, 23]
+    verni = [False, True, True, False]
+    davka = engine.spocitej(engine.indexy(napoje), kusy, hodiny, verni, pouzit_numpy=False)
+    assert list(davka) == [engine.cena(*radek) for radek in zip(napoje, kusy, hodiny, verni)]
+
+
+def test_unknown_drink_raises_valueerror():
+    with pytest.raises(ValueError):
+        make_engine().indexy(["pivo"])
+
+
+def test_numpy_path_is_identical():
+    pytest.importorskip("numpy")
+    engine = make_engine()
+    napoje = engine.indexy(["káva", "čaj", "espresso"] * 50)
+    kusy = list(range(1, 151))
+    hodiny = [i % 24 for i in range(150)]
+    verni = [i % 2 == 0 for i in range(150)]
+    python = engine.spocitej(napoje, kusy, hodiny, verni, pouzit_numpy=False)
+    numpy = engine.spocitej(napoje, kusy, hodiny, verni, pouzit_numpy=True)
+    assert list(python) == [int(x) for x in numpy]
+
+
+def test_happy_hour_across_midnight():
+    engine = CenovyEngine({"káva": 30}, happy_hour=(22, 2, 5_000))
+    assert [engine.cena("káva", hodina=h) for h in (21, 22, 23, 0, 1, 2)] == [3_000, 1_500, 1_500, 1_500, 1_500, 3_000]
+
+
+@pytest.mark.parametrize("happy_hour", [(-1, 2, 100), (22, 25, 100), (24, 2, 100)])
+def test_happy_hour_outside_day_raises(happy_hour):
+    with pytest.raises(ValueError):
+        CenovyEngine({"káva": 30}, happy_hour=happy_hour)
+
+
+@pytest.mark.parametrize("pouzit_numpy", [False, True])
+@pytest.mark.parametrize("kusu, hodina", [(1, -10), (1, 24), (-3, 12)])
+def test_invalid_hour_or_quantity_raises(pouzit_numpy, kusu, hodina):
+    if pouzit_numpy:
+        pytest.importorskip("numpy")
+    engine = make_engine()
+    with pytest.raises(ValueError):
+        engine.spocitej(engine.indexy(["káva", "čaj"]), [1, kusu], [12, hodina], [False, False], pouzit_numpy=pouzit_numpy)
+
+
+def test_invalid_drink_index_raises():
+    with pytest.raises(ValueError):
+        make_engine().spocitej([-1], [1], [12], [False], pouzit_numpy=False)
+
+
+@pytest.mark.parametrize("pouzit_numpy", [False, True])
+@pytest.mark.parametrize("sloupce", [
+    ([0, 1], [1], [12, 12], [False, False]),
+    ([0, 1], [1, 1], [12], [False, False]),
+    ([0, 1], [1, 1], [12, 12], [False]),
+    ([0], [1, 1], [12, 12], [False, False]),
+])
+def test_columns_of_different_length_raise(pouzit_numpy, sloupce):
+    if pouzit_numpy:
+        pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="stejně dlouhé"):
+        make_engine().spocitej(*sloupce, pouzit_numpy=pouzit_numpy)
@@ -0,0 +1,68 @@
+import pytest
+
+from federace import Federace, cislo_oddilu
+from kavarna import Osoba
+
+
+def test_cislo_oddilu_is_stable_and_in_range():
+    for kavarna_id in ["praha-1", "brno-2", 7]:
+        cislo = cislo_oddilu(kavarna_id, 3)
+        assert 0 <= cislo < 3
+        assert cislo == cislo_oddilu(kavarna_id, 3)
+
+
+def test_federace_routes_orders_and_answers_queries():
+    with Federace(pocet_oddilu=2) as f:
+        for kavarna_id in ["praha", "brno", "ostrava"]:
+            f.pridat_kavarnu(kavarna_id, f"Cafe {kavarna_id}", "Náměstí 1")
+        f.pridat_zakaznika("praha", Osoba("Jan", "káva", True))
+        f.pridat_zakaznika("ostrava", Osoba("Jan", "čaj", False))
+        f.objednej_davku([
+            ("praha", "Jan", "káva"),
+            ("brno", "Eva", "káva"),
+            ("ostrava", "Jan", "čaj"),
+            ("brno", "Eva", "pivo"),
+        ])
+        f.objednej("praha", "Petr", "espresso")
+
+        assert sorted(f.najdi_zakaznika("Jan")) == ["ostrava", "praha"]
+        assert f.najdi_zakaznika("Eva") == ["brno"]
+        assert f.najdi_zakaznika("Nikdo") == []
+        assert f.prodeje_celkem() == {"káva": 2, "čaj": 1, "espresso": 1}
+
+        statistiky = f.propustnost()
+        assert len(statistiky) == 2
+        assert sum(s["kavaren"] for s in statistiky) == 3
+        assert sum(s["objednavek"] for s in statistiky) == 5
+
+
+def test_unknown_cafe_is_rejected_and_federation_keeps_working():
+    with Federace(pocet_oddilu=2) as f:
+        f.pridat_kavarnu("praha", "Cafe Praha", "Náměstí 1")
+        with pytest.raises(KeyError):
+            f.objednej("zzz", "Jan", "káva")
+        with pytest.raises(KeyError):
+            f.objednej_davku([("praha", "Jan", "káva"), ("zzz", "Eva", "čaj")])  # nic se neodešle
+        with pytest.raises(KeyError):
+            f.pridat_zakaznika("zzz", Osoba("Jan", "káva", True))
+        f.objednej("praha", "Jan", "káva")
+        assert f.prodeje_celkem() == {"káva": 1}
+
+
+def test_worker_error_is_reraised_and_worker_survives():
+    with Federace(pocet_oddilu=1) as f:
+        f.kavarny.add("obejito")  # obejde kontrolu v rodiči - chybu najde až oddíl
+        with pytest.raises(KeyError, match="obejito"):
+            f.objednej("obejito", "Jan", "káva")
+        f.pridat_kavarnu("praha", "Cafe Praha", "Náměstí 1")
+        assert f.najdi_zakaznika("Jan") == []
+
+
+def test_ukoncit_tolerates_dead_partition():
+    f = Federace(pocet_oddilu=2)
+    f.procesy[0].terminate()
+    f.procesy[0].join()
+    with pytest.raises(RuntimeError):
+        f.prodeje_celkem()
+    f.ukoncit()
+    assert f.procesy == []
@@ -0,0 +1,100 @@
+import csv
+import json
+
+import pytest
+
+from import_objednavek import cti_davky, importuj
+from kavarna import Kavarna, Osoba
+
+
+def precti_vysledky(cesta):
+    with open(cesta, encoding="utf-8", newline="") as soubor:
+        return list(csv.DictReader(soubor))
+
+
+def test_import_csv(tmp_path):
+    kavarna = Kavarna("Test", "Ulice 1")
+    eva = Osoba("Eva", "čaj", False)
+    kavarna.pridat_zakaznika(eva)
+    vstup = tmp_path / "objednavky.csv"
+    vstup.write_text("jmeno,napoj\nEva,  ČAJ \nJan,pivo\nEva,Káva\n,káva\nPetr\n", encoding="utf-8")
+
+    report = importuj(kavarna, vstup, tmp_path / "vysledky.csv", velikost_davky=2)
+
+    assert report["radku"] == 5
+    assert report["prijato"] == 2
+    assert report["odmitnuto"] == 3
+    assert report["duvody_odmitnuti"] == {"nedostupny_napoj": 1, "chybny_radek": 2}
+    assert report["novych_zakazniku"] == 1
+    vysledky = precti_vysledky(tmp_path / "vysledky.csv")
+    assert [(v["radek"], v["napoj"], v["stav"], v["cena"]) for v in vysledky[:3]] == [
+        ("2", "čaj", "prijato", "25"), ("3", "pivo", "odmitnuto", ""), ("4", "káva", "prijato", "30")]
+    assert eva.nalada is True  # nálada se po objednávce zlepší jako u interaktivní cesty
+    assert kavarna.analytika.pocty == {"čaj": 1, "káva": 1}
+    assert kavarna.analytika.odmitnuto == {"pivo": 1}
+    assert [osoba.jmeno for osoba in kavarna.zakaznici] == ["Eva", "Jan"]
+
+
+def test_import_jsonl_matches_interactive_path(tmp_path, monkeypatch, capsys):
+    radky = [{"jmeno": "Eva", "napoj": " Espresso"}, {"jmeno": "Eva", "napoj": "vino"}, {"jmeno": "Eva"}]
+    vstup = tmp_path / "objednavky.jsonl"
+    vstup.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in radky) + "\nnení json\n\n", encoding="utf-8")
+    hromadne = Kavarna("Test", "Ulice 1")
+    hromadne.pridat_zakaznika(Osoba("Eva", "čaj", False))
+    report = importuj(hromadne, vstup, tmp_path / "vysledky.csv")
+    assert capsys.readouterr().out == ""  # hromadný import nic nevypisuje
+    assert report["prijato"] == 1 and report["duvody_odmitnuti"] == {"nedostupny_napoj": 1, "chybny_radek": 2}
+
+    interaktivne = Kavarna("Test", "Ulice 1")
+    eva = Osoba("Eva", "čaj", False)
+    interaktivne.pridat_zakaznika(eva)
+    odpovedi = iter([" Espresso", "vino"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(odpovedi))
+    interaktivne.objednej_napoj_od_uzivatele(eva)
+    interaktivne.objednej_napoj_od_uzivatele(eva)
+    assert hromadne.analytika.souhrn() == interaktivne.analytika.souhrn()
+    assert hromadne.zakaznici[0].nalada == eva.nalada
+    assert hromadne.historie_nalad["Eva"].udalosti == interaktivne.historie_nalad["Eva"].udalosti
+
+
+def test_davky_are_bounded(tmp_path):
+    vstup = tmp_path / "objednavky.jsonl"
+    vstup.write_text("".join(json.dumps({"jmeno": f"Z{i}", "napoj": "káva"}) + "\n" for i in range(25)))
+    with open(vstup, encoding="utf-8") as soubor:
+        assert [len(davka) for davka in cti_davky(soubor, "jsonl", 10)] == [10, 10, 5]
+
+
+def test_csv_without_columns(tmp_path):
+    vstup = tmp_path / "spatne.csv"
+    vstup.write_text("kdo,co\nEva,čaj\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        importuj(Kavarna("Test", "Ulice 1"), vstup, tmp_path / "vysledky.csv")
+
+
+def test_new_customer_gets_favourite_drink_only_from_menu(tmp_path):
+    kavarna = Kavarna("Test", "Ulice 1")
+    vstup = tmp_path / "objednavky.csv"
+    vstup.write_text("jmeno,napoj\nJan,pivo\nPetr,Káva\n", encoding="utf-8")
+    importuj(kavarna, vstup, tmp_path / "vysledky.csv")
+    assert [(osoba.jmeno, osoba.oblibeny_napoj) for osoba in kavarna.zakaznici] == [("Jan", None), ("Petr", "káva")]
+
+
+@pytest.mark.parametrize("pripona, obsah", [
+    (".csv", "jmeno,napoj\nEva,čaj\n Eva ,káva\n"),
+    (".jsonl", '{"jmeno": "Eva", "napoj": "čaj"}\n{"jmeno": " Eva ", "napoj": "káva"}\n'),
+])
+def test_names_are_stripped(tmp_path, pripona, obsah):
+    kavarna = Kavarna("Test", "Ulice 1")
+    vstup = tmp_path / f"objednavky{pripona}"
+    vstup.write_text(obsah, encoding="utf-8")
+    report = importuj(kavarna, vstup, tmp_path / "vysledky.csv")
+    assert report["novych_zakazniku"] == 1
+    assert [osoba.jmeno for osoba in kavarna.zakaznici] == ["Eva"]
+    assert [v["jmeno"] for v in precti_vysledky(tmp_path / "vysledky.csv")] == ["Eva", "Eva"]
+
+
+def test_csv_with_bom(tmp_path):
+    vstup = tmp_path / "objednavky.csv"
+    vstup.write_text("jmeno,napoj\nEva,čaj\n", encoding="utf-8-sig")
+    report = importuj(Kavarna("Test", "Ulice 1"), vstup, tmp_path / "vysledky.csv")
+    assert report["prijato"] == 1
@@ -0,0 +1,120 @@
+import builtins
+
+import pytest
+
+from kavarna import Osoba, Kavarna
+from nalada import HistorieNalady, benchmark_prehravani
+
+
+def test_pridej_applies_transitions():
+    h = HistorieNalady(False)
+    assert h.pridej("nedostupny_napoj", 1.0) is False
+    assert h.pridej("objednavka", 2.0) is True
+    assert h.nalada is True
+
+
+def test_pridej_rejects_unknown_event_and_time_going_back():
+    h = HistorieNalady(False)
+    with pytest.raises(ValueError):
+        h.pridej("tanec", 1.0)
+    h.pridej("objednavka", 5.0)
+    with pytest.raises(ValueError):
+        h.pridej("objednavka", 4.0)
+
+
+def test_nalada_v_reconstructs_past_state():
+    h = HistorieNalady(False, interval_snimku=2)
+    h.pridej("nedostupny_napoj", 10.0)
+    h.pridej("nedostupny_napoj", 20.0)
+    h.pridej("objednavka", 30.0)
+    h.pridej("nedostupny_napoj", 40.0)
+    assert h.nalada_v(0.0) is False
+    assert h.nalada_v(25.0) is False
+    assert h.nalada_v(30.0) is True
+    assert h.nalada_v(100.0) is True
+    assert h.snimky_pozice == [0, 2, 4]
+
+
+def test_snapshots_give_same_answers_as_full_replay():
+    se_snimky = HistorieNalady(False, interval_snimku=7)
+    bez_snimku = HistorieNalady(False, interval_snimku=None)
+    for i in range(100):
+        udalost = "objednavka" if i == 50 else "nedostupny_napoj"
+        se_snimky.pridej(udalost, float(i))
+        bez_snimku.pridej(udalost, float(i))
+    for cas in range(-1, 101):
+        assert se_snimky.nalada_v(cas) is bez_snimku.nalada_v(cas)
+
+
+def test_clock_going_back_does_not_break_implicit_times(monkeypatch):
+    h = HistorieNalady(False)
+    monkeypatch.setattr("nalada.time.time", lambda: 1000.0)
+    h.pridej("nedostupny_napoj")
+    monkeypatch.setattr("nalada.time.time", lambda: 900.0)  # NTP posunulo hodiny zpět
+    assert h.pridej("objednavka") is True
+    assert h.casy == [1000.0, 1000.0]
+    with pytest.raises(ValueError):  # explicitní čas dál musí být v pořadí
+        h.pridej("objednavka", 950.0)
+
+
+def test_event_log_is_capped_and_answers_stay_correct():
+    omezena = HistorieNalady(False, interval_snimku=7, max_udalosti=40)
+    uplna = HistorieNalady(False, interval_snimku=7, max_udalosti=None)
+    for i in range(1000):
+        udalost = "objednavka" if i % 97 == 5 else "nedostupny_napoj"
+        omezena.pridej(udalost, float(i))
+        uplna.pridej(udalost, float(i))
+        assert omezena.nalada is uplna.nalada
+    assert 20 <= len(omezena.udalosti) <= 40
+    assert omezena.zahozeno + len(omezena.udalosti) == 1000
+    assert len(omezena.snimky_pozice) <= 40 // 7 + 2
+    for cas in range(int(omezena.casy[0]) - 1, 1001):
+        assert omezena.nalada_v(cas) is uplna.nalada_v(cas)
+
+
+def test_zkrat_keeps_mood_of_dropped_events():
+    h = HistorieNalady(False, interval_snimku=3, max_udalosti=None)
+    h.pridej("objednavka", 1.0)
+    for i in range(2, 6):
+        h.pridej("nedostupny_napoj", float(i))
+    h.zkrat(2)
+    assert h.casy == [4.0, 5.0]
+    assert h.snimky_nalada[0] is True  # nálada po zahozené objednávce
+    assert h.nalada_v(0.0) is True  # starší dotaz vrací nejstarší zachovaný stav
+    assert h.zahozeno == 3
+
+
+def test_sloucena_merges_events_by_time():
+    a = HistorieNalady(False, interval_snimku=2)
+    a.pridej("nedostupny_napoj", 1.0)
+    a.pridej("objednavka", 4.0)
+    b = HistorieNalady(True)
+    b.pridej("objednavka", 2.0)
+    b.pridej("nedostupny_napoj", 3.0)
+    s = a.sloucena(b)
+    assert s.casy == [1.0, 2.0, 3.0, 4.0]
+    assert s.udalosti == ["nedostupny_napoj", "objednavka", "nedostupny_napoj", "objednavka"]
+    assert s.nalada_v(0.5) is False  # počáteční nálada z první historie
+    assert s.nalada is True
+    assert s.interval_snimku == 2
+    assert a.casy == [1.0, 4.0]  # původní historie se nemění
+
+
+def test_kavarna_records_interactive_orders(monkeypatch, capsys):
+    k = Kavarna("C", "A")
+    o = Osoba("Zuzka", "espresso", False)
+    monkeypatch.setattr(builtins, 'input', lambda prompt='': 'pivo')
+    k.objednej_napoj_od_uzivatele(o)
+    monkeypatch.setattr(builtins, 'input', lambda prompt='': 'káva')
+    k.objednej_napoj_od_uzivatele(o)
+    capsys.readouterr()
+    h = k.historie_nalad["Zuzka"]
+    assert h.udalosti == ["nedostupny_napoj", "objednavka"]
+    assert o.nalada is True
+    assert h.nalada_v(h.casy[0] - 1) is False
+
+
+def test_benchmark_prehravani_reports_each_length():
+    vysledky = benchmark_prehravani(delky=(10, 50), dotazu=5)
+    assert [r["delka"] for r in vysledky] == [10, 50]
+    assert all(r["se_snimky"] >= 0 and r["bez_snimku"] >= 0 for r in vysledky)
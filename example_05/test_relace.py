@@ -0,0 +1,174 @@
+import json
+
+import pytest
+
+from import_objednavek import importuj
+from kavarna import Kavarna, Osoba
+from relace import SpravceRelaci
+
+
+class Hodiny:  # ručně posouvaný čas pro testy
+    def __init__(self):
+        self.ted = 0.0
+
+    def __call__(self):
+        return self.ted
+
+
+@pytest.fixture
+def hodiny():
+    return Hodiny()
+
+
+def test_kavarna_without_sessions_is_unchanged():
+    k = Kavarna("Test", "Ulice 1")
+    o = Osoba("Eva", "čaj", False)
+    k.pridat_zakaznika(o)
+    assert k.zakaznici[-1] is o
+
+
+def test_idle_customer_is_spilled_and_reloaded(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", ttl=60, hodiny=hodiny) as relace:
+        relace.pridat_zakaznika(Osoba("Eva", "čaj", False))
+        relace.pridat_zakaznika(Osoba("Jan", "káva", False))
+        assert relace.objednej("Eva", " ČAJ ")
+        hodiny.ted = 50
+        assert relace.objednej("Jan", "pivo") is False
+        hodiny.ted = 100  # Eva je 100 s bez objednávky, Jan jen 50 s
+        assert relace.uklid() == 1
+        assert [o.jmeno for o in k.zakaznici] == ["Jan"]
+        assert "Eva" not in k.historie_nalad
+        assert relace.statistiky() == {"aktivnich": 1, "odlozenych": 1, "odlozeno": 1, "nacteno": 0}
+
+        eva = relace.zakaznik("Eva")  # načte se zpět i s náladou a historií
+        assert eva.nalada is True
+        assert k.zakaznici[-1] is eva
+        assert k.historie_nalad["Eva"].udalosti == ["objednavka"]
+        assert relace.statistiky()["nacteno"] == 1 and relace.statistiky()["odlozenych"] == 0
+        assert relace.objednej("Eva", "espresso")
+        assert k.historie_nalad["Eva"].udalosti == ["objednavka", "objednavka"]
+        assert relace.zakaznik("Nikdo") is None
+        with pytest.raises(KeyError):
+            relace.objednej("Nikdo", "čaj")
+
+
+def test_memory_stays_bounded_under_steady_arrivals(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", ttl=10_000, max_aktivnich=100, hodiny=hodiny) as relace:
+        for i in range(2_000):
+            hodiny.ted = i
+            relace.pridat_zakaznika(Osoba(f"Z{i}", "káva", False))
+            relace.objednej(f"Z{i}", "káva")
+            relace.objednej(f"Z{i // 2}", "čaj")  # část starších zákazníků se vrací
+            assert len(k.zakaznici) <= 100
+            assert len(k.historie_nalad) <= 100
+        statistiky = relace.statistiky()
+        assert statistiky["aktivnich"] + statistiky["odlozenych"] == 2_000
+        assert statistiky["nacteno"] > 0
+        assert k.analytika.celkem_objednavek == 4_000
+
+
+def test_lru_keeps_recently_used(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", max_aktivnich=10, hodiny=hodiny) as relace:
+        for i in range(10):
+            relace.pridat_zakaznika(Osoba(f"Z{i}", "káva", False))
+        relace.zakaznik("Z0")  # Z0 je teď naposledy použitý
+        relace.pridat_zakaznika(Osoba("Z10", "káva", False))  # limit překročen - uvolní se na 9
+        assert [o.jmeno for o in k.zakaznici] == ["Z0", "Z3", "Z4", "Z5", "Z6", "Z7", "Z8", "Z9", "Z10"]
+        assert list(relace.aktivni) == ["Z3", "Z4", "Z5", "Z6", "Z7", "Z8", "Z9", "Z0", "Z10"]
+
+
+def test_existing_customers_and_spill_survives_reopen(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    k.pridat_zakaznika(Osoba("Eva", "čaj", False))
+    with SpravceRelaci(k, tmp_path / "relace", ttl=1, hodiny=hodiny) as relace:
+        hodiny.ted = 5
+        relace.uklid()
+        assert k.zakaznici == []
+    with SpravceRelaci(k, tmp_path / "relace", hodiny=hodiny) as relace:
+        assert relace.zakaznik("Eva").oblibeny_napoj == "čaj"
+
+
+def test_import_through_sessions(tmp_path, hodiny):
+    vstup = tmp_path / "objednavky.jsonl"
+    vstup.write_text("".join(json.dumps({"jmeno": f"Z{i % 30}", "napoj": "Káva "}) + "\n" for i in range(300)))
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", max_aktivnich=10, hodiny=hodiny) as relace:
+        report = importuj(k, vstup, tmp_path / "vysledky.csv", relace=relace)
+        assert report["prijato"] == 300 and report["novych_zakazniku"] == 30  # odložení se nezakládají znovu
+        assert len(k.zakaznici) <= 10
+        assert relace.statistiky()["aktivnich"] + relace.statistiky()["odlozenych"] == 30
+
+
+def test_direct_orders_while_spilled_are_merged(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    eva = Osoba("Eva", "čaj", False)
+    with SpravceRelaci(k, tmp_path / "relace", ttl=60, hodiny=hodiny) as relace:
+        relace.pridat_zakaznika(eva)
+        relace.objednej("Eva", "pivo")
+        hodiny.ted = 100
+        relace.uklid()
+        assert "Eva" not in k.historie_nalad
+        k.zpracuj_vyber(eva, "čaj")  # přímo přes Kavarna na drženém objektu - mimo správce
+        assert relace.zakaznik("Eva") is eva  # žádný druhý objekt pro stejného zákazníka
+        assert k.historie_nalad["Eva"].udalosti == ["nedostupny_napoj", "objednavka"]
+        assert eva.nalada is True
+        assert [o for o in k.zakaznici if o.jmeno == "Eva"] == [eva]
+
+
+def test_reload_without_held_object_takes_mood_from_merged_history(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", ttl=60, hodiny=hodiny) as relace:
+        relace.pridat_zakaznika(Osoba("Jan", "káva", False))
+        relace.objednej("Jan", "pivo")
+        hodiny.ted = 100
+        relace.uklid()
+        kopie = Osoba("Jan", "káva", False)  # jiný objekt se stejným jménem, hned zahozen
+        k.zpracuj_vyber(kopie, "káva")
+        del kopie
+        jan = relace.zakaznik("Jan")
+        assert jan.nalada is True
+        assert k.historie_nalad["Jan"].udalosti == ["nedostupny_napoj", "objednavka"]
+
+
+def test_duplicate_names_are_refused(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", ttl=60, hodiny=hodiny) as relace:
+        relace.pridat_zakaznika(Osoba("Eva", "čaj", False))
+        with pytest.raises(ValueError):
+            relace.pridat_zakaznika(Osoba("Eva", "káva", True))
+        hodiny.ted = 100
+        relace.uklid()
+        with pytest.raises(ValueError):  # odložená - dřív by vznikl osiřelý řádek na disku
+            relace.pridat_zakaznika(Osoba("Eva", "káva", True))
+        assert relace.statistiky()["odlozenych"] == 1
+        assert relace.zakaznik("Eva").oblibeny_napoj == "čaj"
+
+
+def test_spill_keeps_untracked_customers_with_the_same_name(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", ttl=60, hodiny=hodiny) as relace:
+        relace.pridat_zakaznika(Osoba("Eva", "čaj", False))
+        cizi = Osoba("Eva", "káva", True)
+        k.pridat_zakaznika(cizi)  # přímo do kavárny, mimo správce
+        hodiny.ted = 100
+        assert relace.uklid() == 1
+        assert k.zakaznici == [cizi]
+
+
+def test_spilled_history_is_compacted(tmp_path, hodiny):
+    k = Kavarna("Test", "Ulice 1")
+    with SpravceRelaci(k, tmp_path / "relace", ttl=60, hodiny=hodiny, udalosti_na_disku=5) as relace:
+        relace.pridat_zakaznika(Osoba("Eva", "čaj", False))
+        relace.objednej("Eva", "čaj")
+        for _ in range(30):
+            relace.objednej("Eva", "pivo")
+        hodiny.ted = 100
+        relace.uklid()
+        relace.zakaznik("Eva")
+        historie = k.historie_nalad["Eva"]
+        assert historie.udalosti == ["nedostupny_napoj"] * 5
+        assert historie.zahozeno == 26
+        assert historie.nalada is True  # nálada po zahozené objednávce zůstává
@@ -0,0 +1,70 @@
+import builtins
+import random
+import tracemalloc
+
+import pytest
+
+from kavarna import Kavarna
+from simulace import NahradniVstup, generuj_objednavky, percentil, simuluj, vytvor_zakazniky
+
+
+def test_nahradni_vstup_replaces_and_restores_input():
+    puvodni = builtins.input
+    with NahradniVstup() as vstup:
+        vstup.pridej("káva")
+        vstup.pridej("čaj")
+        assert input("? ") == "káva"
+        assert input() == "čaj"
+    assert builtins.input is puvodni
+
+
+def test_generated_orders_follow_weights():
+    rng = random.Random(1)
+    k = Kavarna("C", "A")
+    zakaznici = vytvor_zakazniky(5, k.nabidka, rng)
+    assert all(o.oblibeny_napoj in k.nabidka for o in zakaznici)
+    objednavky = list(generuj_objednavky(zakaznici, 200, {"čaj": 1}, rng, podil_neplatnych=0.0))
+    assert len(objednavky) == 200
+    assert {napoj for _, napoj, _ in objednavky} == {"čaj"}
+
+
+def test_percentil_nearest_rank():
+    hodnoty = list(range(1, 101))
+    assert percentil(hodnoty, 50) == 50
+    assert percentil(hodnoty, 99) == 99
+    assert percentil([], 50) == 0
+
+
+def test_simuluj_report(capsys):
+    report = simuluj(pocet_zakazniku=10, pocet_objednavek=300, seed=3)
+    assert capsys.readouterr().out == ""
+    assert report["objednavek"] == 300
+    assert report["prodano"] + report["odmitnuto"] == 300
+    assert report["odmitnuto"] > 0
+    assert report["latence_us"]["p50"] <= report["latence_us"]["p99"] <= report["latence_us"]["max"]
+    assert "narust_pameti_B" in report
+
+
+def test_simuluj_is_repeatable():
+    a = simuluj(pocet_zakazniku=5, pocet_objednavek=100, seed=7, merit_pamet=False)
+    b = simuluj(pocet_zakazniku=5, pocet_objednavek=100, seed=7, merit_pamet=False)
+    assert (a["prodano"], a["odmitnuto"]) == (b["prodano"], b["odmitnuto"])
+
+
+def test_simuluj_stops_tracemalloc_on_error(monkeypatch):
+    def selze(self, osoba, napoj):
+        raise RuntimeError("porucha")
+
+    monkeypatch.setattr(Kavarna, "objednej_napoj", selze)
+    with pytest.raises(RuntimeError):
+        simuluj(pocet_zakazniku=5, pocet_objednavek=50, podil_interaktivnich=0.0)
+    assert not tracemalloc.is_tracing()
+
+
+def test_simuluj_keeps_callers_tracemalloc():
+    tracemalloc.start()
+    try:
+        assert "spicka_pameti_B" in simuluj(pocet_zakazniku=5, pocet_objednavek=50)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
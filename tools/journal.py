@@ -0,0 +1,279 @@
+# journal.py - record interactive sessions of the example CLIs and replay them without a human
+#
+# A recorded session keeps the seed of the random module, every line the script read from
+# stdin and a digest of its output. Sessions are appended to a compact binary journal, so a
+# day's sessions can later be replayed at full speed - to reproduce an incident, or as a
+# throughput benchmark that checks every replay still prints the same output.
+#
+# Usage: python journal.py record JOURNAL SCRIPT [ARGS ...]
+#        python journal.py replay JOURNAL [--warm] [--verbose]
+#        python journal.py show JOURNAL
+#
+# Journal layout: MAGIC, then one record per session: varint payload length and the payload
+#   script path (relative to the journal), argc, argv..., seed, number of reads, reads...,
+#   exit code, 8-byte BLAKE2b digest of stdout
+# Strings are a varint byte length and UTF-8 (surrogatepass), integers are LEB128 varints. The exit
+# code can be negative (sys.exit(-1)), so it is zig-zag encoded; version 1 journals stored it
+# unsigned and are still read, and are converted when a session is appended to them.
+
+import argparse
+import hashlib
+import io
+import os
+import random
+import sys
+import time
+
+from script_runner import ScriptRunner
+
+
+MAGIC = b"SJRN\x02"
+MAGIC_V1 = b"SJRN\x01"  # exit code stored unsigned
+DIGEST_SIZE = 8
+
+
+def output_digest(text):
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=DIGEST_SIZE).digest()
+
+
+def _write_varint(out, value):
+    if value < 0:
+        raise ValueError("Journal integers must not be negative")
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated journal record")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_signed(out, value):
+    # zig-zag: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...
+    _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def _read_signed(data, pos):
+    value, pos = _read_varint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def _write_str(out, text):
+    raw = text.encode("utf-8", "surrogatepass")
+    _write_varint(out, len(raw))
+    out += raw
+
+
+def _read_str(data, pos):
+    size, pos = _read_varint(data, pos)
+    if pos + size > len(data):
+        raise ValueError("Truncated journal record")
+    return data[pos:pos + size].decode("utf-8", "surrogatepass"), pos + size
+
+
+def encode_session(session):
+    payload = bytearray()
+    _write_str(payload, session["script"])
+    _write_varint(payload, len(session["argv"]))
+    for arg in session["argv"]:
+        _write_str(payload, arg)
+    _write_varint(payload, session["seed"])
+    _write_varint(payload, len(session["reads"]))
+    for line in session["reads"]:
+        _write_str(payload, line)
+    _write_signed(payload, session["exit_code"])
+    payload += session["digest"]
+    record = bytearray()
+    _write_varint(record, len(payload))
+    return bytes(record + payload)
+
+
+def decode_session(payload, version=2):
+    script, pos = _read_str(payload, 0)
+    argc, pos = _read_varint(payload, pos)
+    argv = []
+    for _ in range(argc):
+        arg, pos = _read_str(payload, pos)
+        argv.append(arg)
+    seed, pos = _read_varint(payload, pos)
+    count, pos = _read_varint(payload, pos)
+    reads = []
+    for _ in range(count):
+        line, pos = _read_str(payload, pos)
+        reads.append(line)
+    exit_code, pos = (_read_signed if version >= 2 else _read_varint)(payload, pos)
+    digest = bytes(payload[pos:pos + DIGEST_SIZE])
+    if len(digest) != DIGEST_SIZE or pos + DIGEST_SIZE != len(payload):
+        raise ValueError("Malformed journal record")
+    return {"script": script, "argv": argv, "seed": seed, "reads": reads, "exit_code": exit_code, "digest": digest}
+
+
+def append_session(path, session):
+    new = not os.path.exists(path) or os.path.getsize(path) == 0
+    if not new:
+        with open(path, "rb") as journal:
+            old_format = journal.read(len(MAGIC_V1)) == MAGIC_V1
+        if old_format:  # rewrite as version 2 first, so both kinds of records never share one file
+            sessions = list(read_journal(path))
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as journal:
+                journal.write(MAGIC)
+                for old in sessions:
+                    journal.write(encode_session(old))
+            os.replace(tmp, path)
+    with open(path, "ab") as journal:
+        if new:
+            journal.write(MAGIC)
+        journal.write(encode_session(session))
+
+
+def read_journal(path):
+    with open(path, "rb") as journal:
+        data = journal.read()
+    if data.startswith(MAGIC):
+        version = 2
+    elif data.startswith(MAGIC_V1):
+        version = 1
+    else:
+        raise ValueError(f"{path} is not a session journal")
+    pos = len(MAGIC)
+    while pos < len(data):
+        size, pos = _read_varint(data, pos)
+        if pos + size > len(data):
+            raise ValueError("Truncated journal record")
+        yield decode_session(data[pos:pos + size], version)
+        pos += size
+
+
+class RecordingStdin(io.TextIOBase):
+    # Text stream in front of the real stdin that keeps every line handed to the script.
+    # It has no fileno(), so input() writes its prompt to sys.stdout and reads with readline().
+
+    def __init__(self, source):
+        super().__init__()
+        self._source = source
+        self.reads = []
+
+    def readable(self):
+        return True
+
+    def readline(self, size=-1):
+        line = self._source.readline(size)
+        if line:
+            self.reads.append(line)
+        return line
+
+    def read(self, size=-1):
+        text = self._source.read(size)
+        if text:
+            self.reads.append(text)
+        return text
+
+
+def _run_seeded(runner, script, seed, **kwargs):
+    # Seeds the global random module for one run and puts the caller's RNG state back afterwards
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return runner.run(script, **kwargs)
+    finally:
+        random.setstate(state)
+
+
+def record(journal_path, script, argv=(), stdin=None, seed=None, runner=None, echo=True):
+    # Runs the script live (output shown, stdin read as usual) and appends the session to the journal
+    runner = runner or ScriptRunner()
+    if seed is None:
+        seed = int.from_bytes(os.urandom(8), "big")
+    recording = RecordingStdin(sys.stdin if stdin is None else stdin)
+    result = _run_seeded(runner, script, seed, stdin=recording, argv=tuple(argv), echo=echo)
+    journal_dir = os.path.dirname(os.path.abspath(journal_path))
+    append_session(journal_path, {
+        "script": os.path.relpath(os.path.abspath(script), journal_dir),
+        "argv": list(argv),
+        "seed": seed,
+        "reads": recording.reads,
+        "exit_code": result["exit_code"],
+        "digest": output_digest(result["stdout"]),
+    })
+    return result
+
+
+def replay_session(session, journal_dir, runner=None, fresh=True):
+    runner = runner or ScriptRunner()
+    script = os.path.join(journal_dir, session["script"])
+    stdin = "".join(session["reads"]).encode("utf-8", "surrogatepass")
+    result = _run_seeded(runner, script, session["seed"], stdin=stdin, argv=tuple(session["argv"]), fresh=fresh)
+    result["matches"] = (result["exit_code"] == session["exit_code"]
+                         and output_digest(result["stdout"]) == session["digest"])
+    return result
+
+
+def replay(journal_path, fresh=True, runner=None, output=None):
+    # Replays every session; returns throughput and the indexes of sessions whose output differs.
+    # output: optional stream that gets the stdout of every replay, from the same (timed) pass
+    runner = runner or ScriptRunner()
+    journal_dir = os.path.dirname(os.path.abspath(journal_path))
+    sessions = list(read_journal(journal_path))
+    mismatches = []
+    start = time.perf_counter()
+    for index, session in enumerate(sessions):
+        result = replay_session(session, journal_dir, runner, fresh)
+        if output is not None:
+            output.write(result["stdout"])
+        if not result["matches"]:
+            mismatches.append(index)
+    seconds = time.perf_counter() - start
+    return {
+        "sessions": len(sessions),
+        "seconds": seconds,
+        "sessions_per_s": len(sessions) / seconds if seconds else 0.0,
+        "mismatches": mismatches,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record and replay sessions of the example CLIs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="run a script live and append the session")
+    record_parser.add_argument("journal")
+    record_parser.add_argument("script")
+    record_parser.add_argument("args", nargs=argparse.REMAINDER)
+    replay_parser = commands.add_parser("replay", help="replay all sessions and check their output")
+    replay_parser.add_argument("journal")
+    replay_parser.add_argument("--warm", action="store_true", help="keep modules imported between sessions")
+    replay_parser.add_argument("--verbose", action="store_true", help="print the output of every replay")
+    show_parser = commands.add_parser("show", help="list the recorded sessions")
+    show_parser.add_argument("journal")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        return record(args.journal, args.script, args.args)["exit_code"]
+    if args.command == "show":
+        for index, session in enumerate(read_journal(args.journal)):
+            print(f"{index}: {session['script']} {' '.join(session['argv'])} seed={session['seed']} "
+                  f"reads={session['reads']!r} exit={session['exit_code']}")
+        return 0
+    report = replay(args.journal, fresh=not args.warm, output=sys.stdout if args.verbose else None)
+    print(f"{report['sessions']} sessions in {report['seconds']:.3f} s "
+          f"({report['sessions_per_s']:,.0f} sessions/s), {len(report['mismatches'])} mismatches",
+          file=sys.stderr)
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
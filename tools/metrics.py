@@ -0,0 +1,241 @@
+# metrics.py - opt-in counters and latency histograms for the example modules
+#
+# Nothing here runs unless instrument() is called: it wraps the chosen functions in place
+# (and uninstrument() puts the originals back), so uninstrumented code pays nothing.
+#
+#   registry = Registry()
+#   instrument_all(registry, prod_lib=prod_lib, prod04=prod04, kavarna=kavarna)
+#   ...
+#   registry.snapshot() / write_prometheus(registry, "metrics.prom") / flush_statsd(registry, address)
+
+import functools
+import os
+import threading
+import time
+
+
+class Histogram:
+    # HDR-style log-linear histogram over integer values (nanoseconds here).
+    # Values below 2**significant_bits are counted exactly; above that every power of two is split
+    # into 2**(significant_bits - 1) buckets, so the relative error stays below 2**-(significant_bits - 1)
+    # and the number of buckets is bounded (about 1000 for 64-bit values) whatever is recorded.
+
+    def __init__(self, significant_bits=5):
+        self.significant_bits = significant_bits
+        self.half = 1 << (significant_bits - 1)
+        self.counts = {}  # bucket index -> count
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def bucket(self, value):
+        shift = value.bit_length() - self.significant_bits
+        if shift <= 0:
+            return value
+        return shift * self.half + (value >> shift)
+
+    def bucket_range(self, index):
+        # Lowest and highest value that fall into a bucket
+        if index < 2 * self.half:
+            return index, index
+        shift, top = divmod(index - 2 * self.half, self.half)
+        shift += 1
+        top += self.half
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, value):
+        index = self.bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        # Upper bound of the bucket holding the p-th percentile (never more than max)
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_range(index)[1], self.max)
+        return self.max
+
+    def cumulative(self):
+        # (upper bound, cumulative count) per non-empty bucket, for Prometheus "le" buckets
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            yield self.bucket_range(index)[1], seen
+
+
+class Registry:
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._wrapped = []  # (owner, attribute, original) for uninstrument()
+        self._statsd_sent = {}  # counter values at the last statsd flush
+
+    def inc(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, value_ns):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(value_ns)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: {
+                        "count": h.count,
+                        "sum_ns": h.total,
+                        "min_ns": h.min,
+                        "max_ns": h.max,
+                        "p50_ns": h.percentile(50),
+                        "p90_ns": h.percentile(90),
+                        "p99_ns": h.percentile(99),
+                    }
+                    for name, h in self.histograms.items()
+                },
+            }
+
+
+def instrument(registry, owner, attribute, name, label=None):
+    # Wraps owner.attribute so every call counts "<name>_total" and records "<name>_seconds".
+    # label(result) may return a string to count as "<name>_<label>_total" as well.
+    original = getattr(owner, attribute)
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            result = original(*args, **kwargs)
+        finally:
+            registry.observe(name + "_seconds", time.perf_counter_ns() - start)
+            registry.inc(name + "_total")
+        if label is not None:
+            outcome = label(result)
+            if outcome:
+                registry.inc(f"{name}_{outcome}_total")
+        return result
+
+    setattr(owner, attribute, wrapper)
+    registry._wrapped.append((owner, attribute, original))
+    return wrapper
+
+
+def uninstrument(registry):
+    # Puts back every function wrapped for this registry
+    while registry._wrapped:
+        owner, attribute, original = registry._wrapped.pop()
+        setattr(owner, attribute, original)
+
+
+def instrument_all(registry, prod_lib=None, prod04=None, kavarna=None):
+    # Instruments the hot paths of whichever of the example modules are passed in
+    if prod_lib is not None:
+        instrument(registry, prod_lib, "better_name_return", "prod_lib_better_name_return")
+    if prod04 is not None:
+        instrument(registry, prod04, "preved_cislo", "prod04_preved_cislo",
+                   label=lambda number: "invalid" if number is None else None)
+        # over_vstupy converts every input through preved_cislo (looked up at call time, so the
+        # wrapper above), which counts the invalid inputs of batch validation as well
+        instrument(registry, prod04, "over_vstupy", "prod04_over_vstupy")
+    if kavarna is not None:
+        instrument(registry, kavarna.Kavarna, "objednej_napoj", "kavarna_objednej_napoj")
+        instrument(registry, kavarna.Kavarna, "objednej_napoj_od_uzivatele", "kavarna_objednej_napoj_od_uzivatele",
+                   label=lambda ok: None if ok else "rejected")
+
+
+def prometheus_text(registry):
+    # Built under the registry lock, so every counter and histogram line is from the same moment
+    lines = []
+    with registry._lock:
+        for name in sorted(registry.counters):
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {registry.counters[name]}")
+        for name in sorted(registry.histograms):
+            histogram = registry.histograms[name]
+            lines.append(f"# TYPE {name} histogram")
+            for upper_ns, seen in histogram.cumulative():
+                lines.append(f'{name}_bucket{{le="{upper_ns / 1e9:.9g}"}} {seen}')
+            lines.append(f'{name}_bucket{{le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum {histogram.total / 1e9:.9g}")
+            lines.append(f"{name}_count {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(registry, path):
+    # Writes the Prometheus text format atomically (for the node_exporter textfile collector)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as output:
+        output.write(prometheus_text(registry))
+    os.replace(tmp, path)
+
+
+def flush_statsd(registry, address, prefix=""):
+    # Sends counter increments since the last flush and histogram percentiles (in ms) over UDP
+    # The lines are built under the registry lock (so no increment falls between a delta and
+    # the value remembered for the next flush); only the UDP sends happen outside it
+    lines = []
+    with registry._lock:
+        for name, value in sorted(registry.counters.items()):
+            delta = value - registry._statsd_sent.get(name, 0)
+            if delta:
+                lines.append(f"{prefix}{name}:{delta}|c")
+            registry._statsd_sent[name] = value
+        for name, histogram in sorted(registry.histograms.items()):
+            for p in (50, 99):
+                lines.append(f"{prefix}{name}.p{p}:{histogram.percentile(p) / 1e6:.6f}|g")
+    import socket  # only needed when exporting to statsd
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for line in lines:
+            sock.sendto(line.encode("utf-8"), address)
+    return lines
+
+
+class LocalStatsd:
+    # Minimal statsd stand-in: a UDP listener on localhost that keeps the received lines
+
+    def __init__(self):
+        import socket
+        self._timeout = socket.timeout
+        self.lines = []
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.settimeout(0.1)
+        self.address = self._sock.getsockname()
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while self._running:
+            try:
+                data = self._sock.recv(65535)
+            except self._timeout:
+                continue
+            self.lines.extend(data.decode("utf-8").splitlines())
+
+    def wait_for(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while len(self.lines) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.lines
+
+    def close(self):
+        self._running = False
+        self._thread.join()
+        self._sock.close()
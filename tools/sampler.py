@@ -0,0 +1,153 @@
+# sampler.py - low-overhead sampling profiler for long runs of the example CLIs
+#
+# A background thread looks at the stacks of the other threads every few milliseconds and
+# counts identical stacks. The result is written as collapsed stacks (flamegraph.pl, speedscope)
+# or as a speedscope JSON file when the run ends, or at any time on SIGUSR1.
+#
+# Usage: python sampler.py [-o OUTPUT] [--format collapsed|speedscope] [--interval S] SCRIPT [ARGS ...]
+
+import argparse
+import json
+import os
+import runpy
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class Sampler:
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()  # tuple of code objects (root first) -> samples
+        self.samples = 0
+        self._labels = {}  # code object -> "function (file:line)"
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(skip_thread=own)
+
+    def sample(self, skip_thread=None):
+        # Takes one sample of every thread except skip_thread
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, frame in frames.items():
+                if thread_id == skip_thread:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stack.reverse()
+                self.stacks[tuple(stack)] += 1
+            self.samples += 1
+
+    def label(self, code):
+        text = self._labels.get(code)
+        if text is None:
+            text = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = text
+        return text
+
+    def collapsed(self):
+        # Lines "root;child;leaf count", heaviest stacks first
+        with self._lock:
+            items = self.stacks.most_common()
+        return [";".join(self.label(code).replace(";", ":") for code in stack) + f" {count}" for stack, count in items]
+
+    def speedscope(self, name="profile"):
+        with self._lock:
+            items = self.stacks.most_common()
+        frame_index = {}
+        frames = []
+        samples = []
+        weights = []
+        for stack, count in items:
+            indexes = []
+            for code in stack:
+                if code not in frame_index:
+                    frame_index[code] = len(frames)
+                    frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+                indexes.append(frame_index[code])
+            samples.append(indexes)
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def write(self, path, fmt="collapsed"):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as output:
+            if fmt == "speedscope":
+                json.dump(self.speedscope(os.path.basename(path)), output)
+            else:
+                output.write("\n".join(self.collapsed()) + "\n")
+        os.replace(tmp, path)
+
+
+def install_dump_signal(sampler, path, fmt="collapsed", signum=getattr(signal, "SIGUSR1", None)):
+    # Writes the profile collected so far whenever the process receives SIGUSR1
+    if signum is None:
+        return None
+    return signal.signal(signum, lambda *_: sampler.write(path, fmt))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a script under the sampling profiler")
+    parser.add_argument("-o", "--output", default="profile.collapsed", help="output file")
+    parser.add_argument("--format", choices=("collapsed", "speedscope"), default="collapsed")
+    parser.add_argument("--interval", type=float, default=0.005, help="seconds between samples")
+    parser.add_argument("script")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    sampler = Sampler(args.interval)
+    install_dump_signal(sampler, args.output, args.format)
+    sys.argv = [args.script, *args.args]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        runpy.run_path(args.script, run_name="__main__")
+    finally:
+        sampler.stop()
+        sampler.write(args.output, args.format)
+        print(f"sampler: {sampler.samples} samples in {time.perf_counter() - start:.2f} s -> {args.output}",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# script_runner.py - run the example CLIs end-to-end inside the current interpreter
+#
+# A script is compiled once and then executed as __main__ with injected stdin bytes and
+# captured stdout/stderr, so many end-to-end scenarios run without interpreter startup.
+#
+# Usage: python script_runner.py SCRIPT [--stdin TEXT] [--repeat N]
+
+import argparse
+import builtins
+import io
+import os
+import sys
+import time
+import traceback
+
+
+class _Echo(io.StringIO):
+    # Captures output and passes it through to the real stream at the same time
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def write(self, text):
+        self._stream.write(text)
+        self._stream.flush()
+        return super().write(text)
+
+
+class ScriptRunner:
+    def __init__(self):
+        self._code = {}  # compiled scripts, keyed by (path, mtime_ns)
+
+    def compile(self, path):
+        path = os.path.abspath(path)
+        key = (path, os.stat(path).st_mtime_ns)
+        code = self._code.get(key)
+        if code is None:
+            with open(path, "rb") as source:
+                code = compile(source.read(), path, "exec")
+            self._code[key] = code
+        return path, code
+
+    def run(self, path, stdin=b"", argv=(), fresh=True, echo=False):
+        # Runs the script as __main__ and returns a result dict.
+        # stdin is bytes/str, or a text stream that is read as the script asks for input.
+        # fresh=True forgets the modules the script imported, so the next run starts from
+        # clean module state; fresh=False keeps them imported (warm) for later runs.
+        # echo=True also passes the captured output through to the real stdout/stderr.
+        if isinstance(stdin, str):
+            stdin = stdin.encode("utf-8")
+        path, code = self.compile(path)
+        saved = (sys.argv, sys.stdin, sys.stdout, sys.stderr, list(sys.path))
+        modules_before = set(sys.modules)
+        if echo:
+            stdout, stderr = _Echo(sys.stdout), _Echo(sys.stderr)
+        else:
+            stdout, stderr = io.StringIO(), io.StringIO()
+        sys.argv = [path, *argv]
+        if isinstance(stdin, (bytes, bytearray)):
+            stdin = io.TextIOWrapper(io.BytesIO(stdin), encoding="utf-8")
+        sys.stdin = stdin
+        sys.stdout, sys.stderr = stdout, stderr
+        sys.path.insert(0, os.path.dirname(path))  # as "python script.py" does
+        exit_code = 0
+        start = time.perf_counter()
+        try:
+            exec(code, {"__name__": "__main__", "__file__": path, "__builtins__": builtins})
+        except SystemExit as exit_:
+            if exit_.code is None or isinstance(exit_.code, int):
+                exit_code = exit_.code or 0
+            else:
+                print(exit_.code, file=stderr)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc(file=stderr)
+            exit_code = 1
+        finally:
+            seconds = time.perf_counter() - start
+            sys.argv, sys.stdin, sys.stdout, sys.stderr, sys.path[:] = saved
+            if fresh:
+                for name in set(sys.modules) - modules_before:
+                    del sys.modules[name]
+        return {
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+            "seconds": seconds,
+        }
+
+
+_default_runner = ScriptRunner()
+
+
+def run_script(path, stdin=b"", argv=(), fresh=True):
+    return _default_runner.run(path, stdin, argv, fresh)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a script in-process with the given stdin")
+    parser.add_argument("script")
+    parser.add_argument("--stdin", default="", help="text fed to the script's stdin")
+    parser.add_argument("--repeat", type=int, default=1, help="run the script N times and report timing")
+    parser.add_argument("--warm", action="store_true", help="keep modules imported by the script between runs")
+    args = parser.parse_args(argv)
+
+    results = [run_script(args.script, args.stdin.encode("utf-8"), fresh=not args.warm) for _ in range(args.repeat)]
+    sys.stdout.write(results[-1]["stdout"])
+    sys.stderr.write(results[-1]["stderr"])
+    if args.repeat > 1:
+        total = sum(result["seconds"] for result in results)
+        print(f"{args.repeat} runs, {total / args.repeat * 1e3:.3f} ms per run", file=sys.stderr)
+    return results[-1]["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
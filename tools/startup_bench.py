@@ -0,0 +1,100 @@
+# startup_bench.py - cold start vs. warm-server latency of the example entry points
+#
+# Cold start runs each script in a new "python -X importtime" process and reports the wall
+# time and the slowest imports. Warm latency submits the same job to warm_server.py.
+#
+# Usage: python startup_bench.py [--runs N]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from warm_server import shutdown, submit
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (script, stdin) of the entry points that jobs spawn
+ENTRY_POINTS = [
+    (os.path.join(ROOT, "example_01", "prod01.py"), ""),
+    (os.path.join(ROOT, "example_05", "kavarna.py"), "káva\n"),
+]
+
+
+def parse_importtime(stderr):
+    # {module: cumulative microseconds} from "-X importtime" output
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, own, cumulative, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        imports[name] = int(cumulative)
+    return imports
+
+
+def cold_start(script, stdin, runs=5):
+    times = []
+    imports = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-X", "importtime", script], input=stdin.encode("utf-8"),
+                                   capture_output=True, cwd=os.path.dirname(script))
+        times.append(time.perf_counter() - start)
+        imports = parse_importtime(completed.stderr.decode("utf-8", "replace"))
+    return {"median_ms": statistics.median(times) * 1e3, "imports": imports}
+
+
+def warm_latency(socket_path, script, stdin, runs=5):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        submit(socket_path, script, stdin)
+        times.append(time.perf_counter() - start)
+    return {"median_ms": statistics.median(times) * 1e3}
+
+
+def wait_for_server(server, socket_path, timeout=10.0):
+    # Waits until the server process listens on socket_path; fails if it exits or takes too long
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(socket_path):
+        if server.poll() is not None:
+            raise RuntimeError(f"warm server exited with code {server.returncode} before listening")
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"warm server did not listen on {socket_path} within {timeout} s")
+        time.sleep(0.01)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report cold start and warm per-job latency")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list per script")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "warm.sock")
+        server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(__file__), "warm_server.py"),
+                                   "serve", socket_path])
+        try:
+            wait_for_server(server, socket_path)
+            for script, stdin in ENTRY_POINTS:
+                cold = cold_start(script, stdin, args.runs)
+                warm = warm_latency(socket_path, script, stdin, args.runs)
+                print(f"{os.path.relpath(script, ROOT)}: cold {cold['median_ms']:.1f} ms, warm {warm['median_ms']:.2f} ms")
+                slowest = sorted(cold["imports"].items(), key=lambda item: item[1], reverse=True)[:args.top]
+                for name, micros in slowest:
+                    print(f"    {micros / 1e3:7.2f} ms  {name}")
+        finally:
+            if server.poll() is None:
+                try:
+                    shutdown(socket_path)
+                except OSError:  # the server never started listening
+                    server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
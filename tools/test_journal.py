@@ -0,0 +1,150 @@
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+import journal
+from script_runner import ScriptRunner
+
+
+ROOT = Path(__file__).resolve().parent.parent
+PROD04 = ROOT / "example_04" / "prod04.py"
+KAVARNA = ROOT / "example_05" / "kavarna.py"
+
+
+def test_record_and_replay_prod04(tmp_path):
+    path = tmp_path / "sessions.jrn"
+    outputs = []
+    for seed, line in enumerate(["42\n", "kkk\n", "7\n"]):
+        result = journal.record(path, PROD04, stdin=io.StringIO(line + "unused\n"), seed=seed, echo=False)
+        outputs.append(result["stdout"])
+    sessions = list(journal.read_journal(path))
+    assert [session["reads"] for session in sessions] == [["42\n"], ["kkk\n"], ["7\n"]]
+    assert [session["seed"] for session in sessions] == [0, 1, 2]
+    assert (tmp_path / sessions[0]["script"]).resolve() == PROD04  # stored relative to the journal
+
+    runner = ScriptRunner()
+    for session, expected in zip(sessions, outputs):
+        result = journal.replay_session(session, tmp_path, runner)
+        assert result["matches"]
+        assert result["stdout"] == expected
+
+    report = journal.replay(path)
+    assert report["sessions"] == 3 and report["mismatches"] == []
+    assert path.stat().st_size < 100 * 3  # seed, one line and a digest per session
+
+
+def test_replay_reproduces_the_coin_flip():
+    # the coin side printed by prod04 depends only on the recorded seed
+    runner = ScriptRunner()
+    sides = set()
+    for seed in range(20):
+        result = journal._run_seeded(runner, PROD04, seed, stdin=b"1\n")
+        again = journal._run_seeded(runner, PROD04, seed, stdin=b"1\n")
+        assert again["stdout"] == result["stdout"]
+        sides.add(result["stdout"].splitlines()[0])
+    assert sides == {"hlava", "orel"}
+
+
+def test_callers_random_state_is_kept(tmp_path):
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    journal.record(tmp_path / "s.jrn", PROD04, stdin=io.StringIO("5\n"), seed=9, echo=False)
+    assert random.random() == expected
+
+
+def test_kavarna_session_and_mismatch(tmp_path):
+    path = tmp_path / "kavarna.jrn"
+    result = journal.record(path, KAVARNA, stdin=io.StringIO("  ČAJ \n"), echo=False)
+    assert "Eva si objednal(a) čaj za 25 Kč." in result["stdout"]
+    session, = journal.read_journal(path)
+    assert session["reads"] == ["  ČAJ \n"]
+    assert journal.replay_session(session, tmp_path)["matches"]
+
+    session["digest"] = bytes(journal.DIGEST_SIZE)
+    journal.append_session(path, session)
+    assert journal.replay(path)["mismatches"] == [1]
+
+
+def test_session_encoding_round_trip():
+    session = {"script": "x/ž.py", "argv": ["-n", "\udcff"], "seed": 2 ** 64 - 1,
+               "reads": ["a\n", ""], "exit_code": 1, "digest": b"12345678"}
+    payload = journal.encode_session(session)
+    size, pos = journal._read_varint(payload, 0)
+    assert pos + size == len(payload)
+    assert journal.decode_session(payload[pos:]) == session
+    with pytest.raises(ValueError):
+        journal.decode_session(payload[pos:-1])
+
+
+def test_not_a_journal(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        list(journal.read_journal(path))
+
+
+def test_cli_record_show_replay(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "cli.jrn"
+    monkeypatch.setattr("sys.stdin", io.StringIO("3\n"))
+    assert journal.main(["record", str(path), str(PROD04)]) == 0
+    assert "Zadane cislo je 3" in capsys.readouterr().out
+    assert journal.main(["show", str(path)]) == 0
+    assert "reads=['3\\n']" in capsys.readouterr().out
+    assert journal.main(["replay", str(path), "--warm"]) == 0
+    assert "1 sessions" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("exit_code", [0, 1, -1, 255, -(2 ** 31)])
+def test_exit_code_round_trip(exit_code):
+    session = {"script": "a.py", "argv": [], "seed": 0, "reads": [], "exit_code": exit_code, "digest": b"12345678"}
+    payload = journal.encode_session(session)
+    _, pos = journal._read_varint(payload, 0)
+    assert journal.decode_session(payload[pos:]) == session
+
+
+def test_negative_exit_code_is_recorded(tmp_path):
+    script = tmp_path / "fail.py"
+    script.write_text("import sys\nprint('bye')\nsys.exit(-1)\n", encoding="utf-8")
+    path = tmp_path / "fail.jrn"
+    assert journal.record(path, script, stdin=io.StringIO(""), echo=False)["exit_code"] == -1
+    session, = journal.read_journal(path)
+    assert session["exit_code"] == -1
+    assert journal.replay(path)["mismatches"] == []
+
+
+def test_version_1_journal_is_read_and_converted(tmp_path):
+    session = {"script": "a.py", "argv": ["x"], "seed": 5, "reads": ["1\n"], "exit_code": 3, "digest": b"12345678"}
+    payload = bytearray()
+    journal._write_str(payload, "a.py")
+    journal._write_varint(payload, 1)
+    journal._write_str(payload, "x")
+    journal._write_varint(payload, 5)
+    journal._write_varint(payload, 1)
+    journal._write_str(payload, "1\n")
+    journal._write_varint(payload, 3)  # unsigned in version 1
+    payload += b"12345678"
+    record = bytearray()
+    journal._write_varint(record, len(payload))
+    path = tmp_path / "old.jrn"
+    path.write_bytes(journal.MAGIC_V1 + bytes(record + payload))
+    assert list(journal.read_journal(path)) == [session]
+
+    journal.append_session(path, dict(session, exit_code=-1))
+    assert path.read_bytes().startswith(journal.MAGIC)
+    assert [s["exit_code"] for s in journal.read_journal(path)] == [3, -1]
+
+
+def test_verbose_replay_runs_each_session_once(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "cli.jrn"
+    journal.record(path, PROD04, stdin=io.StringIO("3\n"), echo=False)
+    calls = []
+    replay_session = journal.replay_session
+    monkeypatch.setattr(journal, "replay_session", lambda *args: calls.append(1) or replay_session(*args))
+    assert journal.main(["replay", str(path), "--verbose"]) == 0
+    captured = capsys.readouterr()
+    assert "Zadane cislo je 3" in captured.out
+    assert "1 sessions" in captured.err
+    assert len(calls) == 1
@@ -0,0 +1,143 @@
+import builtins
+import importlib
+import random
+import threading
+from pathlib import Path
+
+import pytest
+
+from metrics import (Histogram, LocalStatsd, Registry, flush_statsd, instrument_all, prometheus_text,
+                     uninstrument, write_prometheus)
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def example_modules(monkeypatch):
+    for directory in ("example_01", "example_04", "example_05"):
+        monkeypatch.syspath_prepend(str(ROOT / directory))
+    return tuple(importlib.import_module(name) for name in ("prod_lib", "prod04", "kavarna"))
+
+
+@pytest.fixture
+def registry(example_modules):
+    registry = Registry()
+    prod_lib, prod04, kavarna = example_modules
+    instrument_all(registry, prod_lib=prod_lib, prod04=prod04, kavarna=kavarna)
+    yield registry
+    uninstrument(registry)
+
+
+def test_histogram_buckets_are_bounded_and_accurate():
+    histogram = Histogram(significant_bits=5)
+    rng = random.Random(1)
+    values = [rng.randrange(1, 10 ** 12) for _ in range(20_000)]
+    for value in values:
+        histogram.record(value)
+    assert len(histogram.counts) < 1000
+    values.sort()
+    for p in (50, 90, 99):
+        exact = values[-(-len(values) * p // 100) - 1]
+        assert abs(histogram.percentile(p) - exact) <= exact / 16
+    assert histogram.percentile(100) == values[-1]
+
+
+def test_histogram_bucket_ranges_cover_values():
+    histogram = Histogram(significant_bits=3)
+    for value in range(0, 5000):
+        low, high = histogram.bucket_range(histogram.bucket(value))
+        assert low <= value <= high
+
+
+def test_instrumented_calls_are_counted(registry, example_modules, capsys, monkeypatch):
+    prod_lib, prod04, kavarna = example_modules
+    for _ in range(3):
+        prod_lib.better_name_return("john", "doe")
+    assert prod04.zprava_pro_vstup("kkk") == "Chybne zadany vstup"
+    prod04.zprava_pro_vstup("5")
+    k = kavarna.Kavarna("C", "A")
+    o = kavarna.Osoba("Jan", "káva", True)
+    k.objednej_napoj(o, "káva")
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "pivo")
+    assert k.objednej_napoj_od_uzivatele(o) is False
+    capsys.readouterr()
+
+    snapshot = registry.snapshot()
+    counters = snapshot["counters"]
+    assert counters["prod_lib_better_name_return_total"] == 3
+    assert counters["prod04_preved_cislo_total"] == 2
+    assert counters["prod04_preved_cislo_invalid_total"] == 1
+    assert counters["kavarna_objednej_napoj_total"] == 1
+    assert counters["kavarna_objednej_napoj_od_uzivatele_rejected_total"] == 1
+    assert snapshot["histograms"]["prod_lib_better_name_return_seconds"]["count"] == 3
+
+
+def test_batch_validation_counts_invalid_inputs(registry, example_modules):
+    prod04 = example_modules[1]
+    assert prod04.over_vstupy(["1", "kkk", 2, 3.5, "x"]) == [1, None, 2, None, None]
+    counters = registry.snapshot()["counters"]
+    assert counters["prod04_over_vstupy_total"] == 1
+    assert counters["prod04_preved_cislo_total"] == 5
+    assert counters["prod04_preved_cislo_invalid_total"] == 3
+
+
+def test_uninstrument_restores_originals(example_modules):
+    prod_lib = example_modules[0]
+    original = prod_lib.better_name_return
+    registry = Registry()
+    instrument_all(registry, prod_lib=prod_lib)
+    assert prod_lib.better_name_return is not original
+    uninstrument(registry)
+    assert prod_lib.better_name_return is original
+
+
+def test_prometheus_export(registry, example_modules, tmp_path):
+    example_modules[0].better_name_return("a", "b")
+    text = prometheus_text(registry)
+    assert "# TYPE prod_lib_better_name_return_total counter" in text
+    assert "prod_lib_better_name_return_total 1" in text
+    assert 'prod_lib_better_name_return_seconds_bucket{le="+Inf"} 1' in text
+    path = tmp_path / "metrics.prom"
+    write_prometheus(registry, path)
+    assert path.read_text(encoding="utf-8") == text
+
+
+def test_statsd_export_sends_deltas(registry, example_modules):
+    statsd = LocalStatsd()
+    try:
+        example_modules[0].better_name_return("a", "b")
+        sent = flush_statsd(registry, statsd.address, prefix="app.")
+        assert "app.prod_lib_better_name_return_total:1|c" in sent
+        assert statsd.wait_for(len(sent)) == sent
+        assert not [line for line in flush_statsd(registry, statsd.address) if line.endswith("|c")]
+    finally:
+        statsd.close()
+
+
+def test_exports_while_other_threads_record():
+    registry = Registry()
+    statsd = LocalStatsd()
+    done = threading.Event()
+
+    def work():
+        for value in range(20_000):
+            registry.inc("calls_total")
+            registry.observe("call_seconds", value)
+        done.set()
+
+    worker = threading.Thread(target=work)
+    sent = 0
+    try:
+        worker.start()
+        while not done.is_set():
+            prometheus_text(registry)
+            sent += sum(int(line.split(":")[1][:-2]) for line in flush_statsd(registry, statsd.address)
+                        if line.endswith("|c"))
+        worker.join()
+        sent += sum(int(line.split(":")[1][:-2]) for line in flush_statsd(registry, statsd.address)
+                    if line.endswith("|c"))
+    finally:
+        statsd.close()
+    assert sent == registry.counters["calls_total"] == 20_000
+    assert 'call_seconds_bucket{le="+Inf"} 20000' in prometheus_text(registry)
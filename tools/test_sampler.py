@@ -0,0 +1,77 @@
+import json
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from sampler import Sampler, install_dump_signal, main
+
+
+def busy_loop_for_sampler(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_sampler_sees_busy_function():
+    with Sampler(interval=0.001) as sampler:
+        busy_loop_for_sampler(0.2)
+    assert sampler.samples > 10
+    top = sampler.collapsed()[0]
+    assert "busy_loop_for_sampler (test_sampler.py:" in top
+
+
+def test_speedscope_output(tmp_path):
+    sampler = Sampler(interval=0.01)
+    sampler.sample()
+    sampler.sample()
+    path = tmp_path / "profile.json"
+    sampler.write(path, "speedscope")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    profile = data["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+    assert sum(profile["weights"]) == pytest.approx(0.02)
+    names = {frame["name"] for frame in data["shared"]["frames"]}
+    assert "test_speedscope_output" in names
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_sigusr1_dumps_profile(tmp_path):
+    sampler = Sampler()
+    sampler.sample()
+    path = tmp_path / "dump.collapsed"
+    previous = install_dump_signal(sampler, path)
+    try:
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert path.exists()
+        assert "test_sigusr1_dumps_profile" in path.read_text(encoding="utf-8")
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+
+def test_cli_profiles_script(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(sys, "argv", list(sys.argv))
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    script = tmp_path / "work.py"
+    script.write_text(
+        "import sys, time\n"
+        "def work():\n"
+        "    end = time.perf_counter() + 0.1\n"
+        "    while time.perf_counter() < end:\n"
+        "        pass\n"
+        "if __name__ == '__main__':\n"
+        "    work()\n"
+        "    print(sys.argv[1:])\n"
+    )
+    output = tmp_path / "out.collapsed"
+    previous = signal.getsignal(signal.SIGUSR1) if hasattr(signal, "SIGUSR1") else None
+    try:
+        main(["-o", str(output), "--interval", "0.001", str(script), "x"])
+    finally:
+        if previous is not None:
+            signal.signal(signal.SIGUSR1, previous)
+    assert capsys.readouterr().out == "['x']\n"
+    assert "work (work.py:2)" in output.read_text(encoding="utf-8")
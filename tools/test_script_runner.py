@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+from script_runner import ScriptRunner, run_script
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_prod01_output():
+    result = run_script(ROOT / "example_01" / "prod01.py")
+    assert result["exit_code"] == 0
+    assert result["stdout"] == "Miky Novak\nReturned name: Jana Svobodova\n"
+    assert result["stderr"] == ""
+
+
+def test_prod04_reads_injected_stdin():
+    result = run_script(ROOT / "example_04" / "prod04.py", stdin=b"42\n")
+    coin, prompt, message = result["stdout"].splitlines()
+    assert coin in ("hlava", "orel")
+    assert prompt == "Zadej zkoumane cislo"
+    assert message == "Zadane cislo je 42"
+
+    result = run_script(ROOT / "example_04" / "prod04.py", stdin="kkk\n")
+    assert result["stdout"].endswith("Chybne zadany vstup\n")
+
+
+def test_kavarna_interactive_order():
+    result = run_script(ROOT / "example_05" / "kavarna.py", stdin="  ČAJ \n".encode("utf-8"))
+    assert result["exit_code"] == 0
+    assert "Eva si objednal(a) čaj za 25 Kč." in result["stdout"]
+
+
+def test_missing_stdin_is_reported_as_error():
+    result = run_script(ROOT / "example_04" / "prod04.py", stdin=b"")
+    assert result["exit_code"] == 1
+    assert "EOFError" in result["stderr"]
+
+
+def test_state_is_restored_and_fresh_modules_dropped(tmp_path):
+    (tmp_path / "helper_mod_for_runner.py").write_text("VALUE = 1\n")
+    script = tmp_path / "script.py"
+    script.write_text("import sys, helper_mod_for_runner\nprint(sys.argv[1:])\nsys.exit(3)\n")
+    stdout, path = sys.stdout, list(sys.path)
+
+    runner = ScriptRunner()
+    result = runner.run(script, argv=["a"])
+    assert result["stdout"] == "['a']\n"
+    assert result["exit_code"] == 3
+    assert sys.stdout is stdout and sys.path == path
+    assert "helper_mod_for_runner" not in sys.modules
+
+    runner.run(script, fresh=False)
+    assert "helper_mod_for_runner" in sys.modules
+    del sys.modules["helper_mod_for_runner"]
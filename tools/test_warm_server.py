@@ -0,0 +1,93 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from startup_bench import parse_importtime, wait_for_server
+from warm_server import WarmServer, _request, shutdown, submit
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_server_runs_jobs_and_shuts_down(tmp_path):
+    socket_path = str(tmp_path / "warm.sock")
+    server = WarmServer(socket_path)
+    thread = threading.Thread(target=server.serve_until_shutdown)
+    thread.start()
+    try:
+        for _ in range(3):
+            result = submit(socket_path, ROOT / "example_01" / "prod01.py")
+            assert result["exit_code"] == 0
+            assert result["stdout"] == "Miky Novak\nReturned name: Jana Svobodova\n"
+        result = submit(socket_path, ROOT / "example_04" / "prod04.py", stdin="x\n")
+        assert result["stdout"].endswith("Chybne zadany vstup\n")
+    finally:
+        assert shutdown(socket_path) == {"ok": True}
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not Path(socket_path).exists()
+
+
+def test_bad_jobs_get_an_error_reply(tmp_path):
+    socket_path = str(tmp_path / "warm.sock")
+    server = WarmServer(socket_path)
+    thread = threading.Thread(target=server.serve_until_shutdown)
+    thread.start()
+    broken = tmp_path / "broken.py"
+    broken.write_text("def (:\n", encoding="utf-8")
+    try:
+        missing = submit(socket_path, "/nonexistent.py")
+        assert missing["exit_code"] == 1 and "FileNotFoundError" in missing["error"]
+        syntax = submit(socket_path, broken)
+        assert syntax["exit_code"] == 1 and "SyntaxError" in syntax["error"]
+        no_script = _request(socket_path, {"stdin": ""})
+        assert no_script["exit_code"] == 1 and "script" in no_script["error"]
+        # the server keeps serving after bad jobs
+        assert submit(socket_path, ROOT / "example_01" / "prod01.py")["exit_code"] == 0
+    finally:
+        shutdown(socket_path)
+        thread.join(timeout=5)
+
+
+def test_malformed_json_gets_an_error_reply(tmp_path):
+    import socket
+
+    socket_path = str(tmp_path / "warm.sock")
+    server = WarmServer(socket_path)
+    thread = threading.Thread(target=server.serve_until_shutdown)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(b"not json\n")
+            with sock.makefile("rb") as reply:
+                assert b'"exit_code": 1' in reply.readline()
+    finally:
+        shutdown(socket_path)
+        thread.join(timeout=5)
+
+
+def test_wait_for_server_fails_when_server_exits(tmp_path):
+    server = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        wait_for_server(server, str(tmp_path / "never.sock"))
+    sleeper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        with pytest.raises(RuntimeError, match="did not listen"):
+            wait_for_server(sleeper, str(tmp_path / "never.sock"), timeout=0.1)
+    finally:
+        sleeper.kill()
+        sleeper.wait()
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:      2841 |       5835 | analytika\n"
+        "Some other line\n"
+    )
+    assert parse_importtime(stderr) == {"_io": 120, "analytika": 5835}
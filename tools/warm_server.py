@@ -0,0 +1,103 @@
+# warm_server.py - keep one warm interpreter and run the example scripts in it on request
+#
+# The server listens on a Unix socket. Each connection sends one JSON line
+# {"script": path, "stdin": text, "argv": [...]} and gets one JSON line back with the
+# script_runner result (stdout, stderr, exit_code, seconds). Jobs run one at a time,
+# because a script run swaps sys.stdin/stdout for the whole process.
+#
+# Usage: python warm_server.py serve SOCKET
+#        python warm_server.py run SOCKET SCRIPT [--stdin TEXT]
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+
+from script_runner import ScriptRunner
+
+
+def error_result(message):
+    # Reply for a job that could not be run at all (bad request, missing script, syntax error, ...)
+    return {"error": message, "stdout": "", "stderr": message + "\n", "exit_code": 1, "seconds": 0.0}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("command") == "shutdown":
+                self.wfile.write(b'{"ok": true}\n')
+                self.server.shutdown_requested = True
+                return
+            result = self.server.runner.run(request["script"], request.get("stdin", ""),
+                                            request.get("argv", ()), fresh=request.get("fresh", False))
+        except KeyError as error:
+            result = error_result(f"bad request: missing {error}")
+        except Exception as error:
+            result = error_result(f"{type(error).__name__}: {error}")
+        self.wfile.write(json.dumps(result).encode("utf-8") + b"\n")
+
+
+class WarmServer(socketserver.UnixStreamServer):
+    def __init__(self, path):
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, _Handler)
+        self.runner = ScriptRunner()
+        self.shutdown_requested = False
+
+    def serve_until_shutdown(self):
+        try:
+            while not self.shutdown_requested:
+                self.handle_request()
+        finally:
+            self.server_close()
+            os.unlink(self.server_address)
+
+
+def _request(path, payload):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def submit(path, script, stdin="", argv=(), fresh=False):
+    # Runs a script in the server listening on path and returns its result dict
+    return _request(path, {"script": os.path.abspath(script), "stdin": stdin, "argv": list(argv), "fresh": fresh})
+
+
+def shutdown(path):
+    return _request(path, {"command": "shutdown"})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm interpreter server for the example scripts")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve")
+    serve.add_argument("socket")
+    run = commands.add_parser("run")
+    run.add_argument("socket")
+    run.add_argument("script")
+    run.add_argument("--stdin", default="")
+    stop = commands.add_parser("stop")
+    stop.add_argument("socket")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        WarmServer(args.socket).serve_until_shutdown()
+        return 0
+    if args.command == "stop":
+        shutdown(args.socket)
+        return 0
+    result = submit(args.socket, args.script, args.stdin)
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return result["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())